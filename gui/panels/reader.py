@@ -7,7 +7,7 @@ import sys
 import tempfile
 from pathlib import Path
 
-from PySide6.QtCore import QEvent, Qt, Signal
+from PySide6.QtCore import QEvent, Qt, QThreadPool, QTimer, Signal
 from PySide6.QtGui import QIcon, QKeySequence, QShortcut
 from PySide6.QtPdf import QPdfDocument
 from PySide6.QtWidgets import (
@@ -21,6 +21,7 @@ from PySide6.QtWidgets import (
     QPushButton,
     QScrollBar,
     QSplitter,
+    QStackedWidget,
     QTreeWidget,
     QTreeWidgetItem,
     QVBoxLayout,
@@ -36,12 +37,21 @@ from gui.services import (
     BookmarkNode,
     PdfPreviewProvider,
     Runner,
+    SearchWorker,
     SettingsStore,
+    TextIndexService,
     build_cli_command,
     parse_dump,
 )
 from gui.widgets.page_strip import PageStrip
+from gui.widgets.tiled_page_view import TiledPageView
 from pdfsuite.core.document_session import DocumentSession
+from pdfsuite.core.page_order import PageOrder
+from pdfsuite.core.text_index import SearchHit, TextIndex
+
+SEARCH_DEBOUNCE_MS = 250
+# Custom zoom at or above which the page is shown in tiles instead of by QPdfView.
+TILED_ZOOM_THRESHOLD = 2.0
 
 
 class ReaderPanel(QWidget):
@@ -57,15 +67,29 @@ class ReaderPanel(QWidget):
         self.current_pdf: Path | None = None
         self.session: DocumentSession | None = None
         self._outline_tmp: Path | None = None
+        self.text_index: TextIndex | None = None
+        self.text_indexer = TextIndexService(self)
+        self.text_indexer.index_ready.connect(self._on_text_index_ready)
+        self.text_indexer.index_failed.connect(self._on_text_index_failed)
         self._search_hits: list[int] = []
+        self._search_counts: dict[int, int] = {}
         self._search_index = -1
         self._last_search = ""
+        self._search_generation = 0
+        self._search_worker: SearchWorker | None = None
+        self._search_running = False
+        self._jump_pending: int | None = None
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self._search_timer.timeout.connect(self._start_search)
         self._thumbs_visible = True
         self._outline_visible = True
         self.zoom_factor = 1.0
         self.zoom_step = max(1, settings.data.reader_zoom_step or 10)
         self.pan_speed = max(16, settings.data.reader_pan_speed or 64)
         self.thumbnail_size = settings.data.reader_thumbnail_size or 96
+        self.thumbnail_cache_bytes = max(8, settings.data.reader_thumbnail_cache_mb or 64) << 20
 
         layout = QVBoxLayout(self)
         if QPdfView is None or self.document is None:
@@ -129,6 +153,8 @@ class ReaderPanel(QWidget):
         row.addWidget(QLabel("Find:"))
         self.search_field = QLineEdit()
         self.search_field.setPlaceholderText("Search text…")
+        self.search_field.textChanged.connect(self._on_search_text_changed)
+        self.search_field.returnPressed.connect(lambda: self._search(1))
         row.addWidget(self.search_field)
         self.search_prev = QPushButton("Prev")
         self.search_prev.clicked.connect(lambda: self._search(-1))
@@ -152,7 +178,11 @@ class ReaderPanel(QWidget):
         self.thumbnail_container = QWidget()
         thumb_layout = QVBoxLayout(self.thumbnail_container)
         thumb_layout.setContentsMargins(0, 0, 0, 0)
-        self.page_strip = PageStrip(self.preview, self.thumbnail_size)
+        self.page_strip = PageStrip(
+            self.preview,
+            self.thumbnail_size,
+            cache_bytes=self.thumbnail_cache_bytes,
+        )
         self.page_strip.selectionChangedSignal.connect(self._on_strip_selection)
         self.page_strip.reordered.connect(self._on_pages_reordered)
         self.page_strip.deleteRequested.connect(self._on_delete_pages)
@@ -165,7 +195,15 @@ class ReaderPanel(QWidget):
         self.pdf_view.setDocument(self.document)
         self._pdf_viewport = self.pdf_view.viewport()
         self._pdf_viewport.installEventFilter(self)
-        self.splitter.addWidget(self.pdf_view)
+        # High zoom switches to a single-page view that renders only visible tiles.
+        self.tiled_view = TiledPageView(self.preview)
+        self.tiled_view.pageChanged.connect(lambda page: self._update_status(current_page=page + 1))
+        self._tiled_viewport = self.tiled_view.viewport()
+        self._tiled_viewport.installEventFilter(self)
+        self.view_stack = QStackedWidget()
+        self.view_stack.addWidget(self.pdf_view)
+        self.view_stack.addWidget(self.tiled_view)
+        self.splitter.addWidget(self.view_stack)
 
         self.outline_container = QWidget()
         outline_layout = QVBoxLayout(self.outline_container)
@@ -200,14 +238,16 @@ class ReaderPanel(QWidget):
 
     # ------------------------------------------------------------------ Event filter
     def eventFilter(self, obj, event) -> bool:  # type: ignore[override]
-        if getattr(self, "_pdf_viewport", None) is obj and event.type() == QEvent.Type.Wheel:
+        viewports = (getattr(self, "_pdf_viewport", None), getattr(self, "_tiled_viewport", None))
+        if obj in viewports and event.type() == QEvent.Type.Wheel:
             modifiers = event.modifiers()
             if modifiers == Qt.ControlModifier:
                 self._step_zoom(1 if event.angleDelta().y() > 0 else -1)
                 return True
             if modifiers == (Qt.ControlModifier | Qt.ShiftModifier):
                 delta = self.pan_speed if event.angleDelta().y() > 0 else -self.pan_speed
-                bar: QScrollBar = self.pdf_view.horizontalScrollBar()
+                view = self.tiled_view if self._tiled_active() else self.pdf_view
+                bar: QScrollBar = view.horizontalScrollBar()
                 bar.setValue(bar.value() - delta)
                 return True
         return super().eventFilter(obj, event)
@@ -227,9 +267,12 @@ class ReaderPanel(QWidget):
             self._append_log(f"[reader] QtPdf load failure ({status}) for {path}")
             return
         self.current_pdf = path
+        self._reset_search()
+        self.text_indexer.build(path)
         pages = self.document.pageCount()
-        self.session = DocumentSession(path=path, page_order=list(range(1, pages + 1)))
+        self.session = DocumentSession(path=path, page_order=PageOrder.range(pages))
         self.page_strip.set_session(self.session, self.document)
+        self.tiled_view.set_document(self.document, path)
         self.save_button.setEnabled(True)
         self.save_as_button.setEnabled(True)
         self.open_in_pages_button.setEnabled(True)
@@ -293,7 +336,10 @@ class ReaderPanel(QWidget):
         if not self.session or not self.document:
             return
         self.preview.load(self.document, self.session.path)
-        self.page_strip.refresh()
+        self.page_strip.reload_source()
+        page = self.tiled_view.page
+        self.tiled_view.set_document(self.document, self.session.path)
+        self.tiled_view.set_page(page)
         self._update_status()
 
     # ------------------------------------------------------------------ Page strip callbacks
@@ -338,6 +384,7 @@ class ReaderPanel(QWidget):
             return
         navigator = self.pdf_view.pageNavigator()
         navigator.jump(max(0, page_number - 1))
+        self.tiled_view.set_page(page_number - 1)
         self._update_status(current_page=page_number)
 
     def _apply_view_mode(self) -> None:
@@ -357,11 +404,13 @@ class ReaderPanel(QWidget):
         }
         if choice in mapping:
             self.pdf_view.setZoomMode(mapping[choice])
+            self._sync_tiled_view()
             return
         percent = int(choice.rstrip("%")) if choice.endswith("%") else 100
         self.pdf_view.setZoomMode(QPdfView.ZoomMode.Custom)
         self.zoom_factor = max(0.1, min(8.0, percent / 100))
         self.pdf_view.setZoomFactor(self.zoom_factor)
+        self._sync_tiled_view()
 
     def _step_zoom(self, direction: int) -> None:
         if not hasattr(self, "pdf_view") or self.pdf_view is None:
@@ -370,9 +419,29 @@ class ReaderPanel(QWidget):
         self.zoom_factor = max(0.1, min(8.0, self.zoom_factor + delta))
         self.pdf_view.setZoomMode(QPdfView.ZoomMode.Custom)
         self.pdf_view.setZoomFactor(self.zoom_factor)
+        self._sync_tiled_view()
         self._update_zoom_combo()
         self._update_status()
 
+    def _tiled_active(self) -> bool:
+        return hasattr(self, "view_stack") and self.view_stack.currentWidget() is self.tiled_view
+
+    def _sync_tiled_view(self) -> None:
+        """Swap between QPdfView and the tiled view as custom zoom crosses the threshold."""
+        tiled = (
+            self.pdf_view.zoomMode() == QPdfView.ZoomMode.Custom
+            and self.zoom_factor >= TILED_ZOOM_THRESHOLD
+        )
+        navigator = self.pdf_view.pageNavigator()
+        if tiled:
+            if not self._tiled_active():
+                self.tiled_view.set_page(navigator.currentPage())
+            self.tiled_view.set_zoom(self.zoom_factor)
+            self.view_stack.setCurrentWidget(self.tiled_view)
+        elif self._tiled_active():
+            navigator.jump(self.tiled_view.page)
+            self.view_stack.setCurrentWidget(self.pdf_view)
+
     def _update_zoom_combo(self) -> None:
         if not hasattr(self, "zoom_combo"):
             return
@@ -395,51 +464,128 @@ class ReaderPanel(QWidget):
         query = self.search_field.text().strip()
         if not query:
             return
-        if shutil.which("pdftotext") is None:
-            self._append_log("[reader] pdftotext is required for search.")
+        if query != self._last_search:
+            self._search_timer.stop()
+            self._start_search(query)
+            self._jump_pending = direction
+            return
+        if not self._search_hits:
+            if self._search_running:
+                self._jump_pending = direction
+            else:
+                self._append_log(f"[reader] No matches found for '{query}'.")
+            return
+        self._search_index = (self._search_index + direction) % len(self._search_hits)
+        self._focus_search_hit()
+
+    def _on_search_text_changed(self, _text: str) -> None:
+        self._cancel_search()
+        self._update_status()
+        self._search_timer.start()
+
+    def _start_search(self, query: str | None = None) -> None:
+        query = self.search_field.text().strip() if query is None else query
+        self._cancel_search()
+        if not query or not self.current_pdf or not self.document:
+            self._update_status()
+            return
+        self._last_search = query
+        worker = SearchWorker(
+            self._search_generation,
+            query,
+            index=self.text_index,
+            pdf=self.current_pdf,
+            page_count=self.document.pageCount(),
+        )
+        worker.signals.hits.connect(self._on_search_hits)
+        worker.signals.failed.connect(self._on_search_failed)
+        worker.signals.finished.connect(self._on_search_finished)
+        self._search_worker = worker
+        self._search_running = True
+        self._update_status()
+        QThreadPool.globalInstance().start(worker)
+
+    def _cancel_search(self) -> None:
+        """Stop any running query; results it still emits are dropped by generation."""
+        if self._search_worker is not None:
+            self._search_worker.cancel()
+        self._search_worker = None
+        self._search_generation += 1
+        self._search_running = False
+        self._search_hits = []
+        self._search_counts = {}
+        self._search_index = -1
+        self._last_search = ""
+        self._jump_pending = None
+
+    def _on_search_hits(self, generation: int, hits: list[SearchHit]) -> None:
+        if generation != self._search_generation:
             return
-        if query != self._last_search or not self._search_hits:
-            self._search_hits = self._collect_search_hits(query)
+        for hit in hits:
+            self._search_hits.append(hit.page)
+            self._search_counts[hit.page] = hit.count
+        if self._jump_pending is not None and self._search_hits:
+            self._jump_pending = None
             self._search_index = 0
-            self._last_search = query
+            self._focus_search_hit()
+            return
+        self._update_status()
+
+    def _on_search_failed(self, generation: int, message: str) -> None:
+        if generation == self._search_generation:
+            self._append_log(f"[reader] Search failed: {message}")
+
+    def _on_search_finished(self, generation: int, cancelled: bool) -> None:
+        if generation != self._search_generation or cancelled:
+            return
+        self._search_running = False
+        self._search_worker = None
+        self._jump_pending = None
+        if self._search_counts:
+            best = min(self._search_counts.items(), key=lambda item: (-item[1], item[0]))
+            self._append_log(
+                f"[reader] '{self._last_search}': {sum(self._search_counts.values())} matches "
+                f"on {len(self._search_hits)} page(s); most on page {best[0]} ({best[1]})."
+            )
         else:
-            self._search_index = (self._search_index + direction) % max(1, len(self._search_hits))
-        if not self._search_hits:
-            self._append_log(f"[reader] No matches found for '{query}'.")
-            return
-        target_page = self._search_hits[self._search_index]
-        self._focus_page(target_page)
-
-    def _collect_search_hits(self, query: str) -> list[int]:
-        hits: list[int] = []
-        pages = self.document.pageCount() if self.document else 0
-        lower_query = query.lower()
-        for page in range(1, pages + 1):
-            text = self._extract_page_text(page).lower()
-            if lower_query in text:
-                hits.append(page)
-        return hits
-
-    def _extract_page_text(self, page: int) -> str:
-        if not self.current_pdf:
+            self._append_log(f"[reader] No matches found for '{self._last_search}'.")
+        self._update_status()
+
+    def _focus_search_hit(self) -> None:
+        self._focus_page(self._search_hits[self._search_index])
+
+    def _search_status(self) -> str:
+        if not self._last_search:
             return ""
-        result = subprocess.run(
-            [
-                "pdftotext",
-                "-enc",
-                "UTF-8",
-                "-f",
-                str(page),
-                "-l",
-                str(page),
-                str(self.current_pdf),
-                "-",
-            ],
-            capture_output=True,
-            text=True,
-            check=False,
-        )
-        return result.stdout or ""
+        total = sum(self._search_counts.values())
+        if self._search_running:
+            status = f"{total} matches so far"
+        elif not self._search_hits:
+            return "no matches"
+        else:
+            status = f"{total} matches on {len(self._search_hits)} page(s)"
+        if self._search_index >= 0 and self._search_hits:
+            page = self._search_hits[self._search_index]
+            status += (
+                f" — hit page {self._search_index + 1}/{len(self._search_hits)} "
+                f"({self._search_counts.get(page, 0)} here)"
+            )
+        return status
+
+    def _reset_search(self) -> None:
+        self._search_timer.stop()
+        self._cancel_search()
+        self.text_index = None
+
+    def _on_text_index_ready(self, pdf: Path, index: TextIndex) -> None:
+        if pdf != self.current_pdf:
+            return
+        self.text_index = index
+        self._append_log(f"[reader] Text index ready ({index.page_count} pages).")
+
+    def _on_text_index_failed(self, pdf: Path, message: str) -> None:
+        if pdf == self.current_pdf:
+            self._append_log(f"[reader] Text index unavailable: {message}")
 
     def _focus_page(self, page_number: int) -> None:
         if not self.session:
@@ -515,10 +661,16 @@ class ReaderPanel(QWidget):
         if not self.document or not self.current_pdf:
             self.status_label.setText("No document loaded.")
             return
+        if current_page is None and self._tiled_active():
+            current_page = self.tiled_view.page + 1
         page = current_page or self.pdf_view.pageNavigator().currentPage() + 1
         total = self.document.pageCount()
         zoom = int(self.zoom_factor * 100)
-        self.status_label.setText(f"{self.current_pdf.name} — Page {page}/{total} @ {zoom}%")
+        status = f"{self.current_pdf.name} — Page {page}/{total} @ {zoom}%"
+        search = self._search_status()
+        if search:
+            status += f" — {search}"
+        self.status_label.setText(status)
 
     def _open_external(self) -> None:
         if not self.current_pdf:
@@ -68,6 +68,11 @@ class SettingsPanel(QWidget):
         self.thumb_size_spin.setValue(settings.data.reader_thumbnail_size)
         reader_form.addRow("Thumbnail size (px)", self.thumb_size_spin)
 
+        self.thumb_cache_spin = QSpinBox()
+        self.thumb_cache_spin.setRange(8, 4096)
+        self.thumb_cache_spin.setValue(settings.data.reader_thumbnail_cache_mb)
+        reader_form.addRow("Thumbnail memory (MB)", self.thumb_cache_spin)
+
         self.reader_layout_check = QCheckBox("Remember dock layout")
         self.reader_layout_check.setChecked(settings.data.remember_reader_layout)
         reader_form.addRow(self.reader_layout_check)
@@ -142,6 +147,7 @@ class SettingsPanel(QWidget):
         self.settings.data.reader_zoom_step = self.zoom_step_spin.value()
         self.settings.data.reader_pan_speed = self.pan_speed_spin.value()
         self.settings.data.reader_thumbnail_size = self.thumb_size_spin.value()
+        self.settings.data.reader_thumbnail_cache_mb = self.thumb_cache_spin.value()
         self.settings.data.remember_reader_layout = self.reader_layout_check.isChecked()
         Path(output).mkdir(parents=True, exist_ok=True)
         self.settings.save()
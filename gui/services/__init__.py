@@ -6,6 +6,8 @@ from .bookmarks_io import BookmarkNode, parse_dump, serialize_nodes
 from .settings import SettingsStore, GuiSettings
 from .assets import get_asset_path
 from .session_bus import get_session_bus
+from .text_search import SearchWorker, TextIndexService
+from .tile_renderer import TileRenderer
 
 __all__ = [
     "Runner",
@@ -18,4 +20,7 @@ __all__ = [
     "GuiSettings",
     "get_asset_path",
     "get_session_bus",
+    "SearchWorker",
+    "TextIndexService",
+    "TileRenderer",
 ]
@@ -2,8 +2,10 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from PySide6.QtCore import QSize, QRectF, QPointF
-from PySide6.QtGui import QImage, QPainter, QPixmap
+from PySide6.QtCore import QRect, QSize, Qt
+from PySide6.QtGui import QColor, QImage, QPainter, QPixmap
+
+from pdfsuite.core.tiles import TILE_SIZE, visible_tiles
 
 try:
     from PySide6.QtPdf import QPdfDocument
@@ -12,6 +14,9 @@ except ImportError:  # pragma: no cover - PySide6 extras might be missing in tes
     QPdfDocument = None  # type: ignore[assignment]
     QPdfDocumentRenderOptions = None  # type: ignore[assignment]
 
+# Fraction of the target resolution used for the immediate, low-DPI first pass.
+PREVIEW_SCALE = 0.25
+
 
 class PdfPreviewProvider:
     """Helper to load PDFs and render thumbnails via QtPdf."""
@@ -25,16 +30,86 @@ class PdfPreviewProvider:
         return QPdfDocument(parent)
 
     def render_thumbnail(self, document, page: int, size: QSize) -> QPixmap | None:
-        if QPdfDocument is None or document is None:
+        image = self.render_image(document, page, size)
+        return QPixmap.fromImage(image) if image is not None else None
+
+    def render_image(
+        self,
+        document,
+        page: int,
+        size: QSize,
+        clip: QRect | None = None,
+    ) -> QImage | None:
+        """Render `page` (0-based) scaled to `size` into a QImage; safe to call off the GUI thread.
+
+        With `clip` (in the coordinates of the scaled page) only that region is
+        rasterized, so memory follows the clip rather than the full page size.
+        """
+        if QPdfDocument is None or document is None or size.isEmpty():
+            return None
+        options = QPdfDocumentRenderOptions()
+        options.setScaledSize(size)
+        target = size
+        if clip is not None:
+            clip = clip.intersected(QRect(0, 0, size.width(), size.height()))
+            if clip.isEmpty():
+                return None
+            options.setScaledClipRect(clip)
+            target = clip.size()
+        image = document.render(page, target, options)
+        if image.isNull():
+            return None
+        return _on_white(image)
+
+    def render_preview(self, document, page: int, size: QSize) -> QImage | None:
+        """Cheap first pass: render at `PREVIEW_SCALE` and stretch it to `size`.
+
+        Callers show this at once and replace it with `render_image` output
+        when the full-resolution render (normally on a worker thread) lands.
+        """
+        small = QSize(
+            max(1, round(size.width() * PREVIEW_SCALE)),
+            max(1, round(size.height() * PREVIEW_SCALE)),
+        )
+        image = self.render_image(document, page, small)
+        if image is None:
             return None
-        image = QImage(size.width(), size.height(), QImage.Format_ARGB32)
-        image.fill(0xFFFFFFFF)
-        painter = QPainter(image)
-        options = QPdfDocumentRenderOptions() if QPdfDocumentRenderOptions else None
-        target = QRectF(QPointF(0, 0), size)
-        document.render(page, painter, target, QRectF(), options)
+        return image.scaled(size, Qt.IgnoreAspectRatio, Qt.FastTransformation)
+
+    @staticmethod
+    def tile_rects(size: QSize, visible: QRect, tile: int = TILE_SIZE) -> list[QRect]:
+        """Grid tiles of a page scaled to `size` that intersect `visible`, centre first."""
+        area = (visible.x(), visible.y(), visible.width(), visible.height())
+        return [QRect(*rect) for rect in visible_tiles(size.width(), size.height(), area, tile)]
+
+    def render_tiles(
+        self,
+        document,
+        page: int,
+        size: QSize,
+        visible: QRect,
+    ) -> list[tuple[QRect, QImage]]:
+        """Render only the tiles of a zoomed page that cover `visible`.
+
+        At high zoom the scaled page can be tens of thousands of pixels across;
+        tiles keep each allocation at `TILE_SIZE` squared and skip off-screen area.
+        """
+        tiles = []
+        for rect in self.tile_rects(size, visible):
+            image = self.render_image(document, page, size, rect)
+            if image is not None:
+                tiles.append((rect, image))
+        return tiles
+
+    def placeholder(self, size: QSize) -> QPixmap:
+        """Blank page outline shown while a thumbnail renders."""
+        pixmap = QPixmap(size)
+        pixmap.fill(QColor("#f2f2f2"))
+        painter = QPainter(pixmap)
+        painter.setPen(QColor("#c8c8c8"))
+        painter.drawRect(0, 0, size.width() - 1, size.height() - 1)
         painter.end()
-        return QPixmap.fromImage(image)
+        return pixmap
 
     def page_count(self, document) -> int:
         if document is None or QPdfDocument is None:
@@ -46,3 +121,15 @@ class PdfPreviewProvider:
             return False
         status = document.load(str(path))
         return status == QPdfDocument.Status.Ready
+
+
+def _on_white(image: QImage) -> QImage:
+    """Flatten QtPdf's transparent page background onto white paper."""
+    if not image.hasAlphaChannel():
+        return image
+    flattened = QImage(image.size(), QImage.Format_RGB32)
+    flattened.fill(0xFFFFFFFF)
+    painter = QPainter(flattened)
+    painter.drawImage(0, 0, image)
+    painter.end()
+    return flattened
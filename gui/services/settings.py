@@ -19,6 +19,7 @@ class GuiSettings:
     reader_zoom_step: int = 10
     reader_pan_speed: int = 64
     reader_thumbnail_size: int = 96
+    reader_thumbnail_cache_mb: int = 64
     remember_reader_layout: bool = True
 
 
@@ -56,6 +57,10 @@ class SettingsStore:
                 "reader_thumbnail_size",
                 self.data.reader_thumbnail_size,
             ),
+            reader_thumbnail_cache_mb=payload.get(
+                "reader_thumbnail_cache_mb",
+                self.data.reader_thumbnail_cache_mb,
+            ),
             remember_reader_layout=payload.get(
                 "remember_reader_layout",
                 self.data.remember_reader_layout,
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+
+from PySide6.QtCore import QObject, QRunnable, QThread, Signal, Slot
+
+from pdfsuite.core.text_index import (
+    SearchHit,
+    TextExtractionError,
+    TextIndex,
+    iter_hits,
+    iter_page_texts,
+    load_or_build,
+    normalize_text,
+)
+
+# Minimum spacing between streamed hit batches so the UI is not flooded.
+HIT_BATCH_SECONDS = 0.1
+
+
+class TextIndexWorker(QObject):
+    ready = Signal(object, object)
+    failed = Signal(object, str)
+
+    def __init__(self, pdf: Path) -> None:
+        super().__init__()
+        self.pdf = pdf
+
+    @Slot()
+    def run(self) -> None:
+        try:
+            index = load_or_build(self.pdf)
+        except (TextExtractionError, OSError) as exc:
+            self.failed.emit(self.pdf, str(exc))
+            return
+        self.ready.emit(self.pdf, index)
+
+
+class TextIndexService(QObject):
+    """Build (or load from disk) a document's text index on a background thread."""
+
+    index_ready = Signal(object, object)
+    index_failed = Signal(object, str)
+
+    def __init__(self, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._jobs: dict[Path, tuple[QThread, TextIndexWorker]] = {}
+
+    def build(self, pdf: Path) -> None:
+        if pdf in self._jobs:
+            return
+        worker = TextIndexWorker(pdf)
+        thread = QThread()
+        worker.moveToThread(thread)
+        thread.started.connect(worker.run)
+        worker.ready.connect(self._handle_ready)
+        worker.failed.connect(self._handle_failed)
+        self._jobs[pdf] = (thread, worker)
+        thread.start()
+
+    def shutdown(self) -> None:
+        for pdf in list(self._jobs):
+            self._cleanup(pdf)
+
+    @Slot(object, object)
+    def _handle_ready(self, pdf: Path, index: TextIndex) -> None:
+        self._cleanup(pdf)
+        self.index_ready.emit(pdf, index)
+
+    @Slot(object, str)
+    def _handle_failed(self, pdf: Path, message: str) -> None:
+        self._cleanup(pdf)
+        self.index_failed.emit(pdf, message)
+
+    def _cleanup(self, pdf: Path) -> None:
+        job = self._jobs.pop(pdf, None)
+        if job is None:
+            return
+        thread, worker = job
+        thread.quit()
+        thread.wait()
+        worker.deleteLater()
+        thread.deleteLater()
+
+
+class SearchSignals(QObject):
+    hits = Signal(int, object)
+    failed = Signal(int, str)
+    finished = Signal(int, bool)
+
+
+class SearchWorker(QRunnable):
+    """Scan a document for one query off the GUI thread, streaming hits in batches.
+
+    Uses the text index when it is ready; otherwise extracts pages a chunk at a
+    time so early hits arrive before the whole document has been read.
+    Signals carry the query's ``generation`` so receivers can drop stale results.
+    """
+
+    def __init__(
+        self,
+        generation: int,
+        query: str,
+        *,
+        index: TextIndex | None = None,
+        pdf: Path | None = None,
+        page_count: int = 0,
+    ) -> None:
+        super().__init__()
+        self.generation = generation
+        self.query = query
+        self.index = index
+        self.pdf = pdf
+        self.page_count = page_count
+        self.signals = SearchSignals()
+        self._cancelled = threading.Event()
+
+    def cancel(self) -> None:
+        self._cancelled.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def run(self) -> None:
+        try:
+            self._scan()
+        except (TextExtractionError, OSError) as exc:
+            self.signals.failed.emit(self.generation, str(exc))
+        self.signals.finished.emit(self.generation, self.cancelled)
+
+    def _scan(self) -> None:
+        if self.index is not None:
+            hits = self.index.search(self.query)
+            if hits and not self.cancelled:
+                self.signals.hits.emit(self.generation, hits)
+            return
+        if self.pdf is None:
+            return
+        batch: list[SearchHit] = []
+        last_emit = 0.0
+        pages = iter_page_texts(self.pdf, self.page_count)
+        for hit in iter_hits(self._until_cancelled(pages), normalize_text(self.query)):
+            batch.append(hit)
+            now = time.monotonic()
+            if now - last_emit >= HIT_BATCH_SECONDS:
+                self.signals.hits.emit(self.generation, batch)
+                batch, last_emit = [], now
+        if batch and not self.cancelled:
+            self.signals.hits.emit(self.generation, batch)
+
+    def _until_cancelled(self, pages):
+        for item in pages:
+            if self.cancelled:
+                return
+            yield item
@@ -0,0 +1,354 @@
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import heapq
+import itertools
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Hashable, Iterable
+
+from PySide6.QtCore import QCoreApplication, QObject, QSize, QThread, Signal, Slot
+from PySide6.QtGui import QImage, QPixmap
+
+from pdfsuite.utils.backend import BackendError, native_backend
+from pdfsuite.utils.cache import AUXILIARY_CACHES, cache_root, prune_lru
+
+from .pdf_preview import PdfPreviewProvider
+
+PRIORITY_LOAD = -1
+PRIORITY_VISIBLE = 0
+PRIORITY_NEARBY = 1
+# Full-resolution passes for pages that already show a low-DPI preview.
+PRIORITY_REFINE = 2
+# Pseudo page queued on every source switch so the document loads before any
+# thumbnail request for it.
+LOAD_PAGE = 0
+DEFAULT_CACHE_BYTES = 64 * 1024 * 1024
+# The disk cache is trimmed back to its cap after this many new thumbnails.
+DISK_PRUNE_INTERVAL = 256
+
+
+class PixmapCache:
+    """Least-recently-used pixmaps bounded by their approximate decoded size in bytes."""
+
+    def __init__(self, max_bytes: int = DEFAULT_CACHE_BYTES) -> None:
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self._entries: OrderedDict[Hashable, tuple[QPixmap, int]] = OrderedDict()
+
+    def get(self, key: Hashable) -> QPixmap | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def put(self, key: Hashable, pixmap: QPixmap) -> None:
+        self.discard(key)
+        cost = pixmap.width() * pixmap.height() * max(1, pixmap.depth()) // 8
+        self._entries[key] = (pixmap, cost)
+        self.bytes += cost
+        while self.bytes > self.max_bytes and len(self._entries) > 1:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self.bytes -= evicted
+
+    def discard(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.bytes -= entry[1]
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.bytes = 0
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class PageKeys:
+    """Content key per source page (1-based), computed only when the page is first needed.
+
+    With a native backend this is the page's content fingerprint
+    (`PdfBackend.fingerprinter`), which reads just that page's streams, so
+    visible thumbnails never wait for the whole file to be hashed. Otherwise
+    it is derived from the file's path, size, and mtime plus the page number.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self._stack = contextlib.ExitStack()
+        self._fingerprint = None
+        self._keys: dict[int, str] = {}
+        backend = native_backend()
+        if backend is not None:
+            try:
+                self._fingerprint = self._stack.enter_context(backend.fingerprinter(path))
+            except BackendError:
+                self._fingerprint = None
+        try:
+            info = path.stat()
+            identity = f"{path.resolve()}:{info.st_size}:{info.st_mtime_ns}"
+        except OSError:
+            identity = str(path)
+        self._file = hashlib.sha256(identity.encode()).hexdigest()
+
+    def __call__(self, page: int) -> str:
+        key = self._keys.get(page)
+        if key is None:
+            key = f"{self._file}-{page}"
+            if self._fingerprint is not None:
+                try:
+                    key = self._fingerprint(page - 1)
+                except (BackendError, IndexError):
+                    pass
+            self._keys[page] = key
+        return key
+
+    def close(self) -> None:
+        self._stack.close()
+
+
+class ThumbnailDiskCache:
+    """PNG thumbnails under ``<cache root>/thumbnails/<key[:2]>/<key>/<w>x<h>.png``.
+
+    Keys are `PageKeys` content keys, the same ones the page strip's memory
+    cache uses. The render thread writes every thumbnail it renders, so
+    anything the memory cache evicts (or a later session asks for, in this
+    file or any other with the same page) loads from disk instead of QtPdf.
+    Loads refresh a file's mtime and the directory is trimmed LRU-first to
+    `max_bytes`; ``pdfsuite cache stats/prune`` report and prune it too.
+    """
+
+    def __init__(self, root: Path | None = None, max_bytes: int | None = None) -> None:
+        subdir, self.pattern, cap = AUXILIARY_CACHES["thumbnails"]
+        self.root = root or cache_root() / subdir
+        self.max_bytes = cap if max_bytes is None else max_bytes
+        self._writes = 0
+
+    def path_for(self, key: str, size: QSize) -> Path:
+        return self.root / key[:2] / key / f"{size.width()}x{size.height()}.png"
+
+    def load(self, key: str, size: QSize) -> QImage | None:
+        path = self.path_for(key, size)
+        if not path.is_file():
+            return None
+        image = QImage(str(path))
+        if image.isNull():
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return image
+
+    def store(self, key: str, size: QSize, image: QImage) -> None:
+        path = self.path_for(key, size)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".png")
+            os.close(fd)
+            if image.save(tmp_name, "PNG"):
+                os.replace(tmp_name, path)
+            else:
+                os.unlink(tmp_name)
+                return
+        except OSError:
+            return
+        self._writes += 1
+        if self._writes % DISK_PRUNE_INTERVAL == 0:
+            self.prune()
+
+    def prune(self) -> tuple[int, int]:
+        return prune_lru(self.root, self.pattern, self.max_bytes)
+
+
+class RenderQueue:
+    """Thread-safe priority queue of render keys; re-queuing a key only raises its priority.
+
+    Superseded and cancelled heap entries are skipped lazily in `take`.
+    """
+
+    def __init__(self) -> None:
+        self._cond = threading.Condition()
+        self._heap: list[tuple[int, int, Hashable]] = []
+        self._pending: dict[Hashable, int] = {}
+        self._counter = itertools.count()
+        self._closed = False
+
+    def put(self, key: Hashable, priority: int) -> None:
+        with self._cond:
+            current = self._pending.get(key)
+            if current is not None and current <= priority:
+                return
+            self._pending[key] = priority
+            heapq.heappush(self._heap, (priority, next(self._counter), key))
+            self._cond.notify()
+
+    def take(self) -> Hashable | None:
+        """Block for the most urgent key; None once the queue is closed."""
+        with self._cond:
+            while True:
+                while not self._heap and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return None
+                priority, _, key = heapq.heappop(self._heap)
+                if self._pending.get(key) == priority:
+                    del self._pending[key]
+                    return key
+
+    def retain(self, keys: Iterable[Hashable]) -> None:
+        """Cancel every pending key not in `keys`."""
+        keep = set(keys)
+        with self._cond:
+            self._pending = {key: pri for key, pri in self._pending.items() if key in keep}
+            self._compact()
+
+    def clear(self) -> None:
+        with self._cond:
+            self._pending.clear()
+            self._heap.clear()
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    def _compact(self) -> None:
+        if len(self._heap) > 2 * len(self._pending) + 64:
+            self._heap = [entry for entry in self._heap if self._pending.get(entry[2]) == entry[0]]
+            heapq.heapify(self._heap)
+
+
+class _RenderThread(QThread):
+    rendered = Signal(int, int, str, QImage, bool)
+
+    def __init__(
+        self,
+        preview: PdfPreviewProvider,
+        queue: RenderQueue,
+        disk: ThumbnailDiskCache,
+    ) -> None:
+        super().__init__()
+        self.preview = preview
+        self.queue = queue
+        self.disk = disk
+        self._lock = threading.Lock()
+        self._source: tuple[int, Path | None, QSize] = (0, None, QSize())
+
+    def set_source(self, generation: int, path: Path | None, size: QSize) -> None:
+        with self._lock:
+            self._source = (generation, path, QSize(size))
+
+    def run(self) -> None:  # noqa: D401 - QThread entry point
+        # The worker owns its own QPdfDocument so rendering never touches the GUI thread's copy.
+        # It reloads on every new generation in case the file changed on disk.
+        document = None
+        keys: PageKeys | None = None
+        loaded = -1
+        while True:
+            key = self.queue.take()
+            if key is None:
+                break
+            generation, page, final = key
+            with self._lock:
+                current, path, size = self._source
+            if generation != current or path is None:
+                continue
+            if generation != loaded:
+                if keys is not None:
+                    keys.close()
+                    keys = None
+                document = self.preview.create_document()
+                if not self.preview.load(document, path):
+                    document, loaded = None, -1
+                    continue
+                keys = PageKeys(path)
+                loaded = generation
+            if page == LOAD_PAGE:
+                continue
+            content = keys(page)
+            image = self.disk.load(content, size)
+            if image is not None:
+                self.rendered.emit(generation, page, content, image, True)
+                continue
+            if not final:
+                # Progressive first pass: a quarter-resolution render goes out at once and
+                # the full render is queued behind every other visible page's preview.
+                image = self.preview.render_preview(document, page - 1, size)
+                if image is not None:
+                    self.rendered.emit(generation, page, content, image, False)
+                self.queue.put((generation, page, True), PRIORITY_REFINE)
+                continue
+            image = self.preview.render_image(document, page - 1, size)
+            if image is not None:
+                self.disk.store(content, size, image)
+                self.rendered.emit(generation, page, content, image, True)
+        if keys is not None:
+            keys.close()
+
+
+class ThumbnailRenderer(QObject):
+    """Render page thumbnails on a background thread, most urgent requests first.
+
+    Pages are 1-based source page numbers. `thumbnail_ready` fires on the GUI
+    thread with the page, its `PageKeys` content key (the disk cache's key, for
+    callers to key cached pixmaps on), and a QImage; callers convert it to a
+    QPixmap there. Pages missing from the disk cache arrive twice: a low-DPI
+    preview (``final`` False) as soon as possible, then the full-resolution
+    image (``final`` True).
+    """
+
+    thumbnail_ready = Signal(int, str, QImage, bool)
+
+    def __init__(
+        self,
+        preview: PdfPreviewProvider,
+        parent: QObject | None = None,
+        *,
+        disk: ThumbnailDiskCache | None = None,
+    ) -> None:
+        super().__init__(parent)
+        self.preview = preview
+        self.queue = RenderQueue()
+        self._generation = 0
+        self._thread = _RenderThread(preview, self.queue, disk or ThumbnailDiskCache())
+        self._thread.rendered.connect(self._deliver)
+        if preview.available:
+            self._thread.start()
+            app = QCoreApplication.instance()
+            if app is not None:
+                app.aboutToQuit.connect(self.shutdown)
+
+    def set_source(self, path: Path | None, size: QSize) -> None:
+        """Switch documents or sizes; everything queued for the old source is dropped."""
+        self._generation += 1
+        self.queue.clear()
+        self._thread.set_source(self._generation, path, size)
+        if path is not None:
+            self.queue.put((self._generation, LOAD_PAGE, False), PRIORITY_LOAD)
+
+    def request(self, page: int, priority: int = PRIORITY_VISIBLE, *, final: bool = False) -> None:
+        """Queue `page`; `final` skips the preview pass for pages that already show one."""
+        self.queue.put((self._generation, page, final), priority)
+
+    def retain(self, pages: Iterable[int]) -> None:
+        keep = [(self._generation, page, final) for page in pages for final in (False, True)]
+        keep.append((self._generation, LOAD_PAGE, False))
+        self.queue.retain(keep)
+
+    def shutdown(self) -> None:
+        self.queue.close()
+        if self._thread.isRunning():
+            self._thread.wait()
+
+    @Slot(int, int, str, QImage, bool)
+    def _deliver(self, generation: int, page: int, key: str, image: QImage, final: bool) -> None:
+        if generation == self._generation:
+            self.thumbnail_ready.emit(page, key, image, final)
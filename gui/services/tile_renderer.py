@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from typing import Hashable, Iterable, Optional, Tuple
+
+from PySide6.QtCore import (
+    QCoreApplication,
+    QObject,
+    QRect,
+    QSize,
+    QThread,
+    Signal,
+    Slot,
+)
+from PySide6.QtGui import QImage
+
+from .pdf_preview import PdfPreviewProvider
+from .thumbnails import RenderQueue
+
+# (0-based page, scaled width, scaled height, (left, top, width, height) clip or
+# None for the whole page); the clip is in scaled-page pixels.
+TileKey = Tuple[int, int, int, Optional[Tuple[int, int, int, int]]]
+
+
+class _TileThread(QThread):
+    rendered = Signal(int, object, QImage)
+
+    def __init__(self, preview: PdfPreviewProvider, queue: RenderQueue) -> None:
+        super().__init__()
+        self.preview = preview
+        self.queue = queue
+        self._lock = threading.Lock()
+        self._source: tuple[int, Path | None] = (0, None)
+
+    def set_source(self, generation: int, path: Path | None) -> None:
+        with self._lock:
+            self._source = (generation, path)
+
+    def run(self) -> None:  # noqa: D401 - QThread entry point
+        # Like the thumbnail thread, this one renders from its own QPdfDocument.
+        document = None
+        loaded = -1
+        while True:
+            key = self.queue.take()
+            if key is None:
+                break
+            generation, tile = key
+            with self._lock:
+                current, path = self._source
+            if generation != current or path is None:
+                continue
+            if generation != loaded:
+                document = self.preview.create_document()
+                if not self.preview.load(document, path):
+                    document, loaded = None, -1
+                    continue
+                loaded = generation
+            page, width, height, clip = tile
+            image = self.preview.render_image(
+                document, page, QSize(width, height), QRect(*clip) if clip else None
+            )
+            if image is not None:
+                self.rendered.emit(generation, tile, image)
+
+
+class TileRenderer(QObject):
+    """Render page tiles and whole-page backdrops of one document on a background thread.
+
+    Requests are `TileKey` tuples served most urgent first; `tile_ready` fires
+    on the GUI thread with the key and its QImage. Switching sources drops
+    everything queued for the previous one.
+    """
+
+    tile_ready = Signal(object, QImage)
+
+    def __init__(self, preview: PdfPreviewProvider, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self.queue = RenderQueue()
+        self._generation = 0
+        self._thread = _TileThread(preview, self.queue)
+        self._thread.rendered.connect(self._deliver)
+        if preview.available:
+            self._thread.start()
+            app = QCoreApplication.instance()
+            if app is not None:
+                app.aboutToQuit.connect(self.shutdown)
+
+    def set_source(self, path: Path | None) -> None:
+        """Render from `path` from now on; also call after the file was rewritten."""
+        self._generation += 1
+        self.queue.clear()
+        self._thread.set_source(self._generation, path)
+
+    def request(self, tile: TileKey, priority: int) -> None:
+        self.queue.put((self._generation, tile), priority)
+
+    def retain(self, tiles: Iterable[Hashable]) -> None:
+        """Cancel queued tiles not in `tiles` (for example, scrolled out of view)."""
+        self.queue.retain((self._generation, tile) for tile in tiles)
+
+    def shutdown(self) -> None:
+        self.queue.close()
+        if self._thread.isRunning():
+            self._thread.wait()
+
+    @Slot(int, object, QImage)
+    def _deliver(self, generation: int, tile: TileKey, image: QImage) -> None:
+        if generation == self._generation:
+            self.tile_ready.emit(tile, image)
@@ -1,3 +1,4 @@
 from .page_strip import PageStrip
+from .tiled_page_view import TiledPageView
 
-__all__ = ["PageStrip"]
+__all__ = ["PageStrip", "TiledPageView"]
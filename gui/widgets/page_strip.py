@@ -1,9 +1,18 @@
 from __future__ import annotations
 
+from pathlib import Path
 from typing import List, Optional
 
-from PySide6.QtCore import QAbstractListModel, QModelIndex, QSize, Qt, Signal
-from PySide6.QtGui import QAction, QPixmap
+from PySide6.QtCore import (
+    QAbstractListModel,
+    QModelIndex,
+    QPoint,
+    QSize,
+    Qt,
+    QTimer,
+    Signal,
+)
+from PySide6.QtGui import QAction, QImage, QPixmap
 from PySide6.QtWidgets import (
     QListView,
     QMenu,
@@ -12,27 +21,87 @@ from PySide6.QtWidgets import (
 )
 
 from gui.services import PdfPreviewProvider
+from gui.services.thumbnails import (
+    DEFAULT_CACHE_BYTES,
+    PRIORITY_NEARBY,
+    PRIORITY_REFINE,
+    PRIORITY_VISIBLE,
+    PixmapCache,
+    ThumbnailRenderer,
+)
 from pdfsuite.core.document_session import DocumentSession
 
+# Rows beyond the viewport (each side) rendered at low priority for smooth scrolling.
+PREFETCH_ROWS = 8
+
 
 class PageStripModel(QAbstractListModel):
     page_role = Qt.UserRole + 1
 
-    def __init__(self, preview: PdfPreviewProvider, thumbnail_size: int) -> None:
+    def __init__(
+        self,
+        preview: PdfPreviewProvider,
+        thumbnail_size: int,
+        cache_bytes: int = DEFAULT_CACHE_BYTES,
+    ) -> None:
         super().__init__()
         self.preview = preview
         self._size = QSize(thumbnail_size, int(thumbnail_size * 1.35))
         self.session: Optional[DocumentSession] = None
         self.document = None
-        self._cache: dict[int, QPixmap] = {}
+        self._cache = PixmapCache(cache_bytes)
+        # Cache keys currently holding only a low-DPI preview, still owed a full render.
+        self._previews: set[str] = set()
+        # Content key per source page, learned as thumbnails arrive (the renderer's
+        # disk-cache key); cached pixmaps survive reorders, deletes, and reloads
+        # because they name page content, not row positions.
+        self._keys: dict[int, str] = {}
+        # Keys from before a reload of the same file, shown until pages are re-keyed.
+        self._stale: dict[int, str] = {}
+        self._source: Path | None = None
+        self._placeholder = preview.placeholder(self._size) if preview.available else None
+        self.renderer = ThumbnailRenderer(preview, self)
+        self.renderer.thumbnail_ready.connect(self._on_thumbnail_ready)
 
     def set_session(self, session: DocumentSession | None, document) -> None:
         self.beginResetModel()
         self.session = session
         self.document = document
-        self._cache.clear()
+        self._load_source(session.path if session else None)
         self.endResetModel()
 
+    def reload_source(self) -> None:
+        """Re-read the session's file after it changed on disk, reusing unchanged pages."""
+        self._load_source(self.session.path if self.session else None)
+        self.refresh()
+
+    def _load_source(self, path: Path | None) -> None:
+        # Pages may have moved or changed, so every page is re-keyed by the renderer;
+        # a reload of the same file keeps showing the old pixmaps until then.
+        self._stale = {**self._stale, **self._keys} if path == self._source else {}
+        self._keys = {}
+        self._source = path
+        self.renderer.set_source(path, self._size)
+
+    def prioritize(self, first_row: int, last_row: int) -> None:
+        """Render rows in [first_row, last_row] first, prefetch neighbours, cancel the rest."""
+        if not self.session:
+            return
+        order = self.session.page_order
+        start = max(0, first_row - PREFETCH_ROWS)
+        stop = min(len(order), last_row + 1 + PREFETCH_ROWS)
+        wanted = [page for page in order[start:stop] if self._pending(page)]
+        self.renderer.retain(wanted)
+        for row in range(start, stop):
+            page = order[row]
+            if not self._pending(page):
+                continue
+            if self._key(page) in self._previews:
+                self.renderer.request(page, PRIORITY_REFINE, final=True)
+                continue
+            visible = first_row <= row <= last_row
+            self.renderer.request(page, PRIORITY_VISIBLE if visible else PRIORITY_NEARBY)
+
     def rowCount(self, parent: QModelIndex | None = None) -> int:
         if parent and parent.isValid():
             return 0
@@ -56,15 +125,40 @@ class PageStripModel(QAbstractListModel):
         self.beginResetModel()
         self.endResetModel()
 
+    def _key(self, page_number: int) -> str | None:
+        return self._keys.get(page_number)
+
+    def _pending(self, page_number: int) -> bool:
+        key = self._key(page_number)
+        return key is None or key not in self._cache or key in self._previews
+
     def _thumbnail(self, page_number: int) -> QPixmap | None:
-        if page_number in self._cache:
-            return self._cache[page_number]
+        key = self._key(page_number)
+        cached = self._cache.get(key) if key is not None else None
+        if cached is not None:
+            return cached
         if not self.preview.available or self.document is None:
             return None
-        pixmap = self.preview.render_thumbnail(self.document, page_number - 1, self._size)
-        if pixmap:
-            self._cache[page_number] = pixmap
-        return pixmap
+        self.renderer.request(page_number, PRIORITY_VISIBLE)
+        stale = self._stale.get(page_number)
+        return (self._cache.get(stale) if stale is not None else None) or self._placeholder
+
+    def _on_thumbnail_ready(self, page_number: int, key: str, image: QImage, final: bool) -> None:
+        if not self.session:
+            return
+        self._keys[page_number] = key
+        self._stale.pop(page_number, None)
+        if final:
+            self._previews.discard(key)
+            self._cache.put(key, QPixmap.fromImage(image))
+        elif key not in self._cache or key in self._previews:
+            # Skipped when this content (perhaps on another page) already has its full render.
+            self._previews.add(key)
+            self._cache.put(key, QPixmap.fromImage(image))
+        order = self.session.page_order
+        if page_number in order:
+            index = self.index(order.index(page_number), 0)
+            self.dataChanged.emit(index, index, [Qt.DecorationRole])
 
 
 class PageStrip(QListView):
@@ -74,7 +168,13 @@ class PageStrip(QListView):
     deleteRequested = Signal(list)
     extractRequested = Signal(list)
 
-    def __init__(self, preview: PdfPreviewProvider, thumbnail_size: int) -> None:
+    def __init__(
+        self,
+        preview: PdfPreviewProvider,
+        thumbnail_size: int,
+        *,
+        cache_bytes: int = DEFAULT_CACHE_BYTES,
+    ) -> None:
         super().__init__()
         self.preview = preview
         self.thumbnail_size = thumbnail_size
@@ -85,11 +185,17 @@ class PageStrip(QListView):
         self.setDefaultDropAction(Qt.MoveAction)
         self.setSpacing(4)
         self.setUniformItemSizes(True)
-        self.model_obj = PageStripModel(preview, thumbnail_size)
+        self.model_obj = PageStripModel(preview, thumbnail_size, cache_bytes)
         self.setModel(self.model_obj)
         self.session: Optional[DocumentSession] = None
 
         self.selectionModel().selectionChanged.connect(self._emit_selection)
+        self._visible_timer = QTimer(self)
+        self._visible_timer.setSingleShot(True)
+        self._visible_timer.setInterval(30)
+        self._visible_timer.timeout.connect(self._prioritize_visible)
+        self.verticalScrollBar().valueChanged.connect(self._schedule_prioritize)
+        self.model_obj.modelReset.connect(self._schedule_prioritize)
 
     def set_session(self, session: DocumentSession | None, document) -> None:
         self.session = session
@@ -98,6 +204,26 @@ class PageStrip(QListView):
     def refresh(self) -> None:
         self.model_obj.refresh()
 
+    def reload_source(self) -> None:
+        self.model_obj.reload_source()
+
+    def resizeEvent(self, event) -> None:
+        super().resizeEvent(event)
+        self._schedule_prioritize()
+
+    def _schedule_prioritize(self, *_args) -> None:
+        self._visible_timer.start()
+
+    def _prioritize_visible(self) -> None:
+        rows = self.model_obj.rowCount()
+        if rows == 0:
+            return
+        viewport = self.viewport().rect()
+        first = max(0, self.indexAt(QPoint(viewport.left() + 4, viewport.top() + 4)).row())
+        row_height = max(1, self.sizeHintForRow(0) + 2 * self.spacing())
+        last = min(rows - 1, first + viewport.height() // row_height + 1)
+        self.model_obj.prioritize(first, last)
+
     def selected_rows(self) -> List[int]:
         if not self.selectionModel():
             return []
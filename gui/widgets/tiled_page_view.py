@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from PySide6.QtCore import QPoint, QRect, QRectF, QSize, Qt, Signal, Slot
+from PySide6.QtGui import QImage, QPainter, QPixmap
+from PySide6.QtWidgets import QAbstractScrollArea
+
+from gui.services import PdfPreviewProvider
+from gui.services.thumbnails import PixmapCache
+from gui.services.tile_renderer import TileKey, TileRenderer
+
+# Decoded tiles kept for scrolling back or zooming out and in again.
+TILE_CACHE_BYTES = 128 * 1024 * 1024
+# Long edge (pixels) of the whole-page backdrop stretched under tiles still rendering.
+BACKDROP_PIXELS = 1024
+# Queue priority of the backdrop; visible tiles follow from 0 up, centre first.
+BACKDROP_PRIORITY = -1
+
+
+class TiledPageView(QAbstractScrollArea):
+    """One page at high zoom, rasterized only in the tiles that cover the viewport.
+
+    QPdfView renders a full page image per zoom step (an A4 page at 400% is
+    about 60 MB). Here each paint asks for the visible grid tiles and a
+    `TileRenderer` renders the missing ones on its own thread, centre first;
+    until they arrive a low-resolution backdrop of the whole page (also
+    rendered in the background) stands in. `paintEvent` only blits pixmaps,
+    and tiles scrolled away before their turn are cancelled.
+    """
+
+    pageChanged = Signal(int)
+
+    def __init__(self, preview: PdfPreviewProvider, parent=None) -> None:
+        super().__init__(parent)
+        self.preview = preview
+        self.document = None
+        self.page = 0
+        self.zoom = 1.0
+        self._scaled = QSize()
+        self._tiles = PixmapCache(TILE_CACHE_BYTES)
+        self._backdrop: tuple[int, QPixmap] | None = None
+        self._requested: set[TileKey] = set()
+        self.renderer = TileRenderer(preview, self)
+        self.renderer.tile_ready.connect(self._tile_ready)
+
+    # ------------------------------------------------------------------ API
+    def set_document(self, document, path: Path | None) -> None:
+        """Show `document` (loaded from `path`); also call after the file was reloaded."""
+        self.document = document
+        self.renderer.set_source(path if document is not None else None)
+        self._tiles.clear()
+        self._requested.clear()
+        self._backdrop = None
+        self.page = 0
+        self._relayout()
+
+    def set_page(self, page: int) -> None:
+        """Show the 0-based `page`, scrolled to its top."""
+        count = self.document.pageCount() if self.document is not None else 0
+        page = max(0, min(page, count - 1))
+        if page == self.page and not self._scaled.isEmpty():
+            return
+        self.page = page
+        self._relayout()
+        self.verticalScrollBar().setValue(0)
+        self.pageChanged.emit(page)
+
+    def set_zoom(self, zoom: float) -> None:
+        """Rescale to `zoom`, keeping the point at the centre of the viewport in place."""
+        if zoom == self.zoom and not self._scaled.isEmpty():
+            return
+        view = self.viewport().size()
+        bars = (self.horizontalScrollBar(), self.verticalScrollBar())
+        old = (self._scaled.width(), self._scaled.height())
+        centre = [
+            (bar.value() + extent / 2) / size if size else 0.5
+            for bar, extent, size in zip(bars, (view.width(), view.height()), old)
+        ]
+        self.zoom = zoom
+        self._relayout()
+        new = (self._scaled.width(), self._scaled.height())
+        for bar, fraction, extent, size in zip(bars, centre, (view.width(), view.height()), new):
+            bar.setValue(round(fraction * size - extent / 2))
+
+    # ------------------------------------------------------------------ Qt overrides
+    def resizeEvent(self, event) -> None:  # type: ignore[override]
+        super().resizeEvent(event)
+        self._update_scrollbars()
+
+    def keyPressEvent(self, event) -> None:  # type: ignore[override]
+        bar = self.verticalScrollBar()
+        if event.key() == Qt.Key_PageDown and bar.value() == bar.maximum():
+            self.set_page(self.page + 1)
+            return
+        if event.key() == Qt.Key_PageUp and bar.value() == bar.minimum() and self.page > 0:
+            self.set_page(self.page - 1)
+            bar.setValue(bar.maximum())
+            return
+        super().keyPressEvent(event)
+
+    def paintEvent(self, event) -> None:  # type: ignore[override]
+        painter = QPainter(self.viewport())
+        painter.fillRect(self.viewport().rect(), self.palette().dark())
+        if self._scaled.isEmpty() or self.document is None:
+            painter.end()
+            return
+        origin = self._origin()
+        painter.fillRect(QRect(origin, self._scaled), Qt.white)
+        backdrop = self._backdrop[1] if self._backdrop and self._backdrop[0] == self.page else None
+        missing: list[TileKey] = []
+        for rect in self.preview.tile_rects(self._scaled, self._visible()):
+            target = rect.translated(origin)
+            key = self._key(rect)
+            pixmap = self._tiles.get(key)
+            if pixmap is not None:
+                painter.drawPixmap(target.topLeft(), pixmap)
+                continue
+            if backdrop is not None:
+                sx = backdrop.width() / self._scaled.width()
+                sy = backdrop.height() / self._scaled.height()
+                source = QRectF(rect.x() * sx, rect.y() * sy, rect.width() * sx, rect.height() * sy)
+                painter.drawPixmap(QRectF(target), backdrop, source)
+            missing.append(key)
+        painter.end()
+        self._request(missing, backdrop is None)
+
+    # ------------------------------------------------------------------ Internals
+    def _request(self, missing: list[TileKey], need_backdrop: bool) -> None:
+        """Queue the tiles this paint could not draw; anything else still queued is cancelled."""
+        wanted = list(missing)
+        if need_backdrop:
+            backdrop = self._backdrop_key()
+            wanted.append(backdrop)
+            if backdrop not in self._requested:
+                self.renderer.request(backdrop, BACKDROP_PRIORITY)
+        for priority, key in enumerate(missing):
+            if key not in self._requested:
+                self.renderer.request(key, priority)
+        self._requested = set(wanted)
+        self.renderer.retain(wanted)
+
+    @Slot(object, QImage)
+    def _tile_ready(self, key: TileKey, image: QImage) -> None:
+        self._requested.discard(key)
+        pixmap = QPixmap.fromImage(image)
+        page, width, height, clip = key
+        if clip is None:
+            if page == self.page:
+                self._backdrop = (page, pixmap)
+                self.viewport().update()
+            return
+        self._tiles.put(key, pixmap)
+        if page == self.page and (width, height) == (self._scaled.width(), self._scaled.height()):
+            self.viewport().update(QRect(*clip).translated(self._origin()))
+
+    def _relayout(self) -> None:
+        self._scaled = self._page_size()
+        self._update_scrollbars()
+        self.viewport().update()
+
+    def _page_size(self) -> QSize:
+        if self.document is None or self.document.pageCount() == 0:
+            return QSize()
+        points = self.document.pagePointSize(self.page)
+        scale = self.zoom * self.logicalDpiX() / 72
+        return QSize(max(1, round(points.width() * scale)), max(1, round(points.height() * scale)))
+
+    def _update_scrollbars(self) -> None:
+        view = self.viewport().size()
+        for bar, extent, visible in (
+            (self.horizontalScrollBar(), self._scaled.width(), view.width()),
+            (self.verticalScrollBar(), self._scaled.height(), view.height()),
+        ):
+            bar.setRange(0, max(0, extent - visible))
+            bar.setPageStep(visible)
+            bar.setSingleStep(max(16, visible // 20))
+
+    def _origin(self) -> QPoint:
+        """Viewport position of the page's top-left corner (pages narrower than the view centre)."""
+        view = self.viewport().size()
+        x = max(0, (view.width() - self._scaled.width()) // 2) - self.horizontalScrollBar().value()
+        y = max(0, (view.height() - self._scaled.height()) // 2) - self.verticalScrollBar().value()
+        return QPoint(x, y)
+
+    def _visible(self) -> QRect:
+        """The part of the scaled page inside the viewport, in page pixels."""
+        origin = self._origin()
+        return QRect(-origin.x(), -origin.y(), self.viewport().width(), self.viewport().height())
+
+    def _key(self, rect: QRect) -> TileKey:
+        clip = (rect.x(), rect.y(), rect.width(), rect.height())
+        return self.page, self._scaled.width(), self._scaled.height(), clip
+
+    def _backdrop_key(self) -> TileKey:
+        size = self._scaled.scaled(BACKDROP_PIXELS, BACKDROP_PIXELS, Qt.KeepAspectRatio)
+        return self.page, size.width(), size.height(), None
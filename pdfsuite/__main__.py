@@ -8,7 +8,9 @@ from rich import print
 from pdfsuite import __version__
 from pdfsuite.commands import (
     audit,
+    batch,
     bookmarks,
+    cache,
     compare,
     figure,
     forms,
@@ -31,7 +33,9 @@ app = typer.Typer(add_completion=False, help="All‑FOSS Acrobat‑grade PDF too
 def _register_commands() -> None:
     modules = [
         audit,
+        batch,
         bookmarks,
+        cache,
         compare,
         figure,
         forms,
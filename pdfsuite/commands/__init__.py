@@ -1,6 +1,8 @@
 __all__ = [
     "audit",
+    "batch",
     "bookmarks",
+    "cache",
     "compare",
     "figure",
     "forms",
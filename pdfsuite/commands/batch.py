@@ -0,0 +1,271 @@
+from __future__ import annotations
+
+import contextlib
+import csv
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional
+
+import typer
+
+from pdfsuite.commands.metadata import scrub_metadata
+from pdfsuite.commands.ocr import run_ocr
+from pdfsuite.commands.optimize import PRESETS, STRATEGIES, run_optimize_pipeline
+from pdfsuite.commands.redact import run_redact_safe
+from pdfsuite.commands.stamp import apply_stamp
+from pdfsuite.utils.common import default_jobs, ensure_file
+
+MANIFEST_FIELDS = ("operation", "input", "output")
+# Row key carrying a manifest problem that fails only that job.
+_ROW_ERROR = "__error__"
+
+
+@dataclass
+class BatchJob:
+    index: int
+    operation: str
+    input: Path
+    output: Path
+    options: Dict[str, object] = field(default_factory=dict)
+    error: Optional[str] = None
+
+
+def _optimize(source: Path, output: Path, options: Dict[str, object]) -> None:
+    preset = str(options.get("preset", "report")).lower()
+    if preset not in PRESETS:
+        raise ValueError(f"Unknown preset '{preset}'.")
+    strategy = str(options.get("strategy", "ladder")).lower()
+    if strategy not in STRATEGIES:
+        raise ValueError(f"Unknown strategy '{strategy}'. Choose from {', '.join(STRATEGIES)}.")
+    target = options.get("target_size")
+    run_optimize_pipeline(
+        source,
+        output,
+        preset,
+        target_size_mb=float(target) if target not in (None, "") else None,
+        strategy=strategy,
+        jobs=1,
+    )
+
+
+def _stamp(source: Path, output: Path, options: Dict[str, object]) -> None:
+    bates = options.get("bates")
+    apply_stamp(
+        source,
+        output,
+        bates=str(bates) if bates else None,
+        start=int(options.get("start", 1)),
+    )
+
+
+OPERATIONS: Dict[str, Callable[[Path, Path, Dict[str, object]], None]] = {
+    "optimize": _optimize,
+    "ocr": lambda source, output, _options: run_ocr(source, output),
+    "redact_safe": lambda source, output, _options: run_redact_safe(source, output),
+    "metadata_scrub": lambda source, output, _options: scrub_metadata(source, output),
+    "stamp": _stamp,
+}
+ALIASES = {"redact": "redact_safe", "redact safe": "redact_safe", "metadata": "metadata_scrub"}
+
+
+def register(app: typer.Typer) -> None:
+    @app.command()
+    def batch(
+        manifest: Path = typer.Argument(..., help="JSONL or CSV manifest of jobs."),
+        jobs: int = typer.Option(
+            None,
+            "--jobs",
+            min=1,
+            help="Maximum jobs run in parallel (default: CPU count).",
+        ),
+    ):
+        """Run many page operations from one manifest, streaming JSON results."""
+        entries = load_manifest(ensure_file(manifest, label="manifest"))
+        workers = jobs or default_jobs()
+        started = time.monotonic()
+        results: List[Dict[str, object]] = []
+        for result in run_batch(entries, workers):
+            results.append(result)
+            typer.echo(json.dumps(result))
+        summary = summarize(results, time.monotonic() - started)
+        typer.echo(json.dumps({"summary": summary}))
+        if summary["failed"]:
+            raise typer.Exit(1)
+
+
+def load_manifest(path: Path) -> List[BatchJob]:
+    """Parse a JSONL or CSV manifest; unknown CSV columns become job options."""
+    if path.suffix.lower() == ".csv":
+        rows = _read_csv(path)
+    else:
+        rows = _read_jsonl(path)
+    entries: List[BatchJob] = []
+    for index, row in enumerate(rows, start=1):
+        missing = [name for name in MANIFEST_FIELDS if not row.get(name)]
+        if missing:
+            raise typer.BadParameter(f"Manifest row {index} is missing {', '.join(missing)}.")
+        operation = str(row["operation"]).strip().lower()
+        operation = ALIASES.get(operation, operation)
+        if operation not in OPERATIONS:
+            raise typer.BadParameter(
+                f"Manifest row {index}: unknown operation '{row['operation']}'. "
+                f"Choose from {', '.join(OPERATIONS)}."
+            )
+        error = row.get(_ROW_ERROR)
+        options = row.get("options") or {}
+        if not isinstance(options, dict):
+            error = error or "options must be a JSON object"
+            options = {}
+        options = dict(options)
+        options.update(
+            {
+                key: value
+                for key, value in row.items()
+                if key not in (*MANIFEST_FIELDS, "options", _ROW_ERROR) and value not in (None, "")
+            }
+        )
+        entries.append(
+            BatchJob(
+                index=index,
+                operation=operation,
+                input=Path(str(row["input"])),
+                output=Path(str(row["output"])),
+                options=options,
+                error=str(error) if error else None,
+            )
+        )
+    if not entries:
+        raise typer.BadParameter("Manifest contains no jobs.")
+    return entries
+
+
+def _read_jsonl(path: Path) -> List[Dict[str, object]]:
+    rows = []
+    for number, line in enumerate(path.read_text(encoding="utf-8").splitlines(), start=1):
+        if not line.strip():
+            continue
+        try:
+            rows.append(json.loads(line))
+        except json.JSONDecodeError as exc:
+            raise typer.BadParameter(f"Manifest line {number} is not valid JSON: {exc}") from exc
+    return rows
+
+
+def _read_csv(path: Path) -> List[Dict[str, object]]:
+    with path.open(newline="", encoding="utf-8") as handle:
+        rows: List[Dict[str, object]] = []
+        for row in csv.DictReader(handle):
+            options = row.pop("options", None)
+            parsed: Dict[str, object] = dict(row)
+            if options:
+                try:
+                    parsed["options"] = json.loads(options)
+                except json.JSONDecodeError as exc:
+                    # Fail this row's job, not the whole batch.
+                    parsed[_ROW_ERROR] = f"options column is not valid JSON: {exc}"
+            rows.append(parsed)
+        return rows
+
+
+def run_batch(entries: List[BatchJob], jobs: int) -> Iterator[Dict[str, object]]:
+    """Yield one result per job as it finishes (in-process when ``jobs`` is 1)."""
+    if jobs <= 1 or len(entries) == 1:
+        for entry in entries:
+            with _stdout_to_stderr():
+                result = run_job(entry)
+            yield result
+        return
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_quiet_worker) as pool:
+        futures = {pool.submit(run_job, entry): entry for entry in entries}
+        for future in as_completed(futures):
+            try:
+                result = future.result()
+            except BrokenProcessPool as exc:
+                # A worker died (killed, out of memory); every job it had not finished fails.
+                result = _new_result(futures[future])
+                result.update(
+                    status="failed",
+                    exit_code=1,
+                    error=f"worker process terminated abruptly: {exc}",
+                    seconds=0.0,
+                    input_bytes=_size(futures[future].input),
+                    output_bytes=_size(futures[future].output),
+                )
+            yield result
+
+
+def run_job(entry: BatchJob) -> Dict[str, object]:
+    started = time.monotonic()
+    result = _new_result(entry)
+    try:
+        if entry.error:
+            raise ValueError(entry.error)
+        OPERATIONS[entry.operation](entry.input, entry.output, entry.options)
+    except typer.Exit as exc:
+        result.update(status="failed", exit_code=exc.exit_code)
+    except Exception as exc:  # noqa: BLE001 - report any job failure as a result line
+        result.update(status="failed", exit_code=1, error=str(exc))
+    result["seconds"] = round(time.monotonic() - started, 3)
+    result["input_bytes"] = _size(entry.input)
+    result["output_bytes"] = _size(entry.output)
+    return result
+
+
+def _new_result(entry: BatchJob) -> Dict[str, object]:
+    return {
+        "index": entry.index,
+        "operation": entry.operation,
+        "input": str(entry.input),
+        "output": str(entry.output),
+        "status": "ok",
+        "exit_code": 0,
+    }
+
+
+def summarize(results: List[Dict[str, object]], elapsed: float) -> Dict[str, object]:
+    ok = sum(1 for result in results if result["status"] == "ok")
+    input_bytes = sum(int(result["input_bytes"]) for result in results)
+    return {
+        "jobs": len(results),
+        "ok": ok,
+        "failed": len(results) - ok,
+        "seconds": round(elapsed, 3),
+        "jobs_per_second": round(len(results) / elapsed, 3) if elapsed else None,
+        "input_mb_per_second": (
+            round(input_bytes / (1024 * 1024) / elapsed, 3) if elapsed else None
+        ),
+    }
+
+
+@contextlib.contextmanager
+def _stdout_to_stderr() -> Iterator[None]:
+    """Send Python and child-process output (fd 1) to stderr while an in-process job runs."""
+    sys.stdout.flush()
+    saved = os.dup(1)
+    try:
+        os.dup2(2, 1)
+        with contextlib.redirect_stdout(sys.stderr):
+            yield
+    finally:
+        sys.stderr.flush()
+        os.dup2(saved, 1)
+        os.close(saved)
+
+
+def _quiet_worker() -> None:
+    # Keep tool output and command echoes off stdout so it only carries JSON lines.
+    os.dup2(2, 1)
+    sys.stdout = sys.stderr
+
+
+def _size(path: Path) -> int:
+    try:
+        return path.stat().st_size
+    except OSError:
+        return 0
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import json
+
+import typer
+
+from pdfsuite.utils.cache import ResultCache
+
+cache_app = typer.Typer(help="Inspect or trim the result, thumbnail, and text index caches.")
+
+
+@cache_app.command("stats")
+def cache_stats() -> None:
+    """Show cache location, size, and hit/miss counters."""
+    typer.echo(json.dumps(ResultCache().stats(), indent=2))
+
+
+@cache_app.command("prune")
+def cache_prune(
+    max_size: float = typer.Option(
+        None,
+        "--max-size",
+        min=0,
+        help="Evict least recently used entries until the cache is below this many MB.",
+    ),
+    clear: bool = typer.Option(False, "--all", help="Remove every cached entry."),
+) -> None:
+    """Evict least recently used cache entries.
+
+    `--max-size` applies to the result cache; thumbnail and text index caches
+    are trimmed to their own caps (or emptied with `--all`).
+    """
+    cache = ResultCache()
+    if clear:
+        limit = 0
+    elif max_size is not None:
+        limit = int(max_size * 1024 * 1024)
+    else:
+        limit = cache.max_bytes
+    removed, freed = cache.prune(limit)
+    typer.echo(f"Removed {removed} entries ({freed / (1024 * 1024):.1f} MB).")
+    for name, (removed, freed) in cache.prune_auxiliary(0 if clear else None).items():
+        if removed:
+            typer.echo(f"Removed {removed} {name} entries ({freed / (1024 * 1024):.1f} MB).")
+
+
+def register(app: typer.Typer) -> None:
+    app.add_typer(cache_app, name="cache")
@@ -1,20 +1,49 @@
 from __future__ import annotations
 
+import json
 import shutil
 import subprocess
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from itertools import zip_longest
 from pathlib import Path
-from typing import List
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
 
 import typer
 
+from pdfsuite.core import pixel_diff
+from pdfsuite.core.page_align import (
+    PageSignature,
+    Pair,
+    align_pages,
+    average_hash,
+    text_signature,
+)
+from pdfsuite.core.page_order import PageOrder
+from pdfsuite.core.pixel_diff import PageDiff
+from pdfsuite.core.text_diff import (
+    TextDiffReport,
+    diff_texts,
+    render_html,
+    report_payload,
+)
+from pdfsuite.core.text_index import TextExtractionError, extract_page_texts
+from pdfsuite.utils.backend import BackendError, native_backend, page_fingerprints
 from pdfsuite.utils.common import (
+    default_jobs,
     ensure_file,
     ensure_output_dir,
     require_tools,
+    run,
     run_or_exit,
     shell_quote,
     temporary_directory,
 )
+from pdfsuite.utils.pdf_text import write_summary_page
+
+# Pages per pdftocairo run; both documents are rendered chunk by chunk in parallel.
+RASTER_CHUNK_PAGES = 8
+# Long edge (pixels) of the page thumbnails hashed for page alignment.
+THUMBNAIL_PIXELS = 64
 
 
 def register(app: typer.Typer) -> None:
@@ -28,12 +57,67 @@ def register(app: typer.Typer) -> None:
             "--headless",
             help="Force Poppler/ImageMagick pipeline instead of diff-pdf.",
         ),
+        report: Optional[Path] = typer.Option(
+            None,
+            "--report",
+            help="Write per-page difference scores and changed regions as JSON (--headless).",
+        ),
+        jobs: Optional[int] = typer.Option(
+            None,
+            "--jobs",
+            min=1,
+            help="Concurrent pdftocairo processes for --headless (default: CPU count).",
+        ),
+        skip_identical: bool = typer.Option(
+            True,
+            "--skip-identical/--all-pages",
+            help="Skip rasterizing pages whose content fingerprints match (--headless).",
+        ),
+        align: bool = typer.Option(
+            False,
+            "--align",
+            help="Match pages by text/thumbnail signatures even when page counts are equal "
+            "(--headless; always on when they differ).",
+        ),
+        text: bool = typer.Option(
+            False,
+            "--text",
+            help="Word-level diff of extracted page text, no rasterization; "
+            "-o is an HTML report (JSON when it ends in .json).",
+        ),
     ):
         """Compare PDFs via diff-pdf (preferred) or Poppler/ImageMagick."""
         left = ensure_file(first, label="first PDF")
         right = ensure_file(second, label="second PDF")
-        if headless:
-            headless_diff(left, right, output)
+        if text:
+            ignored = [
+                flag
+                for flag, used in (
+                    ("--headless", headless),
+                    ("--report", report is not None),
+                    ("--align", align),
+                    ("--all-pages", not skip_identical),
+                    ("--jobs", jobs is not None),
+                )
+                if used
+            ]
+            if ignored:
+                raise typer.BadParameter(
+                    f"--text cannot be combined with {', '.join(ignored)}; "
+                    "it always aligns pages and writes its report to -o."
+                )
+            text_report(left, right, output)
+            return
+        if headless or report is not None or align:
+            headless_diff(
+                left,
+                right,
+                output,
+                report=report,
+                jobs=jobs,
+                skip_identical=skip_identical,
+                align=align,
+            )
             return
 
         diff_pdf = shutil.which("diff-pdf")
@@ -50,8 +134,7 @@ def register(app: typer.Typer) -> None:
         if diffpdf_gui:
             require_tools("diffpdf")
             typer.echo(
-                "diff-pdf CLI not found. Launching diffpdf GUI "
-                "for manual comparison.",
+                "diff-pdf CLI not found. Launching diffpdf GUI for manual comparison.",
                 err=True,
             )
             cmd = f"diffpdf {shell_quote(left)} {shell_quote(right)}"
@@ -66,53 +149,346 @@ def register(app: typer.Typer) -> None:
         raise typer.Exit(1)
 
 
-def headless_diff(first: Path, second: Path, output: Path) -> None:
-    require_tools("pdftocairo", "compare", "img2pdf")
-    with temporary_directory("pdfsuite-compare-") as tmp:
-        a_dir = ensure_output_dir(tmp / "a")
-        b_dir = ensure_output_dir(tmp / "b")
-        diff_dir = ensure_output_dir(tmp / "diff")
-
-        a_pages = render_pngs(first, a_dir / "page")
-        b_pages = render_pngs(second, b_dir / "page")
+def headless_diff(
+    first: Path,
+    second: Path,
+    output: Path,
+    *,
+    report: Optional[Path] = None,
+    jobs: Optional[int] = None,
+    skip_identical: bool = True,
+    align: bool = False,
+) -> Dict[int, Optional[PageDiff]]:
+    """Rasterize both PDFs, diff each page pair, and bundle the diff images into `output`.
 
-        if len(a_pages) != len(b_pages):
-            typer.echo(
-                "Inputs have different page counts; cannot compare headlessly.",
-                err=True,
-            )
+    Pages are diffed in-process with NumPy when the ``pixel`` extra is
+    installed (no ImageMagick needed); scores are only available on that path.
+    Rasterization runs in page chunks for both documents at once, and each
+    page is diffed (and its rasters deleted) as soon as both sides exist.
+    With `skip_identical`, pages whose content fingerprints match are reported
+    as unchanged and never rasterized; if no page is left to diff, `output`
+    is a one-page summary instead. When the page counts differ (or with
+    `align`), pages are first matched by text and thumbnail signatures so
+    inserted and deleted pages are reported instead of diffing shifted pairs.
+    Returns the diffed pages' results, keyed by first-document page.
+    """
+    in_process = pixel_diff.available()
+    require_tools("pdftocairo", "img2pdf", *(() if in_process else ("compare",)))
+    a_total, b_total = count_pages(first), count_pages(second)
+    for pdf, total in ((first, a_total), (second, b_total)):
+        if not total:
+            typer.echo(f"Could not read a page count for {pdf}", err=True)
             raise typer.Exit(1)
 
-        diff_pages: List[Path] = []
-        for idx, (a_img, b_img) in enumerate(zip(a_pages, b_pages), start=1):
-            diff_img = diff_dir / f"diff-{idx:03d}.png"
-            cmd = (
-                f"compare -highlight-color blue "
-                f"{shell_quote(a_img)} {shell_quote(b_img)} {shell_quote(diff_img)}"
+    if align or a_total != b_total:
+        pairs = aligned_pairs(first, second, a_total, b_total)
+    else:
+        pairs = [(page, page) for page in range(1, a_total + 1)]
+    matched = [(a, b) for a, b in pairs if a is not None and b is not None]
+    deleted = [a for a, b in pairs if b is None]
+    inserted = [b for a, b in pairs if a is None]
+    listed = (("Deleted from", first, deleted), ("Inserted in", second, inserted))
+    if deleted or inserted or a_total != b_total:
+        typer.echo(
+            f"Aligned {len(matched)} page pair(s); "
+            f"{len(deleted)} deleted from {first.name}, {len(inserted)} inserted in {second.name}."
+        )
+        for verb, pdf, pages in listed:
+            if pages:
+                typer.echo(f"  {verb} {pdf.name}: page(s) {PageOrder(pages).spec()}")
+
+    unchanged = identical_pairs(first, second, matched, a_total, b_total) if skip_identical else []
+    skipped = set(unchanged)
+    changed = [pair for pair in matched if pair not in skipped]
+    partners = dict(changed)
+    if unchanged:
+        typer.echo(
+            f"{len(unchanged)} of {len(matched)} page(s) unchanged (content fingerprints match); "
+            f"diffing {len(changed)}."
+        )
+    scores: Dict[int, Optional[PageDiff]] = {}
+    details = {
+        "unchanged": [a for a, _ in unchanged],
+        "deleted": deleted,
+        "inserted": inserted,
+        "partners": partners,
+    }
+    if not changed:
+        # `-o` is always produced: a one-page summary stands in for the diff images.
+        summary = f"No differences in {len(matched)} matched page(s)"
+        output.parent.mkdir(parents=True, exist_ok=True)
+        lines = [f"A: {first.name} ({a_total} pages)", f"B: {second.name} ({b_total} pages)", ""]
+        lines.append(f"{summary}.")
+        if unchanged:
+            lines.append(
+                f"{len(unchanged)} page(s) skipped because their content fingerprints match."
             )
-            result = subprocess.run(cmd, shell=True)
-            if result.returncode not in (0, 1):
-                raise typer.Exit(result.returncode)
-            if not diff_img.exists():
-                diff_img.touch()
-            diff_pages.append(diff_img)
+        for verb, pdf, pages in listed:
+            if pages:
+                lines.append(f"{verb} {pdf.name}: page(s) {PageOrder(pages).spec()}")
+        write_summary_page(output, "pdfsuite compare", lines)
+        typer.echo(f"{summary}; wrote a summary page to {output}.")
+        if report is not None:
+            write_report(report, first, second, scores, **details)
+        return scores
+
+    with temporary_directory("pdfsuite-compare-") as tmp:
+        diff_dir = ensure_output_dir(tmp / "diff")
+        width = len(str(a_total))
+        diff_pages: Dict[int, Path] = {}
+        rasters = stream_rasters(first, second, changed, tmp, jobs or default_jobs())
+        for idx, other, a_img, b_img in rasters:
+            diff_img = diff_dir / f"diff-{idx:0{width}d}.png"
+            label = f"page {idx}" if idx == other else f"page {idx} -> {other}"
+            if in_process:
+                page = pixel_diff.diff_images(a_img, b_img, diff_img, page=idx)
+                typer.echo(f"{label}: {page.score:.2%} changed, {len(page.boxes)} region(s)")
+                scores[idx] = page
+            else:
+                magick_diff(a_img, b_img, diff_img)
+                scores[idx] = None
+            a_img.unlink(missing_ok=True)
+            b_img.unlink(missing_ok=True)
+            diff_pages[idx] = diff_img
 
         if not diff_pages:
             typer.echo("No diff images produced.", err=True)
             raise typer.Exit(1)
 
-        files = " ".join(shell_quote(path) for path in sorted(diff_pages))
+        files = " ".join(shell_quote(diff_pages[idx]) for idx in sorted(diff_pages))
         cmd = f"img2pdf {files} -o {shell_quote(output)}"
         run_or_exit(cmd)
+    scores = {idx: scores[idx] for idx in sorted(scores)}
+    if report is not None:
+        write_report(report, first, second, scores, **details)
+    return scores
+
 
+def text_report(first: Path, second: Path, output: Path) -> TextDiffReport:
+    """Word-diff the extracted text of both PDFs and write an HTML or JSON change report.
 
-def render_pngs(pdf: Path, prefix: Path) -> List[Path]:
-    prefix.parent.mkdir(parents=True, exist_ok=True)
-    cmd = f"pdftocairo -png {shell_quote(pdf)} {shell_quote(prefix)}"
-    run_or_exit(cmd)
-    parent = prefix.parent
-    images = sorted(parent.glob(f"{prefix.name}-*.png"))
-    if not images:
-        typer.echo(f"No rasterized pages produced for {pdf}", err=True)
+    Each document's text comes from a single extraction pass (both run at
+    once), pages are aligned so insertions do not shift later pages, and
+    nothing is rasterized, so this is a quick first pass before a pixel diff.
+    """
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        futures = [pool.submit(extract_page_texts, pdf) for pdf in (first, second)]
+        try:
+            a_texts, b_texts = (future.result() for future in futures)
+        except TextExtractionError as exc:
+            typer.echo(f"Text extraction failed: {exc}", err=True)
+            raise typer.Exit(1)
+    report = diff_texts(a_texts, b_texts)
+    for page in report.pages:
+        typer.echo(f"{page.label}: +{page.added}/-{page.removed} word(s)")
+    typer.echo(
+        f"{len(report.changed)} changed, {len(report.inserted)} inserted, "
+        f"{len(report.deleted)} deleted, {len(report.unchanged)} unchanged page(s)."
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    if output.suffix.lower() == ".json":
+        payload = report_payload(report, str(first), str(second))
+        output.write_text(json.dumps(payload, indent=2, ensure_ascii=False), encoding="utf-8")
+    else:
+        output.write_text(render_html(report, first.name, second.name), encoding="utf-8")
+    typer.echo(f"Text change report written to {output}")
+    return report
+
+
+def identical_pairs(
+    first: Path,
+    second: Path,
+    pairs: Sequence[Tuple[int, int]],
+    a_total: int,
+    b_total: int,
+) -> List[Tuple[int, int]]:
+    """Page pairs whose content stream and resource fingerprints match.
+
+    Needs a native backend for real per-page hashes; without one only
+    byte-identical files match (the fallback hashes are file-based).
+    """
+    a_prints = page_fingerprints(first, a_total)
+    b_prints = page_fingerprints(second, b_total)
+    if len(a_prints) != a_total or len(b_prints) != b_total:
+        return []
+    return [(a, b) for a, b in pairs if a_prints[a - 1] == b_prints[b - 1]]
+
+
+def aligned_pairs(first: Path, second: Path, a_total: int, b_total: int) -> List[Pair]:
+    """Match the pages of two revisions by text hash and thumbnail hash (see `align_pages`)."""
+    with temporary_directory("pdfsuite-align-") as tmp:
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            a_future = pool.submit(page_signatures, first, a_total, tmp / "a")
+            b_future = pool.submit(page_signatures, second, b_total, tmp / "b")
+            return align_pages(a_future.result(), b_future.result())
+
+
+def page_signatures(pdf: Path, total: int, directory: Path) -> List[PageSignature]:
+    """Per-page alignment signatures: one text extraction and one thumbnail pass per file."""
+    try:
+        texts = extract_page_texts(pdf)
+    except TextExtractionError:
+        texts = []
+    texts = (texts + [""] * total)[:total]
+    visuals = thumbnail_hashes(pdf, total, directory)
+    return [PageSignature(text_signature(text), visual) for text, visual in zip(texts, visuals)]
+
+
+def thumbnail_hashes(pdf: Path, total: int, directory: Path) -> List[Optional[int]]:
+    """Average hash of a tiny grayscale render of every page (None without Pillow)."""
+    hashes: List[Optional[int]] = [None] * total
+    if not pixel_diff.available() or not shutil.which("pdftocairo"):
+        return hashes
+    from PIL import Image
+
+    directory.mkdir(parents=True, exist_ok=True)
+    code = run(
+        f"pdftocairo -png -gray -scale-to {THUMBNAIL_PIXELS} "
+        f"{shell_quote(pdf)} {shell_quote(directory / 'thumb')}"
+    )
+    if code != 0:
+        return hashes
+    for path in directory.glob("thumb-*.png"):
+        page = int(path.stem.rsplit("-", 1)[1])
+        if 1 <= page <= total:
+            with Image.open(path) as image:
+                small = image.convert("L").resize((8, 8), Image.BOX)
+                hashes[page - 1] = average_hash(list(small.getdata()))
+    return hashes
+
+
+def count_pages(pdf: Path) -> int:
+    backend = native_backend()
+    if backend is not None:
+        try:
+            return backend.page_count(pdf)
+        except BackendError:
+            pass
+    result = subprocess.run(["pdfinfo", str(pdf)], capture_output=True, text=True)
+    for line in result.stdout.splitlines():
+        key, _, value = line.partition(":")
+        if key.strip() == "Pages" and value.strip().isdigit():
+            return int(value.strip())
+    return 0
+
+
+def page_chunks(pages: Sequence[int], size: Optional[int] = None) -> List[Tuple[int, int]]:
+    """Group sorted page numbers into contiguous (first, last) spans of at most `size` pages."""
+    size = size or RASTER_CHUNK_PAGES
+    chunks: List[Tuple[int, int]] = []
+    for page in pages:
+        if chunks and page == chunks[-1][1] + 1 and page - chunks[-1][0] < size:
+            chunks[-1] = (chunks[-1][0], page)
+        else:
+            chunks.append((page, page))
+    return chunks
+
+
+def render_chunk(pdf: Path, directory: Path, first: int, last: int) -> Dict[int, Path]:
+    """Rasterize pages `first`..`last` of `pdf` into `directory`; returns page -> PNG."""
+    directory.mkdir(parents=True, exist_ok=True)
+    code = run(
+        f"pdftocairo -png -f {first} -l {last} {shell_quote(pdf)} "
+        f"{shell_quote(directory / 'page')}"
+    )
+    if code != 0:
+        raise typer.Exit(code)
+    rasters = {int(path.stem.rsplit("-", 1)[1]): path for path in directory.glob("page-*.png")}
+    missing = [page for page in range(first, last + 1) if page not in rasters]
+    if missing:
+        typer.echo(f"No rasterized page {missing[0]} produced for {pdf}", err=True)
         raise typer.Exit(1)
-    return images
+    return rasters
+
+
+def stream_rasters(
+    first: Path,
+    second: Path,
+    pairs: Sequence[Tuple[int, int]],
+    workdir: Path,
+    jobs: int,
+) -> Iterator[Tuple[int, int, Path, Path]]:
+    """Yield (first page, second page, first raster, second raster) once both sides exist.
+
+    `pairs` must ascend on both sides (as aligned pairs do). Each document's
+    pages are rendered in chunks, interleaved between the two documents, on
+    `jobs` concurrent pdftocairo processes. At most ``2 * jobs`` chunks are in
+    flight, so rasters waiting on disk stay bounded while the caller diffs and
+    deletes them.
+    """
+    sides = (first, second)
+    spans = [page_chunks([pair[side] for pair in pairs]) for side in (0, 1)]
+    chunks = iter(
+        [(side, *span) for both in zip_longest(*spans) for side, span in enumerate(both) if span]
+    )
+    ready: Tuple[Dict[int, Path], Dict[int, Path]] = ({}, {})
+    partner = ({a: b for a, b in pairs}, {b: a for a, b in pairs})
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        pending: Dict[Future, int] = {}
+
+        def submit_next() -> None:
+            chunk = next(chunks, None)
+            if chunk is not None:
+                side, lo, hi = chunk
+                directory = workdir / f"{'ab'[side]}-{lo}"
+                pending[pool.submit(render_chunk, sides[side], directory, lo, hi)] = side
+
+        for _ in range(2 * max(1, jobs)):
+            submit_next()
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                side = pending.pop(future)
+                rasters = future.result()
+                ready[side].update(rasters)
+                for page in sorted(rasters):
+                    other = partner[side].get(page)
+                    if other is not None and other in ready[1 - side]:
+                        a, b = (page, other) if side == 0 else (other, page)
+                        yield a, b, ready[0].pop(a), ready[1].pop(b)
+                submit_next()
+
+
+def magick_diff(a_img: Path, b_img: Path, diff_img: Path) -> None:
+    cmd = (
+        f"compare -highlight-color blue "
+        f"{shell_quote(a_img)} {shell_quote(b_img)} {shell_quote(diff_img)}"
+    )
+    result = subprocess.run(cmd, shell=True)
+    if result.returncode not in (0, 1):
+        raise typer.Exit(result.returncode)
+    if not diff_img.exists():
+        diff_img.touch()
+
+
+def write_report(
+    report: Path,
+    first: Path,
+    second: Path,
+    pages: Dict[int, Optional[PageDiff]],
+    unchanged: Sequence[int] = (),
+    deleted: Sequence[int] = (),
+    inserted: Sequence[int] = (),
+    partners: Optional[Dict[int, int]] = None,
+) -> None:
+    """JSON report; page numbers are first-document pages unless named otherwise.
+
+    `partners` maps a diffed first-document page to its aligned page in the
+    second document; `inserted` pages are second-document page numbers.
+    """
+    partners = partners or {}
+    entries = []
+    for idx, page in pages.items():
+        entry = page.to_dict() if page else {"page": idx, "score": None}
+        entry["second_page"] = partners.get(idx, idx)
+        entries.append(entry)
+    payload = {
+        "first": str(first),
+        "second": str(second),
+        "unchanged": list(unchanged),
+        "deleted": list(deleted),
+        "inserted": list(inserted),
+        "pages": entries,
+    }
+    report.parent.mkdir(parents=True, exist_ok=True)
+    report.write_text(json.dumps(payload, indent=2), encoding="utf-8")
@@ -2,17 +2,27 @@ from pathlib import Path
 
 import typer
 
+from pdfsuite.utils.backend import native_backend, run_native_or_exit
 from pdfsuite.utils.common import ensure_file, run_or_exit, require_tools, shell_quote
 
 
 def register(app: typer.Typer) -> None:
-    @app.command(help="Merge PDFs with qpdf.")
+    @app.command(help="Merge PDFs with qpdf (or pikepdf/pypdf in-process).")
     def merge(
         inputs: list[Path] = typer.Argument(..., help="Input PDFs in desired order."),
         output: Path = typer.Option(..., "-o", help="Merged PDF output."),
     ) -> None:
-        require_tools("qpdf")
         safe_inputs = [ensure_file(path, label="input PDF") for path in inputs]
+        backend = native_backend()
+        if backend is not None:
+            segments = [(path, ["1-z"]) for path in safe_inputs]
+            run_native_or_exit(
+                backend,
+                f"merge {len(safe_inputs)} files -> {output}",
+                lambda: backend.assemble(segments, output),
+            )
+            return
+        require_tools("qpdf")
         segments = " ".join(f"{shell_quote(path)} 1-z" for path in safe_inputs)
         cmd = f"qpdf --empty --pages {segments} -- {shell_quote(output)}"
         run_or_exit(cmd)
@@ -13,8 +13,12 @@ def register(app: typer.Typer) -> None:
         output: Path = typer.Option(..., "-o", help="Metadata-clean output"),
     ):
         """Remove metadata using MAT2."""
-        require_tools("mat2")
-        source = ensure_file(input, label="input PDF")
-        shutil.copy2(source, output)
-        cmd = f"mat2 --inplace {shell_quote(output)}"
-        run_or_exit(cmd)
+        scrub_metadata(input, output)
+
+
+def scrub_metadata(input: Path, output: Path) -> None:
+    require_tools("mat2")
+    source = ensure_file(input, label="input PDF")
+    shutil.copy2(source, output)
+    cmd = f"mat2 --inplace {shell_quote(output)}"
+    run_or_exit(cmd)
@@ -12,6 +12,10 @@ def register(app: typer.Typer) -> None:
         output: Path = typer.Option(..., "-o", help="Output PDF"),
     ):
         """Add searchable text layer using OCRmyPDF."""
-        require_tools("ocrmypdf")
-        cmd = f"ocrmypdf {shell_quote(input)} {shell_quote(output)}"
-        run_or_exit(cmd)
+        run_ocr(input, output)
+
+
+def run_ocr(input: Path, output: Path) -> None:
+    require_tools("ocrmypdf")
+    cmd = f"ocrmypdf {shell_quote(input)} {shell_quote(output)}"
+    run_or_exit(cmd)
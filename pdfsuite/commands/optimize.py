@@ -1,19 +1,42 @@
 from __future__ import annotations
 
+import shutil
+import subprocess
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Set
 
 import typer
 
+from pdfsuite.utils.cache import ResultCache, tool_version
 from pdfsuite.utils.common import (
+    default_jobs,
     ensure_file,
+    get_page_count,
     require_tools,
     run_or_exit,
     shell_quote,
+    spawn,
     temporary_directory,
 )
 
+STRATEGIES = ("ladder", "parallel", "predict")
+PREDICT_SAMPLE_PAGES = 3
+PREDICT_MIN_RESOLUTION = 72
+PREDICT_SAFETY = 0.95
+PREDICT_HEADROOM = 0.85
+# Final pass over reassembled chunks: subset fonts once, leave images as they are.
+SUBSET_FONT_FLAGS = [
+    "-dSubsetFonts=true",
+    "-dCompressFonts=true",
+    "-dDownsampleColorImages=false",
+    "-dDownsampleGrayImages=false",
+    "-dDownsampleMonoImages=false",
+    "-dPassThroughJPEGImages=true",
+]
+
 PRESETS: Dict[str, Dict[str, object]] = {
     "email": {
         "base_flags": [
@@ -59,16 +82,55 @@ def register(app: typer.Typer) -> None:
             min=0.1,
             help="Optional size target in MB; retries with stronger compression if needed.",
         ),
+        strategy: str = typer.Option(
+            "ladder",
+            "--strategy",
+            case_sensitive=False,
+            help=(
+                "Target-size search: ladder (one resolution at a time), parallel (all at once) "
+                "or predict (fit size vs. DPI on sample pages)."
+            ),
+        ),
+        jobs: int = typer.Option(
+            None,
+            "--jobs",
+            min=1,
+            help="Maximum concurrent Ghostscript processes (default: CPU count).",
+        ),
+        chunk_pages: int = typer.Option(
+            None,
+            "--chunk-pages",
+            min=1,
+            help="Compress N-page chunks in parallel and reassemble them with qpdf.",
+        ),
+        no_cache: bool = typer.Option(
+            False,
+            "--no-cache",
+            help="Skip the result cache (always run Ghostscript).",
+        ),
     ):
         """Compress/flatten PDFs via Ghostscript + qpdf linearization."""
         preset_key = preset.lower()
         if preset_key not in PRESETS:
-            raise typer.BadParameter(f"Unknown preset '{preset}'. Choose from {', '.join(PRESETS)}.")
+            raise typer.BadParameter(
+                f"Unknown preset '{preset}'. Choose from {', '.join(PRESETS)}."
+            )
+        strategy_key = strategy.lower()
+        if strategy_key not in STRATEGIES:
+            raise typer.BadParameter(
+                f"Unknown strategy '{strategy}'. Choose from {', '.join(STRATEGIES)}."
+            )
+        if chunk_pages and strategy_key == "parallel":
+            raise typer.BadParameter("--chunk-pages cannot be combined with --strategy parallel.")
         run_optimize_pipeline(
             ensure_file(input, label="input PDF"),
             output,
             preset_key,
             target_size_mb=target_size,
+            strategy=strategy_key,
+            jobs=jobs,
+            chunk_pages=chunk_pages,
+            use_cache=not no_cache,
         )
 
 
@@ -78,18 +140,110 @@ def run_optimize_pipeline(
     preset: str,
     *,
     target_size_mb: float | None = None,
+    strategy: str = "ladder",
+    jobs: int | None = None,
+    chunk_pages: int | None = None,
+    use_cache: bool = True,
 ) -> None:
     require_tools("gs", "qpdf")
+    if chunk_pages:
+        require_tools("pdfcpu")
+    cache = ResultCache() if use_cache else None
+    cache_key = None
+    if cache is not None:
+        tools = ["gs", "qpdf", "pdfcpu"] if chunk_pages else ["gs", "qpdf"]
+        cache_key = cache.key(
+            source,
+            operation="optimize",
+            preset=preset,
+            flags=PRESETS[preset],
+            target_size_mb=target_size_mb,
+            strategy=strategy if target_size_mb else "ladder",
+            chunk_pages=chunk_pages,
+            tools={tool: tool_version(tool) for tool in tools},
+        )
+        cached = cache.lookup(cache_key)
+        report_cache(cache, "hit" if cached else "miss", cache_key)
+        if cached:
+            try:
+                shutil.copyfile(cached, output)
+                return
+            except FileNotFoundError:
+                # Another process pruned the entry after the lookup; rebuild it below.
+                typer.echo(f"[dim]cache[/dim] {cache_key[:12]} was evicted; rebuilding.")
+    build_optimized(
+        source,
+        output,
+        preset,
+        target_size_mb=target_size_mb,
+        strategy=strategy,
+        jobs=jobs,
+        chunk_pages=chunk_pages,
+    )
+    if cache is not None and cache_key:
+        cache.store(cache_key, output)
+
+
+def report_cache(cache: ResultCache, outcome: str, key: str) -> None:
+    counters = cache.counters()
+    typer.echo(
+        f"[dim]cache[/dim] {outcome} {key[:12]} "
+        f"(hits {counters.get('hits', 0)}, misses {counters.get('misses', 0)})"
+    )
+
+
+def build_optimized(
+    source: Path,
+    output: Path,
+    preset: str,
+    *,
+    target_size_mb: float | None = None,
+    strategy: str = "ladder",
+    jobs: int | None = None,
+    chunk_pages: int | None = None,
+) -> None:
     config = PRESETS[preset]
     target_bytes = int(target_size_mb * 1024 * 1024) if target_size_mb else None
     attempts = len(config["resolutions"])
     achieved = False
     with temporary_directory("pdfsuite-optimize-") as tmpdir:
+        chunks = split_chunks(source, tmpdir, chunk_pages) if chunk_pages else []
+        if target_bytes and strategy == "parallel":
+            chosen = run_parallel_attempts(
+                source,
+                config,
+                tmpdir,
+                target_bytes,
+                jobs=jobs or default_jobs(),
+            )
+            linearize(chosen, output)
+            achieved = file_size(chosen) <= target_bytes
+            warn_target_missed(target_size_mb, output, achieved)
+            return
+        if target_bytes and strategy == "predict":
+            chosen = run_predicted_attempts(
+                source,
+                config,
+                tmpdir,
+                target_bytes,
+                chunks=chunks,
+                jobs=jobs or default_jobs(),
+            )
+            linearize(chosen, output)
+            achieved = file_size(chosen) <= target_bytes
+            warn_target_missed(target_size_mb, output, achieved)
+            return
         intermediate = tmpdir / "optimized.pdf"
         for attempt in range(attempts):
             flags = build_gs_flags(config, attempt)
-            gs_cmd = build_gs_command(source, intermediate, flags)
-            run_or_exit(gs_cmd)
+            compress(
+                source,
+                intermediate,
+                flags,
+                tmpdir,
+                chunks=chunks,
+                jobs=jobs or default_jobs(),
+            )
             linearize(intermediate, output)
             if not target_bytes:
                 achieved = True
@@ -98,18 +252,291 @@ def run_optimize_pipeline(
             if size and size <= target_bytes:
                 achieved = True
                 break
-        if target_bytes and not achieved:
-            typer.echo(
-                f"[yellow]Warning:[/yellow] target size "
-                f"{target_size_mb:.1f} MB not reached (result {size_bytes_to_mb(file_size(output)):.1f} MB).",
-                err=True,
-            )
+        warn_target_missed(target_size_mb, output, achieved)
+
+
+def run_parallel_attempts(
+    source: Path,
+    config: Dict[str, object],
+    workdir: Path,
+    target_bytes: int,
+    *,
+    jobs: int,
+) -> Path:
+    """Run every preset resolution concurrently and return the best candidate.
+
+    The best candidate is the highest-resolution result that fits under the
+    target. As soon as one attempt fits, every lower-resolution attempt is
+    cancelled because it can only produce a worse result. When nothing fits,
+    the smallest (last) attempt is returned, mirroring the ladder strategy.
+    """
+    attempts = len(config["resolutions"])  # type: ignore[arg-type]
+    candidates = [workdir / f"optimized-{attempt + 1}.pdf" for attempt in range(attempts)]
+    processes: Dict[int, subprocess.Popen] = {}
+    cancelled: Set[int] = set()
+    fitting: Set[int] = set()
+    lock = threading.Lock()
+
+    def attempt_worker(attempt: int) -> int | None:
+        with lock:
+            if attempt in cancelled:
+                return None
+            flags = build_gs_flags(config, attempt)
+            processes[attempt] = spawn(build_gs_command(source, candidates[attempt], flags))
+        return processes[attempt].wait()
+
+    def cancel(targets: List[int]) -> None:
+        with lock:
+            for attempt in targets:
+                cancelled.add(attempt)
+                process = processes.get(attempt)
+                if process is not None and process.poll() is None:
+                    process.terminate()
+
+    pending = list(range(attempts))
+    with ThreadPoolExecutor(max_workers=max(1, min(jobs, attempts))) as pool:
+        running: Dict[Future, int] = {}
+        while pending or running:
+            while pending and len(running) < jobs:
+                attempt = pending.pop(0)
+                if attempt not in cancelled:
+                    running[pool.submit(attempt_worker, attempt)] = attempt
+            if not running:
+                break
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                attempt = running.pop(future)
+                code = future.result()
+                if code is None or attempt in cancelled:
+                    continue
+                if code != 0:
+                    cancel(list(range(attempts)))
+                    raise typer.Exit(code)
+                if file_size(candidates[attempt]) <= target_bytes:
+                    fitting.add(attempt)
+                    cancel(list(range(attempt + 1, attempts)))
+    if fitting:
+        return candidates[min(fitting)]
+    return candidates[-1]
+
+
+def run_predicted_attempts(
+    source: Path,
+    config: Dict[str, object],
+    workdir: Path,
+    target_bytes: int,
+    *,
+    chunks: List[Path] | None = None,
+    jobs: int = 1,
+) -> Path:
+    """Predict the resolution that meets the target instead of walking the ladder.
+
+    A few evenly spaced pages are compressed at the preset's highest and lowest
+    resolutions to fit ``size = a + b * dpi**2`` (image bytes scale with pixel
+    area). The full document is compressed once at the predicted DPI, followed
+    by at most one correction pass refitted from the real result: downwards if
+    the target was missed, upwards if it was met with plenty of headroom.
+    """
+    resolutions: List[int] = config["resolutions"]  # type: ignore[assignment]
+    high, low = max(resolutions), min(resolutions)
+    total = get_page_count(source)
+    pages = sample_page_numbers(total, PREDICT_SAMPLE_PAGES)
+    fixed, per_dpi2 = 0.0, 0.0
+    predicted = high
+    if pages:
+        sample = workdir / "sample.pdf"
+        page_spec = ",".join(str(page) for page in pages)
+        run_or_exit(
+            f"qpdf {shell_quote(source)} --pages {shell_quote(source)} {page_spec} "
+            f"-- {shell_quote(sample)}"
+        )
+        sample_sizes: Dict[int, int] = {}
+        for res in (high, low):
+            sample_out = workdir / f"sample-{res}.pdf"
+            flags = build_gs_flags_for_resolution(config, res)
+            run_or_exit(build_gs_command(sample, sample_out, flags))
+            sample_sizes[res] = file_size(sample_out)
+        scale = total / len(pages)
+        fixed, per_dpi2 = fit_size_curve(
+            (high, sample_sizes[high] * scale),
+            (low, sample_sizes[low] * scale),
+        )
+        predicted = predict_resolution(fixed, per_dpi2, target_bytes, high)
+    else:
+        typer.echo(
+            "Unable to detect page count; starting from the top preset resolution.", err=True
+        )
+    typer.echo(f"[dim]optimize[/dim] Predicted {predicted} dpi for the size target.")
+
+    first = workdir / "optimized-1.pdf"
+    compress(
+        source,
+        first,
+        build_gs_flags_for_resolution(config, predicted),
+        workdir,
+        chunks=chunks,
+        jobs=jobs,
+    )
+    first_size = file_size(first)
+    fits = first_size <= target_bytes
+    if fits and (first_size >= target_bytes * PREDICT_HEADROOM or predicted >= high):
+        return first
+
+    # Refit the DPI-dependent term from the real full-document measurement.
+    if first_size > fixed:
+        per_dpi2 = (first_size - fixed) / (predicted**2)
+    corrected = predict_resolution(fixed, per_dpi2, target_bytes, high)
+    if corrected == predicted:
+        return first
+    typer.echo(
+        f"[dim]optimize[/dim] Correcting to {corrected} dpi (first pass {first_size} bytes)."
+    )
+    second = workdir / "optimized-2.pdf"
+    compress(
+        source,
+        second,
+        build_gs_flags_for_resolution(config, corrected),
+        workdir,
+        chunks=chunks,
+        jobs=jobs,
+    )
+    second_size = file_size(second)
+    if second_size <= target_bytes and (not fits or corrected > predicted):
+        return second
+    if fits:
+        return first
+    return second
+
+
+def compress(
+    source: Path,
+    destination: Path,
+    flags: List[str],
+    workdir: Path,
+    *,
+    chunks: List[Path] | None = None,
+    jobs: int = 1,
+) -> None:
+    if chunks:
+        compress_chunked(chunks, destination, flags, workdir, jobs=jobs)
+    else:
+        run_or_exit(build_gs_command(source, destination, flags))
+
+
+def split_chunks(source: Path, workdir: Path, chunk_pages: int) -> List[Path]:
+    """Split ``source`` into ``chunk_pages``-page files once for every attempt.
+
+    Returns an empty list when the document fits in a single chunk, in which
+    case callers compress the source directly.
+    """
+    if get_page_count(source) <= chunk_pages:
+        return []
+    chunk_dir = workdir / "chunks"
+    chunk_dir.mkdir(parents=True, exist_ok=True)
+    run_or_exit(
+        f"qpdf --split-pages={chunk_pages} {shell_quote(source)} "
+        f"{shell_quote(chunk_dir / 'chunk-%d.pdf')}"
+    )
+    chunks = sorted(chunk_dir.glob("chunk-*.pdf"))
+    if not chunks:
+        typer.echo(f"qpdf produced no chunks for {source}", err=True)
+        raise typer.Exit(1)
+    return chunks
+
+
+def compress_chunked(
+    chunks: List[Path],
+    destination: Path,
+    flags: List[str],
+    workdir: Path,
+    *,
+    jobs: int,
+) -> None:
+    """Run Ghostscript on page chunks in parallel and reassemble them once.
+
+    Each chunk gets its own Ghostscript process (at most ``jobs`` at a time)
+    with font subsetting disabled, so every chunk embeds byte-identical font
+    programs. qpdf concatenates the results, ``pdfcpu optimize`` folds those
+    duplicate fonts and images into shared resources, and one final
+    Ghostscript pass subsets the fonts for the whole document. Whichever of
+    the last two files is smaller becomes ``destination``.
+    """
+    attempt_dir = workdir / f"chunks-{destination.stem}"
+    attempt_dir.mkdir(parents=True, exist_ok=True)
+    compressed = [attempt_dir / f"gs-{chunk.name}" for chunk in chunks]
+    chunk_flags = [*flags, "-dSubsetFonts=false"]
+
+    def chunk_worker(pair: tuple[Path, Path]) -> int:
+        chunk, target = pair
+        return spawn(build_gs_command(chunk, target, chunk_flags)).wait()
+
+    with ThreadPoolExecutor(max_workers=max(1, min(jobs, len(chunks)))) as pool:
+        codes = list(pool.map(chunk_worker, zip(chunks, compressed)))
+    failed = [code for code in codes if code != 0]
+    if failed:
+        raise typer.Exit(failed[0])
+
+    merged = attempt_dir / "merged.pdf"
+    folded = attempt_dir / "folded.pdf"
+    subset = attempt_dir / "subset.pdf"
+    segments = " ".join(f"{shell_quote(path)} 1-z" for path in compressed)
+    run_or_exit(f"qpdf --empty --pages {segments} -- {shell_quote(merged)}")
+    run_or_exit(f"pdfcpu optimize {shell_quote(merged)} {shell_quote(folded)}")
+    run_or_exit(build_gs_command(folded, subset, SUBSET_FONT_FLAGS))
+    smaller = subset if file_size(subset) <= file_size(folded) else folded
+    shutil.move(str(smaller), str(destination))
+    shutil.rmtree(attempt_dir, ignore_errors=True)
+
+
+def sample_page_numbers(total: int, count: int) -> List[int]:
+    if total <= 0:
+        return []
+    if total <= count:
+        return list(range(1, total + 1))
+    return sorted({1 + (total - 1) * idx // (count - 1) for idx in range(count)})
+
+
+def fit_size_curve(
+    high: tuple[int, float],
+    low: tuple[int, float],
+) -> tuple[float, float]:
+    """Fit ``size = fixed + per_dpi2 * dpi**2`` through two (dpi, size) samples."""
+    (high_res, high_size), (low_res, low_size) = high, low
+    spread = high_res**2 - low_res**2
+    per_dpi2 = (high_size - low_size) / spread if spread else 0.0
+    if per_dpi2 <= 0:
+        # Size does not depend on resolution (vector content); treat it as fixed.
+        return max(high_size, low_size), 0.0
+    return high_size - per_dpi2 * high_res**2, per_dpi2
+
+
+def predict_resolution(fixed: float, per_dpi2: float, target_bytes: int, ceiling: int) -> int:
+    if per_dpi2 <= 0:
+        return ceiling
+    budget = target_bytes * PREDICT_SAFETY - fixed
+    if budget <= 0:
+        return PREDICT_MIN_RESOLUTION
+    resolution = int((budget / per_dpi2) ** 0.5)
+    return max(PREDICT_MIN_RESOLUTION, min(ceiling, resolution))
+
+
+def warn_target_missed(target_size_mb: float | None, output: Path, achieved: bool) -> None:
+    if target_size_mb and not achieved:
+        typer.echo(
+            f"[yellow]Warning:[/yellow] target size "
+            f"{target_size_mb:.1f} MB not reached (result {size_bytes_to_mb(file_size(output)):.1f} MB).",
+            err=True,
+        )
 
 
 def build_gs_flags(config: Dict[str, object], attempt: int) -> List[str]:
-    base_flags: List[str] = list(config["base_flags"])  # type: ignore[index]
     resolutions: List[int] = config["resolutions"]  # type: ignore[index]
     res = resolutions[min(attempt, len(resolutions) - 1)]
+    return build_gs_flags_for_resolution(config, res)
+
+
+def build_gs_flags_for_resolution(config: Dict[str, object], res: int) -> List[str]:
+    base_flags: List[str] = list(config["base_flags"])  # type: ignore[index]
     if res:
         base_flags.extend(
             [
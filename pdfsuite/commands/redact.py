@@ -13,6 +13,10 @@ def redact_safe(
     output: Path = typer.Option(..., "-o", help="Redacted PDF output"),
 ):
     """Secure rasterize+sanitize redaction using pdf-redact-tools."""
+    run_redact_safe(input, output)
+
+
+def run_redact_safe(input: Path, output: Path) -> None:
     require_tools("pdf-redact-tools")
     cmd = (
         "pdf-redact-tools --sanitize "
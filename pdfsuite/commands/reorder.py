@@ -1,34 +1,101 @@
 from pathlib import Path
+from typing import List, Optional, Tuple
 
 import typer
 
+from pdfsuite.utils.backend import native_backend, run_native_or_exit
 from pdfsuite.utils.common import (
     ensure_file,
     parse_range_sequence,
     require_tools,
     run_or_exit,
     shell_quote,
+    temporary_directory,
 )
 
+# Specs longer than this reach qpdf through an @argfile instead of the command line.
+ARGV_SPEC_LIMIT = 32 * 1024
+
 
 def register(app: typer.Typer) -> None:
     @app.command()
     def reorder(
         input: Path,
-        order: str = typer.Option(
-            ...,
+        order: Optional[str] = typer.Option(
+            None,
             "--order",
             help="Comma separated page ranges (e.g. 5-7,1-4,8-z).",
         ),
+        order_file: Optional[Path] = typer.Option(
+            None,
+            "--order-file",
+            help="Read the ranges from a file (comma, space, or newline separated).",
+        ),
+        rotate: Optional[List[str]] = typer.Option(
+            None,
+            "--rotate",
+            help="Turn output pages clockwise, ANGLE:RANGES (e.g. 90:1-3,7 or -90:z); repeatable.",
+        ),
         output: Path = typer.Option(..., "-o", help="Reordered PDF output."),
     ):
         """Reorder, duplicate, or drop pages using qpdf."""
-        require_tools("qpdf")
+        if (order is None) == (order_file is None):
+            raise typer.BadParameter("Provide exactly one of --order or --order-file.")
         source = ensure_file(input, label="input PDF")
+        if order_file is not None:
+            order = ",".join(ensure_file(order_file, label="order file").read_text().split())
         ranges = parse_range_sequence(order)
         spec = ",".join(ranges)
+        rotations = [parse_rotation(value) for value in rotate or []]
+        rotations = [(angle, tokens) for angle, tokens in rotations if angle]
+        backend = native_backend()
+        if backend is not None:
+            summary = spec if len(spec) <= 80 else f"{len(ranges)} ranges"
+            if rotations:
+                summary += f", {len(rotations)} rotation(s)"
+            run_native_or_exit(
+                backend,
+                f"reorder {source} ({summary}) -> {output}",
+                lambda: backend.assemble([(source, ranges)], output, rotations),
+            )
+            return
+        require_tools("qpdf")
+        # qpdf applies --rotate to output page numbers, so one pass reorders and turns.
+        rotate_args = [qpdf_rotate_arg(angle, tokens) for angle, tokens in rotations]
+        if len(spec) + sum(len(arg) for arg in rotate_args) > ARGV_SPEC_LIMIT:
+            run_qpdf_argfile(
+                [str(source), *rotate_args, "--pages", str(source), spec, "--", str(output)]
+            )
+            return
+        rotate_flags = "".join(f"{shell_quote(arg)} " for arg in rotate_args)
         cmd = (
-            f"qpdf {shell_quote(source)} --pages {shell_quote(source)} "
+            f"qpdf {shell_quote(source)} {rotate_flags}--pages {shell_quote(source)} "
             f"{shell_quote(spec)} -- {shell_quote(output)}"
         )
         run_or_exit(cmd)
+
+
+def parse_rotation(value: str) -> Tuple[int, List[str]]:
+    """Parse ``ANGLE:RANGES`` into (clockwise degrees in 0-359, range tokens)."""
+    angle_text, sep, ranges = value.partition(":")
+    try:
+        angle = int(angle_text)
+    except ValueError:
+        angle = None
+    if not sep or angle is None or angle % 90 != 0:
+        raise typer.BadParameter(
+            f"Rotation '{value}' must be ANGLE:RANGES with ANGLE a multiple of 90."
+        )
+    return angle % 360, parse_range_sequence(ranges)
+
+
+def qpdf_rotate_arg(angle: int, tokens: List[str]) -> str:
+    return f"--rotate=+{angle}:{','.join(tokens)}"
+
+
+def run_qpdf_argfile(arguments: list[str]) -> None:
+    """Run qpdf with its arguments read from an @file, one per line, to sidestep ARG_MAX."""
+    with temporary_directory() as tmp:
+        argfile = tmp / "qpdf.args"
+        argfile.write_text("\n".join(arguments) + "\n", encoding="utf-8")
+        run_or_exit(f"qpdf {shell_quote(f'@{argfile}')}")
@@ -1,8 +1,12 @@
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import List, Optional, Tuple
 
 import typer
 
+from pdfsuite.utils.backend import PdfBackend, native_backend, run_native_or_exit
 from pdfsuite.utils.common import (
+    default_jobs,
     ensure_file,
     ensure_output_dir,
     parse_range_sequence,
@@ -10,6 +14,7 @@ from pdfsuite.utils.common import (
     run_or_exit,
     safe_range_name,
     shell_quote,
+    spawn,
 )
 
 
@@ -17,26 +22,107 @@ def register(app: typer.Typer) -> None:
     @app.command(help="Split PDFs into page range slices.")
     def split(  # noqa: A003 - command name
         input: Path = typer.Argument(..., help="Source PDF to split."),
-        pages: str = typer.Option(
-            ...,
+        pages: Optional[str] = typer.Option(
+            None,
             "--pages",
             help="Comma separated ranges (e.g. 1-3,4,5-z).",
         ),
+        burst: bool = typer.Option(False, "--burst", help="Write one PDF per page."),
+        chunk_size: Optional[int] = typer.Option(
+            None,
+            "--chunk-size",
+            min=1,
+            help="Write consecutive slices of N pages each.",
+        ),
         output: Path = typer.Option(
             Path("splits"),
             "-o",
             help="Directory to place split PDFs (default: ./splits).",
         ),
+        jobs: int = typer.Option(
+            None,
+            "--jobs",
+            min=1,
+            help="Parallel qpdf processes for --pages without a native backend "
+            "(default: CPU count).",
+        ),
     ) -> None:
-        require_tools("qpdf")
+        if sum((pages is not None, burst, chunk_size is not None)) != 1:
+            raise typer.BadParameter("Choose exactly one of --pages, --burst, or --chunk-size.")
         source = ensure_file(input, label="input PDF")
-        ranges = parse_range_sequence(pages)
+        ranges = parse_range_sequence(pages) if pages is not None else []
+        size = 1 if burst else chunk_size
+        backend = native_backend()
+        if backend is None:
+            require_tools("qpdf")
         ensure_output_dir(output)
-        for token in ranges:
-            safe_name = safe_range_name(token)
-            dest = output / f"{source.stem}_{safe_name}.pdf"
-            cmd = (
-                f"qpdf {shell_quote(source)} --pages {shell_quote(source)} "
-                f"{shell_quote(token)} -- {shell_quote(dest)}"
+        if backend is not None:
+            split_native(backend, source, output, ranges=ranges, size=size)
+        elif size:
+            run_or_exit(
+                f"qpdf --split-pages={size} {shell_quote(source)} "
+                f"{shell_quote(output / f'{source.stem}_%d.pdf')}"
             )
+        else:
+            split_ranges_cli(source, output, ranges, jobs or default_jobs())
+
+
+def range_destination(source: Path, output: Path, token: str) -> Path:
+    return output / f"{source.stem}_{safe_range_name(token)}.pdf"
+
+
+def fixed_slices(
+    source: Path,
+    output: Path,
+    total: int,
+    size: int,
+) -> List[Tuple[List[str], Path]]:
+    """Cut `total` pages into `size`-page slices named the way `qpdf --split-pages` names them."""
+    width = len(str(total))
+    slices = []
+    for first in range(1, total + 1, size):
+        last = min(first + size - 1, total)
+        label = f"{first:0{width}d}" if first == last else f"{first:0{width}d}-{last:0{width}d}"
+        slices.append(([f"{first}-{last}"], output / f"{source.stem}_{label}.pdf"))
+    return slices
+
+
+def split_native(
+    backend: PdfBackend,
+    source: Path,
+    output: Path,
+    *,
+    ranges: List[str],
+    size: Optional[int],
+) -> None:
+    def plan(total: int) -> List[Tuple[List[str], Path]]:
+        if size:
+            return fixed_slices(source, output, total, size)
+        return [([token], range_destination(source, output, token)) for token in ranges]
+
+    detail = f"every {size} page(s)" if size else ",".join(ranges)
+    run_native_or_exit(
+        backend,
+        f"split {source} ({detail}) -> {output}",
+        lambda: backend.split(source, plan),
+    )
+
+
+def split_ranges_cli(source: Path, output: Path, ranges: List[str], jobs: int) -> None:
+    """Run one qpdf per range, up to `jobs` at a time (qpdf has no multi-output mode)."""
+    commands = [
+        (
+            f"qpdf {shell_quote(source)} --pages {shell_quote(source)} "
+            f"{shell_quote(token)} -- {shell_quote(range_destination(source, output, token))}"
+        )
+        for token in ranges
+    ]
+    if jobs <= 1 or len(commands) == 1:
+        for cmd in commands:
             run_or_exit(cmd)
+        return
+    with ThreadPoolExecutor(max_workers=min(jobs, len(commands))) as pool:
+        codes = list(pool.map(lambda cmd: spawn(cmd).wait(), commands))
+    failed = [code for code in codes if code != 0]
+    if failed:
+        raise typer.Exit(failed[0])
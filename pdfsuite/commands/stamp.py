@@ -1,16 +1,23 @@
-import shutil
-import subprocess
+from __future__ import annotations
+
 from pathlib import Path
+from typing import List, Sequence
 
 import typer
 
+from pdfsuite.utils.backend import native_backend
 from pdfsuite.utils.common import (
     ensure_file,
-    run_or_exit,
+    get_page_count,
     require_tools,
+    run_or_exit,
     shell_quote,
     temporary_directory,
 )
+from pdfsuite.utils.pdf_text import write_label_pages
+
+BATES_FONT_SIZE = 24
+BATES_PROGRESS_STEP = 1000
 
 
 def register(app: typer.Typer) -> None:
@@ -22,14 +29,27 @@ def register(app: typer.Typer) -> None:
         start: int = typer.Option(1, "--start", help="Starting Bates number."),
     ):
         """Stamp/watermark/Bates using pdfcpu."""
-        source = ensure_file(input, label="input PDF")
-        if bates:
-            require_tools("pdfcpu", "qpdf")
-            stamp_bates(source, output, bates, start)
-            return
+        apply_stamp(input, output, bates=bates, start=start)
+
 
-        require_tools("pdfcpu")
-        stamp_text(source, output, "1-", "CONFIDENTIAL")
+def apply_stamp(input: Path, output: Path, *, bates: str | None = None, start: int = 1) -> None:
+    if bates:
+        try:
+            bates.encode("latin-1")
+        except UnicodeEncodeError:
+            # The overlay uses the standard Helvetica font, which has no glyphs beyond Latin-1.
+            raise typer.BadParameter(
+                f"Bates prefix {bates!r} must only use Latin-1 characters.", param_hint="--bates"
+            )
+    source = ensure_file(input, label="input PDF")
+    if bates:
+        # Page counts come from the in-process backend when one is installed.
+        require_tools("pdfcpu", *(() if native_backend() else ("qpdf",)))
+        stamp_bates(source, output, bates, start)
+        return
+
+    require_tools("pdfcpu")
+    stamp_text(source, output, "1-", "CONFIDENTIAL")
 
 
 def stamp_text(input_pdf: Path, output_pdf: Path, pages: str, text: str) -> None:
@@ -41,34 +61,42 @@ def stamp_text(input_pdf: Path, output_pdf: Path, pages: str, text: str) -> None
     run_or_exit(cmd)
 
 
+def stamp_pdf(input_pdf: Path, output_pdf: Path, stamp_file: Path) -> None:
+    """Apply a multi-page PDF stamp: page N of `stamp_file` lands on page N of the input."""
+    cmd = (
+        "pdfcpu stamp add -mode pdf "
+        f"-- {shell_quote(stamp_file)} {shell_quote('')} "
+        f"{shell_quote(input_pdf)} {shell_quote(output_pdf)}"
+    )
+    run_or_exit(cmd)
+
+
 def stamp_bates(input_pdf: Path, output_pdf: Path, prefix: str, start: int) -> None:
     total = get_page_count(input_pdf)
     if total <= 0:
         typer.echo("Unable to detect page count for Bates stamping.", err=True)
         raise typer.Exit(1)
 
+    labels = bates_labels(prefix, start, total)
     with temporary_directory("pdfsuite-stamp-") as tmpdir:
-        working = tmpdir / "work.pdf"
-        shutil.copy2(input_pdf, working)
-        current_input = working
-        for idx in range(total):
-            page_num = idx + 1
-            label = f"{prefix}:{start + idx:04d}"
-            next_output = tmpdir / f"pass-{page_num}.pdf"
-            stamp_text(current_input, next_output, str(page_num), label)
-            current_input = next_output
-        shutil.copy2(current_input, output_pdf)
-
-
-def get_page_count(pdf: Path) -> int:
-    result = subprocess.run(
-        ["qpdf", "--show-npages", str(pdf)],
-        capture_output=True,
-        text=True,
-    )
-    if result.returncode != 0:
-        return 0
-    try:
-        return int(result.stdout.strip())
-    except ValueError:
-        return 0
+        overlay = tmpdir / "bates-overlay.pdf"
+        write_label_overlay(overlay, labels)
+        typer.echo(f"[dim]stamp[/dim] Applying {total} Bates labels in a single pass.")
+        stamp_pdf(input_pdf, output_pdf, overlay)
+
+
+def bates_labels(prefix: str, start: int, total: int) -> List[str]:
+    return [f"{prefix}:{start + idx:04d}" for idx in range(total)]
+
+
+def write_label_overlay(
+    destination: Path, labels: Sequence[str], *, font_size: int = BATES_FONT_SIZE
+) -> None:
+    """Write one small page per label so pdfcpu can stamp every page in one run."""
+    total = len(labels)
+
+    def report(idx: int) -> None:
+        if idx % BATES_PROGRESS_STEP == 0 or idx == total:
+            typer.echo(f"[dim]stamp[/dim] Prepared Bates labels {idx}/{total}")
+
+    write_label_pages(destination, labels, font_size=font_size, on_page=report)
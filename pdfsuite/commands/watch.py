@@ -1,14 +1,22 @@
 from __future__ import annotations
 
+import os
+import queue
+import sqlite3
+import threading
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Set
+from typing import Set, Tuple
 
 import typer
 
 from pdfsuite.commands.optimize import run_optimize_pipeline, PRESETS
 from pdfsuite.utils.common import ensure_output_dir
+from pdfsuite.utils.inotify import InotifyWatcher
+
+# (resolved path, size, mtime): a rewrite under the same name is a new file.
+Seen = Tuple[str, int, float]
 
 
 def register(app: typer.Typer) -> None:
@@ -46,6 +54,34 @@ def register(app: typer.Typer) -> None:
             "--once",
             help="Scan directory once and exit (useful for tests).",
         ),
+        events: bool = typer.Option(
+            True,
+            "--events/--poll",
+            help="Use inotify events on Linux (falls back to polling elsewhere).",
+        ),
+        state_file: Path = typer.Option(
+            None,
+            "--state",
+            help="SQLite file recording processed PDFs (default: ~/pdfsuite/build/watch/state.sqlite3).",
+        ),
+        workers: int = typer.Option(
+            1,
+            "--workers",
+            min=1,
+            help="Number of files optimized concurrently.",
+        ),
+        retries: int = typer.Option(
+            2,
+            "--retries",
+            min=0,
+            help="Retries per file after a failed optimize run.",
+        ),
+        retry_delay: float = typer.Option(
+            5.0,
+            "--retry-delay",
+            min=0,
+            help="Seconds before the first retry; doubles on each further attempt.",
+        ),
     ):
         """Watch a folder for new PDFs and auto-optimize them."""
         preset_key = preset.lower()
@@ -54,21 +90,56 @@ def register(app: typer.Typer) -> None:
         directory = path or default_watch_dir()
         ensure_output_dir(directory)
         typer.echo(f"[dim]watch[/dim] Monitoring {directory} using preset '{preset_key}'. Ctrl+C to stop.")
-        processed: Set[str] = set()
+        processed: Set[Seen] = set()
+        state = WatchState(state_file or default_state_path())
+        pool = WatchPool(
+            workers,
+            preset_key,
+            target_size,
+            state,
+            retries=retries,
+            retry_delay=retry_delay,
+        )
+        watcher = None
+        if events and not once and InotifyWatcher.available():
+            try:
+                watcher = InotifyWatcher(directory)
+            except OSError as exc:  # e.g. ENOSPC once max_user_watches is used up
+                typer.echo(f"[dim]watch[/dim] inotify unavailable ({exc}); polling instead.")
+            else:
+                typer.echo("[dim]watch[/dim] Using inotify events.")
         try:
             while True:
+                deferred: Set[str] = set()
                 processed |= process_directory(
                     directory,
                     processed,
                     preset_key,
                     target_size,
                     settle_seconds,
+                    state=state,
+                    deferred=deferred,
+                    pool=pool,
                 )
                 if once:
+                    pool.join()
                     break
-                time.sleep(poll_interval)
+                if watcher is None:
+                    time.sleep(poll_interval)
+                    continue
+                # Sleep in the kernel until a PDF lands, waking early when a file
+                # still has to settle and at least every poll interval anyway:
+                # network and FUSE mounts deliver no inotify events.
+                if watcher.wait(settle_seconds if deferred else poll_interval):
+                    time.sleep(settle_seconds)
+                    watcher.drain()
         except KeyboardInterrupt:
             typer.echo("Stopping watch.")
+        finally:
+            if watcher is not None:
+                watcher.close()
+            pool.shutdown()
+            state.close()
 
 
 def default_watch_dir() -> Path:
@@ -86,26 +157,215 @@ def typersys() -> str:
     return platform.system()
 
 
+def default_state_path() -> Path:
+    return Path.home() / "pdfsuite" / "build" / "watch" / "state.sqlite3"
+
+
+class WatchState:
+    """SQLite record of processed files keyed by path, size, and mtime.
+
+    A file is considered done only while its size and mtime match the stored
+    row, so restarts skip finished work but re-process files that changed.
+    """
+
+    def __init__(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(str(path), check_same_thread=False)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS processed ("
+            "path TEXT PRIMARY KEY, size INTEGER NOT NULL, mtime REAL NOT NULL, "
+            "output TEXT, processed_at TEXT)"
+        )
+        self.conn.commit()
+
+    def is_processed(self, key: str, info: os.stat_result) -> bool:
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT size, mtime FROM processed WHERE path = ?",
+                (key,),
+            ).fetchone()
+        return row is not None and row[0] == info.st_size and row[1] == info.st_mtime
+
+    def mark(self, key: str, info: os.stat_result, output: Path) -> None:
+        with self.lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO processed (path, size, mtime, output, processed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, info.st_size, info.st_mtime, str(output), datetime.now().isoformat()),
+            )
+            self.conn.commit()
+
+    def close(self) -> None:
+        with self.lock:
+            self.conn.close()
+
+
+class WatchPool:
+    """Bounded queue of optimize jobs served by a fixed set of worker threads.
+
+    Files already queued or running are rejected so a burst of events cannot
+    schedule the same PDF twice; failed runs are retried with exponential
+    backoff and every file ends with one status line.
+    """
+
+    def __init__(
+        self,
+        workers: int,
+        preset: str,
+        target_size: float | None,
+        state: WatchState | None = None,
+        *,
+        retries: int = 2,
+        retry_delay: float = 5.0,
+        queue_size: int | None = None,
+    ) -> None:
+        self.preset = preset
+        self.target_size = target_size
+        self.state = state
+        self.retries = retries
+        self.retry_delay = retry_delay
+        self.queue: queue.Queue = queue.Queue(maxsize=queue_size or workers * 4)
+        self.in_flight: Set[str] = set()
+        self.lock = threading.Lock()
+        self.threads = [
+            threading.Thread(target=self._work, name=f"watch-worker-{idx}", daemon=True)
+            for idx in range(workers)
+        ]
+        for thread in self.threads:
+            thread.start()
+
+    def submit(self, entry: Path, key: str, info: os.stat_result) -> bool:
+        """Queue a file, blocking while the queue is full; False if already in flight."""
+        with self.lock:
+            if key in self.in_flight:
+                return False
+            self.in_flight.add(key)
+        self.queue.put((entry, key, info))
+        return True
+
+    def is_in_flight(self, key: str) -> bool:
+        with self.lock:
+            return key in self.in_flight
+
+    def join(self) -> None:
+        self.queue.join()
+
+    def shutdown(self) -> None:
+        """Stop the workers: queued files are dropped, running ones finish."""
+        while True:
+            try:
+                item = self.queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not None:
+                with self.lock:
+                    self.in_flight.discard(item[1])
+            self.queue.task_done()
+        for _ in self.threads:
+            self.queue.put(None)
+        for thread in self.threads:
+            thread.join()
+
+    def _work(self) -> None:
+        while True:
+            item = self.queue.get()
+            if item is None:
+                self.queue.task_done()
+                return
+            entry, key, info = item
+            try:
+                self._process(entry, key, info)
+            except Exception as exc:  # keep the worker alive whatever one file does
+                typer.echo(f"[dim]watch[/dim] {entry.name}: failed ({exc})", err=True)
+            finally:
+                with self.lock:
+                    self.in_flight.discard(key)
+                self.queue.task_done()
+
+    def _process(self, entry: Path, key: str, info: os.stat_result) -> None:
+        output = build_watch_output(entry)
+        attempts = self.retries + 1
+        for attempt in range(1, attempts + 1):
+            started = time.monotonic()
+            typer.echo(f"[dim]watch[/dim] Optimizing {entry.name} → {output.name}")
+            try:
+                run_optimize_pipeline(entry, output, self.preset, target_size_mb=self.target_size)
+            except Exception as exc:  # e.g. a half-written file the backend cannot parse
+                code = getattr(exc, "exit_code", None)
+                if code is None:
+                    code = f"{type(exc).__name__}: {exc}"
+                if attempt == attempts:
+                    typer.echo(
+                        f"[dim]watch[/dim] {entry.name}: failed after {attempt} attempt(s) ({code})",
+                        err=True,
+                    )
+                    return
+                delay = self.retry_delay * 2 ** (attempt - 1)
+                typer.echo(
+                    f"[dim]watch[/dim] {entry.name}: attempt {attempt} failed ({code}); "
+                    f"retrying in {delay:.0f}s",
+                    err=True,
+                )
+                time.sleep(delay)
+                continue
+            if self.state is not None:
+                self.state.mark(key, info, output)
+            elapsed = time.monotonic() - started
+            typer.echo(
+                f"[dim]watch[/dim] {entry.name}: ok → {output} (attempt {attempt}, {elapsed:.1f}s)"
+            )
+            return
+
+
 def process_directory(
     directory: Path,
-    processed: Set[str],
+    processed: Set[Seen],
     preset: str,
     target_size: float | None,
     settle_seconds: float,
-) -> Set[str]:
-    new_processed: Set[str] = set()
+    *,
+    state: WatchState | None = None,
+    deferred: Set[str] | None = None,
+    pool: WatchPool | None = None,
+) -> Set[Seen]:
+    """Optimize (or queue) settled PDFs in `directory` not yet handled at their current size/mtime.
+
+    Returns the (path, size, mtime) of every file done or queued in this
+    scan, for the caller to pass back as `processed` on the next one.
+    """
+    new_processed: Set[Seen] = set()
     now = time.time()
     for entry in sorted(directory.glob("*.pdf")):
         key = str(entry.resolve())
-        if key in processed:
+        if pool is not None and pool.is_in_flight(key):
+            continue
+        try:
+            info = entry.stat()
+        except FileNotFoundError:
+            continue
+        seen = (key, info.st_size, info.st_mtime)
+        if seen in processed:
             continue
-        age = now - entry.stat().st_mtime
+        if state is not None and state.is_processed(key, info):
+            new_processed.add(seen)
+            continue
+        age = now - info.st_mtime
         if age < settle_seconds:
+            if deferred is not None:
+                deferred.add(key)
+            continue
+        if pool is not None:
+            if pool.submit(entry, key, info):
+                new_processed.add(seen)
             continue
         output = build_watch_output(entry)
         typer.echo(f"[dim]watch[/dim] Optimizing {entry.name} → {output.name}")
         run_optimize_pipeline(entry, output, preset, target_size_mb=target_size)
-        new_processed.add(key)
+        if state is not None:
+            state.mark(key, info, output)
+        new_processed.add(seen)
     return new_processed
 
 
@@ -1,63 +1,83 @@
 from __future__ import annotations
 
+import os
 import sys
+import tempfile
+from array import array
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Callable, List, Sequence
+from typing import Callable, Dict, Iterable, List, Sequence
+
+from pdfsuite.core.history import (
+    DEFAULT_HISTORY_BYTES,
+    DeleteOp,
+    Operation,
+    OperationLog,
+    ReorderOp,
+    RotateOp,
+    SetOrderOp,
+)
+from pdfsuite.core.page_order import PageOrder
+
+# Longer order specs go through `reorder --order-file` so argv never nears ARG_MAX.
+INLINE_SPEC_LIMIT = 32 * 1024
 
 
 @dataclass
 class DocumentSession:
     path: Path
-    page_order: List[int]
+    page_order: PageOrder
     selection: set[int] = field(default_factory=set)
-    _undo: List[List[int]] = field(default_factory=list, init=False)
-    _redo: List[List[int]] = field(default_factory=list, init=False)
-    _max_history: int = 20
+    # Clockwise quarter turns per source page, in degrees (0 entries are dropped).
+    rotations: Dict[int, int] = field(default_factory=dict)
+    # Undo/redo keep operation records until their estimated size exceeds this budget.
+    max_history_bytes: int = DEFAULT_HISTORY_BYTES
     dirty: bool = field(default=False, init=False)
+    _undo: OperationLog = field(init=False, repr=False)
+    _redo: OperationLog = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.page_order, PageOrder):
+            self.page_order = PageOrder(self.page_order)
+        self._undo = OperationLog(self.max_history_bytes)
+        self._redo = OperationLog(self.max_history_bytes)
 
     def reorder(self, indices: Sequence[int], new_pos: int) -> None:
         normalized = self._normalize_indices(indices)
         if not normalized:
             return
-        self._push_undo()
-        selected = [self.page_order[i] for i in normalized]
-        remaining = [p for idx, p in enumerate(self.page_order) if idx not in normalized]
-        clamped_pos = max(0, min(new_pos, len(remaining)))
-        self.page_order = remaining[:clamped_pos] + selected + remaining[clamped_pos:]
-        self._redo.clear()
-        self.dirty = True
+        target = max(0, min(new_pos, len(self.page_order) - len(normalized)))
+        self._perform(ReorderOp(array("I", normalized), target))
 
     def rotate(self, indices: Sequence[int], angle: int) -> None:
         if angle % 90 != 0:
             raise ValueError("Rotation must be a multiple of 90 degrees.")
         normalized = self._normalize_indices(indices)
-        if not normalized:
+        if not normalized or angle % 360 == 0:
             return
-        self._push_undo()
-        # rotation metadata stored elsewhere (placeholder)
-        self._redo.clear()
-        self.dirty = True
+        pages = array("I", (self.page_order[i] for i in normalized))
+        self._perform(RotateOp(pages, angle % 360))
 
     def delete(self, indices: Sequence[int]) -> None:
         normalized = self._normalize_indices(indices)
         if not normalized:
             return
-        self._push_undo()
-        to_drop = {self.page_order[i] for i in normalized}
-        self.page_order = [p for p in self.page_order if p not in to_drop]
-        self.selection.difference_update(to_drop)
-        self._redo.clear()
-        self.dirty = True
+        self._perform(DeleteOp(array("I", normalized)))
 
     def set_order(self, new_order: Sequence[int]) -> None:
         if sorted(new_order) != sorted(self.page_order):
             raise ValueError("New order must contain the same pages.")
-        self._push_undo()
-        self.page_order = list(new_order)
-        self._redo.clear()
-        self.dirty = True
+        self._perform(SetOrderOp(self.page_order, PageOrder(new_order)))
+
+    def turn_pages(self, pages: Iterable[int], angle: int) -> None:
+        """Add `angle` degrees of clockwise rotation to each source page."""
+        for page in pages:
+            turned = (self.rotations.get(page, 0) + angle) % 360
+            if turned:
+                self.rotations[page] = turned
+            else:
+                self.rotations.pop(page, None)
 
     def commit(
         self,
@@ -69,8 +89,12 @@ class DocumentSession:
         on_finished: Callable[[int, Path], None] | None = None,
     ) -> None:
         dest = output_path or self._default_output_path()
-        command = self._build_cli_command(dest)
+        order_file = self._spill_order_spec()
+        command = self._build_cli_command(dest, order_file)
+
         def _finished(code: int, job_dir: Path) -> None:
+            if order_file is not None:
+                order_file.unlink(missing_ok=True)
             if code == 0:
                 self.dirty = False
             if on_finished:
@@ -84,41 +108,78 @@ class DocumentSession:
         )
 
     def undo(self) -> None:
-        if not self._undo:
+        operation = self._undo.pop()
+        if operation is None:
             return
-        self._redo.append(self.page_order.copy())
-        self.page_order = self._undo.pop()
+        operation.revert(self)
+        self._redo.push(operation)
 
     def redo(self) -> None:
-        if not self._redo:
+        operation = self._redo.pop()
+        if operation is None:
             return
-        self._undo.append(self.page_order.copy())
-        self.page_order = self._redo.pop()
+        operation.apply(self)
+        self._undo.push(operation)
+
+    @property
+    def can_undo(self) -> bool:
+        return bool(self._undo)
 
-    def _push_undo(self) -> None:
-        self._undo.append(self.page_order.copy())
-        if len(self._undo) > self._max_history:
-            self._undo.pop(0)
+    @property
+    def can_redo(self) -> bool:
+        return bool(self._redo)
+
+    def _perform(self, operation: Operation) -> None:
+        operation.apply(self)
+        self._undo.push(operation)
+        self._redo.clear()
+        self.dirty = True
 
     def _normalize_indices(self, indices: Sequence[int]) -> List[int]:
-        normalized = sorted(set(i for i in indices if 0 <= i < len(self.page_order)))
+        total = len(self.page_order)
+        normalized = sorted(set(i for i in indices if 0 <= i < total))
         return normalized
 
-    def _build_cli_command(self, destination: Path) -> list[str]:
-        order_spec = ",".join(str(number) for number in self.page_order)
+    def _spill_order_spec(self) -> Path | None:
+        """Write an order spec too long for argv to a temp file; None when it fits inline."""
+        spec = self.page_order.spec()
+        if len(spec) <= INLINE_SPEC_LIMIT:
+            return None
+        fd, name = tempfile.mkstemp(prefix="pdfsuite-order-", suffix=".txt")
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            handle.write(spec.replace(",", "\n"))
+            handle.write("\n")
+        return Path(name)
+
+    def _build_cli_command(self, destination: Path, order_file: Path | None = None) -> list[str]:
         executable = sys.executable or "python3"
+        if order_file is not None:
+            order_args = ["--order-file", str(order_file)]
+        else:
+            order_args = ["--order", self.page_order.spec()]
         return [
             executable,
             "-m",
             "pdfsuite",
             "reorder",
             str(self.path),
-            "--order",
-            order_spec,
+            *order_args,
+            *self._rotation_args(),
             "-o",
             str(destination),
         ]
 
+    def _rotation_args(self) -> list[str]:
+        """``--rotate ANGLE:RANGES`` per angle, over output positions, for pages still kept."""
+        positions: Dict[int, List[int]] = {}
+        for page, angle in self.rotations.items():
+            if page in self.page_order:
+                positions.setdefault(angle, []).append(self.page_order.index(page) + 1)
+        args: list[str] = []
+        for angle, rows in sorted(positions.items()):
+            args += ["--rotate", f"{angle}:{PageOrder(sorted(rows)).spec()}"]
+        return args
+
     def _default_output_path(self) -> Path:
         build_root = Path.home() / "pdfsuite" / "build"
         build_root.mkdir(parents=True, exist_ok=True)
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+from array import array
+from collections import deque
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Deque, Optional
+
+from pdfsuite.core.page_order import PageOrder
+
+if TYPE_CHECKING:  # pragma: no cover - import cycle only matters for annotations
+    from pdfsuite.core.document_session import DocumentSession
+
+DEFAULT_HISTORY_BYTES = 8 * 1024 * 1024
+# Rough per-record cost of the Python objects around the arrays.
+_RECORD_OVERHEAD = 128
+
+
+class Operation:
+    """One undoable edit: `apply` performs it on a session, `revert` is its inverse."""
+
+    def apply(self, session: "DocumentSession") -> None:
+        raise NotImplementedError
+
+    def revert(self, session: "DocumentSession") -> None:
+        raise NotImplementedError
+
+    @property
+    def nbytes(self) -> int:
+        return _RECORD_OVERHEAD
+
+
+@dataclass
+class ReorderOp(Operation):
+    """Move the rows at `positions` so they start at `target` among the remaining rows."""
+
+    positions: array
+    target: int
+
+    def apply(self, session: "DocumentSession") -> None:
+        selected, remaining = session.page_order.take(self.positions)
+        session.page_order = remaining.inserted(self.target, selected)
+
+    def revert(self, session: "DocumentSession") -> None:
+        moved_rows = range(self.target, self.target + len(self.positions))
+        moved, rest = session.page_order.take(moved_rows)
+        session.page_order = rest.restored(self.positions, moved)
+
+    @property
+    def nbytes(self) -> int:
+        return _RECORD_OVERHEAD + self.positions.itemsize * len(self.positions)
+
+
+@dataclass
+class DeleteOp(Operation):
+    """Drop the rows at `positions`; the dropped pages are kept for `revert`."""
+
+    positions: array
+    pages: PageOrder = field(default_factory=PageOrder)
+
+    def apply(self, session: "DocumentSession") -> None:
+        self.pages, session.page_order = session.page_order.take(self.positions)
+        session.selection.difference_update(self.pages)
+
+    def revert(self, session: "DocumentSession") -> None:
+        session.page_order = session.page_order.restored(self.positions, self.pages)
+
+    @property
+    def nbytes(self) -> int:
+        return _RECORD_OVERHEAD + self.positions.itemsize * len(self.positions) + self.pages.nbytes
+
+
+@dataclass
+class RotateOp(Operation):
+    """Turn source `pages` clockwise by `angle` degrees."""
+
+    pages: array
+    angle: int
+
+    def apply(self, session: "DocumentSession") -> None:
+        session.turn_pages(self.pages, self.angle)
+
+    def revert(self, session: "DocumentSession") -> None:
+        session.turn_pages(self.pages, -self.angle)
+
+    @property
+    def nbytes(self) -> int:
+        return _RECORD_OVERHEAD + self.pages.itemsize * len(self.pages)
+
+
+@dataclass
+class SetOrderOp(Operation):
+    """Replace the whole order; both sides are stored as compact runs."""
+
+    before: PageOrder
+    after: PageOrder
+
+    def apply(self, session: "DocumentSession") -> None:
+        session.page_order = self.after
+
+    def revert(self, session: "DocumentSession") -> None:
+        session.page_order = self.before
+
+    @property
+    def nbytes(self) -> int:
+        return _RECORD_OVERHEAD + self.before.nbytes + self.after.nbytes
+
+
+class OperationLog:
+    """Operations in a deque, oldest dropped first once their total cost exceeds `max_bytes`.
+
+    The newest operation is always kept, even when it alone is over budget.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_HISTORY_BYTES) -> None:
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self._entries: Deque[Operation] = deque()
+
+    def push(self, operation: Operation) -> None:
+        self._entries.append(operation)
+        self.bytes += operation.nbytes
+        while self.bytes > self.max_bytes and len(self._entries) > 1:
+            self.bytes -= self._entries.popleft().nbytes
+
+    def pop(self) -> Optional[Operation]:
+        if not self._entries:
+            return None
+        operation = self._entries.pop()
+        self.bytes -= operation.nbytes
+        return operation
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __bool__(self) -> bool:
+        return bool(self._entries)
@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import hashlib
+from bisect import bisect_left
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from pdfsuite.core.text_index import normalize_text
+
+# Perceptual hashes within this many differing bits count as "the same page, edited".
+VISUAL_DISTANCE = 10
+# Gaps between anchors up to this many cells (a pages x b pages) get an exact
+# edit-distance alignment; larger gaps fall back to positional pairing.
+GAP_DP_LIMIT = 40_000
+
+# (first page, second page); None on one side marks a deleted or inserted page.
+Pair = Tuple[Optional[int], Optional[int]]
+
+
+@dataclass(frozen=True)
+class PageSignature:
+    """What alignment knows about a page: a text hash and an optional 64-bit visual hash."""
+
+    text: str
+    visual: Optional[int] = None
+
+    @property
+    def key(self) -> Tuple[str, Optional[int]]:
+        return self.text, self.visual
+
+    def similar(self, other: "PageSignature") -> bool:
+        if self.text and self.text == other.text:
+            return True
+        if self.visual is None or other.visual is None:
+            return False
+        return bin(self.visual ^ other.visual).count("1") <= VISUAL_DISTANCE
+
+
+def text_signature(text: str) -> str:
+    """Hash of normalized page text; empty for pages without text (scans, blank pages)."""
+    normalized = normalize_text(text)
+    if not normalized:
+        return ""
+    return hashlib.sha1(normalized.encode("utf-8")).hexdigest()
+
+
+def average_hash(pixels: Sequence[int]) -> int:
+    """64-bit average hash of an 8x8 grayscale thumbnail (row-major pixel values)."""
+    mean = sum(pixels) / len(pixels)
+    value = 0
+    for pixel in pixels:
+        value = (value << 1) | (pixel > mean)
+    return value
+
+
+def align_pages(first: Sequence[PageSignature], second: Sequence[PageSignature]) -> List[Pair]:
+    """Match pages of two revisions in order, reporting inserted and deleted pages.
+
+    Patience alignment: pages whose signature is unique in both documents are
+    anchors, the longest run of anchors in the same order is kept, and the gaps
+    between anchors are aligned recursively (then by edit distance on page
+    similarity when no anchors remain). Near-linear for typical revisions.
+    Page numbers in the result are 1-based.
+    """
+    pairs: List[Pair] = []
+    _align(first, second, 0, len(first), 0, len(second), pairs)
+    return pairs
+
+
+def _align(
+    first: Sequence[PageSignature],
+    second: Sequence[PageSignature],
+    a_lo: int,
+    a_hi: int,
+    b_lo: int,
+    b_hi: int,
+    out: List[Pair],
+) -> None:
+    # Peel off identical leading and trailing pages first.
+    while a_lo < a_hi and b_lo < b_hi and first[a_lo].key == second[b_lo].key:
+        out.append((a_lo + 1, b_lo + 1))
+        a_lo, b_lo = a_lo + 1, b_lo + 1
+    tail: List[Pair] = []
+    while a_lo < a_hi and b_lo < b_hi and first[a_hi - 1].key == second[b_hi - 1].key:
+        tail.append((a_hi, b_hi))
+        a_hi, b_hi = a_hi - 1, b_hi - 1
+
+    anchors = _anchors(first, second, a_lo, a_hi, b_lo, b_hi)
+    if anchors:
+        a_prev, b_prev = a_lo, b_lo
+        for a_index, b_index in anchors:
+            _align(first, second, a_prev, a_index, b_prev, b_index, out)
+            out.append((a_index + 1, b_index + 1))
+            a_prev, b_prev = a_index + 1, b_index + 1
+        _align(first, second, a_prev, a_hi, b_prev, b_hi, out)
+    else:
+        _align_gap(first, second, a_lo, a_hi, b_lo, b_hi, out)
+    out.extend(reversed(tail))
+
+
+def _anchors(
+    first: Sequence[PageSignature],
+    second: Sequence[PageSignature],
+    a_lo: int,
+    a_hi: int,
+    b_lo: int,
+    b_hi: int,
+) -> List[Tuple[int, int]]:
+    """Longest increasing chain of (a, b) indexes whose keys are unique on both sides."""
+    a_counts = Counter(first[i].key for i in range(a_lo, a_hi))
+    b_index: Dict[Tuple[str, Optional[int]], int] = {}
+    b_counts: Counter = Counter()
+    for j in range(b_lo, b_hi):
+        key = second[j].key
+        b_counts[key] += 1
+        b_index[key] = j
+    candidates = [
+        (i, b_index[first[i].key])
+        for i in range(a_lo, a_hi)
+        if a_counts[first[i].key] == 1 and b_counts.get(first[i].key) == 1
+    ]
+    if not candidates:
+        return []
+    # Longest increasing subsequence on b indexes (patience sorting).
+    tails: List[int] = []
+    tail_at: List[int] = []
+    previous: List[int] = [-1] * len(candidates)
+    for position, (_, b) in enumerate(candidates):
+        slot = bisect_left(tails, b)
+        if slot == len(tails):
+            tails.append(b)
+            tail_at.append(position)
+        else:
+            tails[slot] = b
+            tail_at[slot] = position
+        previous[position] = tail_at[slot - 1] if slot else -1
+    chain = []
+    position = tail_at[-1]
+    while position >= 0:
+        chain.append(candidates[position])
+        position = previous[position]
+    return chain[::-1]
+
+
+def _align_gap(
+    first: Sequence[PageSignature],
+    second: Sequence[PageSignature],
+    a_lo: int,
+    a_hi: int,
+    b_lo: int,
+    b_hi: int,
+    out: List[Pair],
+) -> None:
+    rows, cols = a_hi - a_lo, b_hi - b_lo
+    if not rows or not cols:
+        out.extend((i + 1, None) for i in range(a_lo, a_hi))
+        out.extend((None, j + 1) for j in range(b_lo, b_hi))
+        return
+    if rows * cols > GAP_DP_LIMIT:
+        # Too large to align exactly: pair in order and report the overhang.
+        common = min(rows, cols)
+        out.extend((a_lo + k + 1, b_lo + k + 1) for k in range(common))
+        out.extend((i + 1, None) for i in range(a_lo + common, a_hi))
+        out.extend((None, j + 1) for j in range(b_lo + common, b_hi))
+        return
+    # Edit distance: pairing similar pages is free, pairing dissimilar ones costs
+    # slightly less than a delete plus an insert, so same-count gaps stay paired.
+    cost = [[0] * (cols + 1) for _ in range(rows + 1)]
+    for i in range(1, rows + 1):
+        cost[i][0] = i * 2
+    for j in range(1, cols + 1):
+        cost[0][j] = j * 2
+    for i in range(1, rows + 1):
+        page = first[a_lo + i - 1]
+        for j in range(1, cols + 1):
+            pair_cost = 0 if page.similar(second[b_lo + j - 1]) else 3
+            cost[i][j] = min(
+                cost[i - 1][j - 1] + pair_cost,
+                cost[i - 1][j] + 2,
+                cost[i][j - 1] + 2,
+            )
+    # Walking back from the end, similar pairs are taken first; on ties between a
+    # dissimilar pair and an insert/delete, the unmatched page is placed last so
+    # edited pages pair up in order, as in the positional fallback above.
+    steps: List[Pair] = []
+    i, j = rows, cols
+    while i or j:
+        if i and j:
+            similar = first[a_lo + i - 1].similar(second[b_lo + j - 1])
+            diagonal = cost[i][j] == cost[i - 1][j - 1] + (0 if similar else 3)
+            overhang = cost[i][j] == cost[i - 1][j] + 2 or cost[i][j] == cost[i][j - 1] + 2
+            if diagonal and (similar or not overhang):
+                steps.append((a_lo + i, b_lo + j))
+                i, j = i - 1, j - 1
+                continue
+        if i and cost[i][j] == cost[i - 1][j] + 2:
+            steps.append((a_lo + i, None))
+            i -= 1
+        else:
+            steps.append((None, b_lo + j))
+            j -= 1
+    out.extend(reversed(steps))
@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_right
+from typing import Iterable, Iterator, List, Sequence, Tuple, Union, overload
+
+# (first, last) page numbers of one run, inclusive; descending when first > last.
+Run = Tuple[int, int]
+
+
+class PageOrder:
+    """A sequence of 1-based page numbers stored as run-length ranges.
+
+    ``1..50000`` is a single run, so a freshly opened document costs a few
+    bytes regardless of its length, and edits cost O(runs + selection) rather
+    than O(pages). Runs may ascend or descend. Behaves like a read-only list
+    for indexing, slicing, iteration, ``len``, ``index``, and ``==``.
+    """
+
+    __slots__ = ("_firsts", "_lasts", "_offsets", "_length")
+
+    def __init__(self, pages: Iterable[int] = ()) -> None:
+        self._set_runs(_coalesce((page, page) for page in pages))
+
+    @classmethod
+    def range(cls, count: int) -> "PageOrder":
+        """Pages ``1..count`` in document order."""
+        return cls.from_runs([(1, count)] if count > 0 else [])
+
+    @classmethod
+    def from_runs(cls, runs: Iterable[Run]) -> "PageOrder":
+        order = cls.__new__(cls)
+        order._set_runs(_coalesce(runs))
+        return order
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the run arrays."""
+        return sum(arr.itemsize * len(arr) for arr in (self._firsts, self._lasts, self._offsets))
+
+    def runs(self) -> List[Run]:
+        return list(zip(self._firsts, self._lasts))
+
+    def copy(self) -> "PageOrder":
+        order = PageOrder.__new__(PageOrder)
+        order._firsts = array("I", self._firsts)
+        order._lasts = array("I", self._lasts)
+        order._offsets = array("I", self._offsets)
+        order._length = self._length
+        return order
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[int]:
+        for first, last in zip(self._firsts, self._lasts):
+            yield from _run_pages(first, last)
+
+    @overload
+    def __getitem__(self, position: int) -> int: ...
+
+    @overload
+    def __getitem__(self, position: slice) -> List[int]: ...
+
+    def __getitem__(self, position: Union[int, slice]) -> Union[int, List[int]]:
+        if isinstance(position, slice):
+            start, stop, step = position.indices(self._length)
+            if step != 1:
+                return [self[index] for index in range(start, stop, step)]
+            return self._slice(start, stop)
+        if position < 0:
+            position += self._length
+        if not 0 <= position < self._length:
+            raise IndexError("page order index out of range")
+        run = bisect_right(self._offsets, position) - 1
+        return _page_at(self._firsts[run], self._lasts[run], position - self._offsets[run])
+
+    def __contains__(self, page: object) -> bool:
+        return isinstance(page, int) and self._find(page) >= 0
+
+    def index(self, page: int) -> int:
+        position = self._find(page)
+        if position < 0:
+            raise ValueError(f"{page} is not in page order")
+        return position
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, PageOrder):
+            return self._firsts == other._firsts and self._lasts == other._lasts
+        if isinstance(other, Sequence) and not isinstance(other, (str, bytes)):
+            return len(other) == self._length and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"PageOrder({self.spec()})"
+
+    def spec(self) -> str:
+        """qpdf page-range syntax, one ``a-b`` span per run (descending spans are ``b-a``)."""
+        return ",".join(str(a) if a == b else f"{a}-{b}" for a, b in self.runs())
+
+    def take(self, positions: Sequence[int]) -> Tuple["PageOrder", "PageOrder"]:
+        """Split into (pages at `positions`, everything else), both in their current order.
+
+        `positions` must be sorted, unique, and in range.
+        """
+        taken: List[Run] = []
+        kept: List[Run] = []
+        cursor = 0
+        for first, last, offset in zip(self._firsts, self._lasts, self._offsets):
+            end = offset + _run_length(first, last)
+            piece_start = offset
+            while cursor < len(positions) and positions[cursor] < end:
+                position = positions[cursor]
+                if position > piece_start:
+                    kept.append(_sub_run(first, last, piece_start - offset, position - offset))
+                page = _page_at(first, last, position - offset)
+                taken.append((page, page))
+                piece_start = position + 1
+                cursor += 1
+            if piece_start < end:
+                kept.append(_sub_run(first, last, piece_start - offset, end - offset))
+        return PageOrder.from_runs(taken), PageOrder.from_runs(kept)
+
+    def inserted(self, position: int, pages: "PageOrder") -> "PageOrder":
+        """A new order with `pages` spliced in before `position` (clamped to the ends)."""
+        position = max(0, min(position, self._length))
+        head = self._slice_runs(0, position)
+        tail = self._slice_runs(position, self._length)
+        return PageOrder.from_runs(head + pages.runs() + tail)
+
+    def restored(self, positions: Sequence[int], pages: Iterable[int]) -> "PageOrder":
+        """Inverse of `take`: a new order with `pages` put back at the sorted `positions`."""
+        runs: List[Run] = []
+        consumed = 0
+        for placed, (position, page) in enumerate(zip(positions, pages)):
+            upto = position - placed
+            runs.extend(self._slice_runs(consumed, upto))
+            runs.append((page, page))
+            consumed = upto
+        runs.extend(self._slice_runs(consumed, self._length))
+        return PageOrder.from_runs(runs)
+
+    def _slice(self, start: int, stop: int) -> List[int]:
+        pages: List[int] = []
+        for first, last in self._slice_runs(start, stop):
+            pages.extend(_run_pages(first, last))
+        return pages
+
+    def _slice_runs(self, start: int, stop: int) -> List[Run]:
+        if start >= stop:
+            return []
+        runs = []
+        run = bisect_right(self._offsets, start) - 1
+        while run < len(self._firsts) and self._offsets[run] < stop:
+            first, last, offset = self._firsts[run], self._lasts[run], self._offsets[run]
+            length = _run_length(first, last)
+            lo = max(start - offset, 0)
+            hi = min(stop - offset, length)
+            runs.append(_sub_run(first, last, lo, hi))
+            run += 1
+        return runs
+
+    def _find(self, page: int) -> int:
+        for first, last, offset in zip(self._firsts, self._lasts, self._offsets):
+            if min(first, last) <= page <= max(first, last):
+                return offset + abs(page - first)
+        return -1
+
+    def _set_runs(self, runs: List[Run]) -> None:
+        self._firsts = array("I", (first for first, _ in runs))
+        self._lasts = array("I", (last for _, last in runs))
+        self._offsets = array("I")
+        total = 0
+        for first, last in runs:
+            self._offsets.append(total)
+            total += _run_length(first, last)
+        self._length = total
+
+
+def _run_length(first: int, last: int) -> int:
+    return abs(last - first) + 1
+
+
+def _page_at(first: int, last: int, offset: int) -> int:
+    return first + offset if last >= first else first - offset
+
+
+def _run_pages(first: int, last: int) -> range:
+    return range(first, last + 1) if last >= first else range(first, last - 1, -1)
+
+
+def _sub_run(first: int, last: int, lo: int, hi: int) -> Run:
+    """Positions [lo, hi) of a run as a run."""
+    return _page_at(first, last, lo), _page_at(first, last, hi - 1)
+
+
+def _coalesce(runs: Iterable[Run]) -> List[Run]:
+    """Merge adjacent runs that continue each other, so equal sequences get equal runs."""
+    merged: List[Run] = []
+    for first, last in runs:
+        if first < 1 or last < 1:
+            raise ValueError("Page numbers must be positive.")
+        if merged:
+            prev_first, prev_last = merged[-1]
+            if prev_first != prev_last:
+                steps = {1 if prev_last > prev_first else -1}
+            else:
+                steps = {1, -1}  # a single page can start a run in either direction
+            if first != last:
+                steps &= {1 if last > first else -1}
+            if any(first == prev_last + step for step in steps):
+                merged[-1] = (prev_first, last)
+                continue
+        merged.append((first, last))
+    return merged
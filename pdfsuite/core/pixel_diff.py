@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+# Per-channel difference (0-255) below which a pixel counts as unchanged,
+# so anti-aliasing jitter between renderer versions does not light up.
+DEFAULT_THRESHOLD = 24
+# Changed pixels are grouped on a grid of CELL x CELL blocks before boxing.
+CELL = 16
+HIGHLIGHT = (0, 0, 255)
+BOX_OUTLINE = (255, 0, 0)
+
+Box = Tuple[int, int, int, int]
+
+
+@dataclass
+class PageDiff:
+    """Difference between one pair of page rasters.
+
+    `score` is the fraction of pixels that changed (0.0 identical, 1.0 every
+    pixel); `boxes` are (left, top, right, bottom) pixel bounds of changed regions.
+    """
+
+    page: int
+    score: float
+    changed_pixels: int
+    boxes: List[Box] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, object]:
+        payload = asdict(self)
+        payload["boxes"] = [list(box) for box in self.boxes]
+        return payload
+
+
+def available() -> bool:
+    """True when NumPy and Pillow are importable (the ``pixel`` extra)."""
+    try:
+        import numpy  # noqa: F401
+        from PIL import Image  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def load_raster(path: Path):
+    """Read a page image as an (H, W, 3) uint8 array."""
+    import numpy as np
+    from PIL import Image
+
+    with Image.open(path) as image:
+        return np.asarray(image.convert("RGB"))
+
+
+def pad_to(array, height: int, width: int):
+    """Extend an RGB raster with white to `height` x `width` (pages of different sizes)."""
+    import numpy as np
+
+    if array.shape[0] == height and array.shape[1] == width:
+        return array
+    padded = np.full((height, width, 3), 255, dtype=np.uint8)
+    padded[: array.shape[0], : array.shape[1]] = array
+    return padded
+
+
+def changed_mask(first, second, threshold: int = DEFAULT_THRESHOLD):
+    """Boolean (H, W) mask of pixels whose largest channel difference exceeds `threshold`."""
+    import numpy as np
+
+    height = max(first.shape[0], second.shape[0])
+    width = max(first.shape[1], second.shape[1])
+    first, second = pad_to(first, height, width), pad_to(second, height, width)
+    delta = np.abs(first.astype(np.int16) - second.astype(np.int16)).max(axis=2)
+    return delta > threshold
+
+
+def bounding_boxes(mask, cell: int = CELL) -> List[Box]:
+    """Bounds of connected changed regions, grouped on a `cell`-pixel grid.
+
+    The mask is reduced to one flag per cell (vectorized), neighbouring
+    flagged cells are joined with a flood fill over that small grid, and each
+    group's box is then tightened to the changed pixels inside it.
+    """
+    import numpy as np
+
+    height, width = mask.shape
+    rows, cols = -(-height // cell), -(-width // cell)
+    padded = np.zeros((rows * cell, cols * cell), dtype=bool)
+    padded[:height, :width] = mask
+    grid = padded.reshape(rows, cell, cols, cell).any(axis=(1, 3))
+
+    seen = np.zeros_like(grid)
+    boxes: List[Box] = []
+    for start in zip(*np.nonzero(grid)):
+        if seen[start]:
+            continue
+        seen[start] = True
+        queue = deque([start])
+        top, left, bottom, right = start[0], start[1], start[0], start[1]
+        while queue:
+            r, c = queue.popleft()
+            top, bottom = min(top, r), max(bottom, r)
+            left, right = min(left, c), max(right, c)
+            for nr in (r - 1, r, r + 1):
+                for nc in (c - 1, c, c + 1):
+                    if 0 <= nr < rows and 0 <= nc < cols and grid[nr, nc] and not seen[nr, nc]:
+                        seen[nr, nc] = True
+                        queue.append((nr, nc))
+        region = mask[top * cell : (bottom + 1) * cell, left * cell : (right + 1) * cell]
+        ys, xs = np.nonzero(region)
+        boxes.append(
+            (
+                int(left * cell + xs.min()),
+                int(top * cell + ys.min()),
+                int(left * cell + xs.max()) + 1,
+                int(top * cell + ys.max()) + 1,
+            )
+        )
+    return boxes
+
+
+def highlight(base, mask, boxes: List[Box]):
+    """Faded copy of `base` with changed pixels painted blue and regions outlined red."""
+    import numpy as np
+
+    height, width = mask.shape
+    canvas = pad_to(base, height, width).astype(np.uint16)
+    canvas = (canvas + 255 * 2) // 3  # fade unchanged content so changes stand out
+    canvas = canvas.astype(np.uint8)
+    canvas[mask] = HIGHLIGHT
+    for left, top, right, bottom in boxes:
+        canvas[top:bottom, left] = BOX_OUTLINE
+        canvas[top:bottom, right - 1] = BOX_OUTLINE
+        canvas[top, left:right] = BOX_OUTLINE
+        canvas[bottom - 1, left:right] = BOX_OUTLINE
+    return canvas
+
+
+def diff_arrays(first, second, page: int = 1, threshold: int = DEFAULT_THRESHOLD):
+    """Compare two RGB rasters; returns the PageDiff and the changed-pixel mask."""
+    mask = changed_mask(first, second, threshold)
+    changed = int(mask.sum())
+    boxes = bounding_boxes(mask) if changed else []
+    score = changed / mask.size if mask.size else 0.0
+    return PageDiff(page=page, score=score, changed_pixels=changed, boxes=boxes), mask
+
+
+def diff_images(
+    first: Path,
+    second: Path,
+    output: Path,
+    page: int = 1,
+    threshold: int = DEFAULT_THRESHOLD,
+) -> PageDiff:
+    """Diff two page images in-process and write the highlighted result to `output`."""
+    from PIL import Image
+
+    a, b = load_raster(first), load_raster(second)
+    result, mask = diff_arrays(a, b, page, threshold)
+    Image.fromarray(highlight(b, mask, result.boxes)).save(output, "PNG", compress_level=1)
+    return result
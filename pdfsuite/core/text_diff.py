@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import html
+from dataclasses import dataclass, field
+from difflib import SequenceMatcher
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from pdfsuite.core.page_align import PageSignature, align_pages, text_signature
+
+# Unchanged words kept on each side of a change in the HTML report.
+CONTEXT_WORDS = 8
+
+# ("equal" | "delete" | "insert", words)
+Chunk = Tuple[str, List[str]]
+
+
+@dataclass
+class PageTextDiff:
+    """Word-level changes for one aligned page pair (or a wholly inserted/deleted page).
+
+    `page` is the first-document page and `second_page` its partner; one of
+    them is None for inserted and deleted pages.
+    """
+
+    page: Optional[int]
+    second_page: Optional[int]
+    chunks: List[Chunk] = field(default_factory=list)
+
+    @property
+    def status(self) -> str:
+        if self.page is None:
+            return "inserted"
+        if self.second_page is None:
+            return "deleted"
+        return "changed"
+
+    @property
+    def anchor(self) -> str:
+        if self.page is None:
+            return f"inserted-{self.second_page}"
+        return f"page-{self.page}"
+
+    @property
+    def label(self) -> str:
+        if self.page is None:
+            return f"Inserted page {self.second_page}"
+        if self.second_page is None:
+            return f"Deleted page {self.page}"
+        if self.page == self.second_page:
+            return f"Page {self.page}"
+        return f"Page {self.page} → {self.second_page}"
+
+    @property
+    def added(self) -> int:
+        return sum(len(words) for op, words in self.chunks if op == "insert")
+
+    @property
+    def removed(self) -> int:
+        return sum(len(words) for op, words in self.chunks if op == "delete")
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "page": self.page,
+            "second_page": self.second_page,
+            "status": self.status,
+            "anchor": self.anchor,
+            "added": self.added,
+            "removed": self.removed,
+            "changes": [
+                {"op": op, "text": " ".join(words)} for op, words in self.chunks if op != "equal"
+            ],
+        }
+
+
+@dataclass
+class TextDiffReport:
+    pages: List[PageTextDiff]
+    unchanged: List[int]
+
+    @property
+    def inserted(self) -> List[int]:
+        return [diff.second_page for diff in self.pages if diff.page is None]
+
+    @property
+    def deleted(self) -> List[int]:
+        return [diff.page for diff in self.pages if diff.second_page is None]
+
+    @property
+    def changed(self) -> List[PageTextDiff]:
+        return [diff for diff in self.pages if diff.status == "changed"]
+
+
+def diff_words(first: Sequence[str], second: Sequence[str]) -> List[Chunk]:
+    """Word runs tagged equal/delete/insert; a replacement becomes a delete then an insert."""
+    chunks: List[Chunk] = []
+    matcher = SequenceMatcher(None, first, second, autojunk=False)
+    for tag, a_lo, a_hi, b_lo, b_hi in matcher.get_opcodes():
+        if tag in ("equal", "delete", "replace") and a_hi > a_lo:
+            chunks.append(("equal" if tag == "equal" else "delete", list(first[a_lo:a_hi])))
+        if tag in ("insert", "replace") and b_hi > b_lo:
+            chunks.append(("insert", list(second[b_lo:b_hi])))
+    return chunks
+
+
+def diff_texts(first: Sequence[str], second: Sequence[str]) -> TextDiffReport:
+    """Align two documents' per-page texts and word-diff every page that changed.
+
+    Pages are matched with `align_pages` on text hashes, so inserted and
+    deleted pages do not shift every later comparison. Pages with the same
+    words (whitespace and line breaks aside) are listed as unchanged.
+    """
+    a_hashes = [text_signature(text) for text in first]
+    b_hashes = [text_signature(text) for text in second]
+    pairs = align_pages(
+        [PageSignature(key) for key in a_hashes], [PageSignature(key) for key in b_hashes]
+    )
+    pages: List[PageTextDiff] = []
+    unchanged: List[int] = []
+    for a, b in pairs:
+        a_words = first[a - 1].split() if a is not None else []
+        b_words = second[b - 1].split() if b is not None else []
+        if a is not None and b is not None and a_words == b_words:
+            unchanged.append(a)
+            continue
+        pages.append(PageTextDiff(page=a, second_page=b, chunks=diff_words(a_words, b_words)))
+    return TextDiffReport(pages=pages, unchanged=unchanged)
+
+
+def report_payload(report: TextDiffReport, first: str, second: str) -> Dict[str, object]:
+    return {
+        "first": first,
+        "second": second,
+        "unchanged": report.unchanged,
+        "deleted": report.deleted,
+        "inserted": report.inserted,
+        "pages": [diff.to_dict() for diff in report.pages],
+    }
+
+
+def render_html(report: TextDiffReport, first: str, second: str) -> str:
+    """Standalone HTML change report: a linked page index, then one section per page."""
+    title = f"Text changes: {first} → {second}"
+    lines = [
+        "<!DOCTYPE html>",
+        '<html><head><meta charset="utf-8">',
+        f"<title>{html.escape(title)}</title>",
+        "<style>"
+        "body{font-family:sans-serif;max-width:60em;margin:2em auto;line-height:1.5}"
+        "del{background:#fdd;color:#900}ins{background:#dfd;color:#060;text-decoration:none}"
+        ".gap{color:#999}"
+        "</style></head><body>",
+        f"<h1>{html.escape(title)}</h1>",
+        f"<p>{len(report.changed)} changed, {len(report.inserted)} inserted, "
+        f"{len(report.deleted)} deleted, {len(report.unchanged)} unchanged page(s).</p>",
+    ]
+    if report.pages:
+        lines.append("<ul>")
+        for diff in report.pages:
+            lines.append(
+                f'<li><a href="#{diff.anchor}">{html.escape(diff.label)}</a> '
+                f"(+{diff.added} / −{diff.removed} words)</li>"
+            )
+        lines.append("</ul>")
+    for diff in report.pages:
+        lines.append(f'<section id="{diff.anchor}"><h2>{html.escape(diff.label)}</h2>')
+        lines.append(f"<p>{_render_chunks(diff.chunks)}</p></section>")
+    lines.append("</body></html>")
+    return "\n".join(lines) + "\n"
+
+
+def _render_chunks(chunks: Sequence[Chunk]) -> str:
+    parts = []
+    last = len(chunks) - 1
+    for index, (op, words) in enumerate(chunks):
+        if op == "delete":
+            parts.append(f"<del>{_escape(words)}</del>")
+        elif op == "insert":
+            parts.append(f"<ins>{_escape(words)}</ins>")
+        else:
+            head = words[:CONTEXT_WORDS] if index > 0 else []
+            tail = words[-CONTEXT_WORDS:] if index < last else []
+            if len(head) + len(tail) < len(words):
+                gap = '<span class="gap">…</span>'
+                parts.append(" ".join(filter(None, (_escape(head), gap, _escape(tail)))))
+            else:
+                parts.append(_escape(words))
+    return " ".join(parts)
+
+
+def _escape(words: Sequence[str]) -> str:
+    return html.escape(" ".join(words))
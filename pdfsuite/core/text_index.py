@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import gzip
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from pdfsuite.utils.cache import AUXILIARY_CACHES, cache_root, file_sha256, prune_lru
+
+INDEX_VERSION = 1
+# Pages per pdftotext run when scanning a document that has no index yet.
+SCAN_CHUNK_PAGES = 25
+
+
+class TextExtractionError(RuntimeError):
+    """Neither pdftotext nor an in-process extractor could read the document."""
+
+
+@dataclass(frozen=True)
+class SearchHit:
+    page: int
+    count: int
+
+
+@dataclass
+class TextIndex:
+    """Normalized per-page text for one document, searchable without re-extraction."""
+
+    source_hash: str
+    pages: List[str]
+    _results: Dict[str, List[SearchHit]] = field(default_factory=dict, init=False, repr=False)
+
+    @property
+    def page_count(self) -> int:
+        return len(self.pages)
+
+    def search(self, query: str) -> List[SearchHit]:
+        """Pages containing `query` (case/whitespace-insensitive) in page order, with counts."""
+        needle = normalize_text(query)
+        if not needle:
+            return []
+        cached = self._results.get(needle)
+        if cached is None:
+            cached = list(iter_hits(enumerate(self.pages, start=1), needle))
+            self._results[needle] = cached
+        return list(cached)
+
+    def ranked(self, query: str) -> List[SearchHit]:
+        """Search hits ordered by match count, then page number."""
+        return sorted(self.search(query), key=lambda hit: (-hit.count, hit.page))
+
+    def to_payload(self) -> Dict[str, object]:
+        return {"version": INDEX_VERSION, "source": self.source_hash, "pages": self.pages}
+
+
+def normalize_text(text: str) -> str:
+    """Lowercase and collapse whitespace so phrases match across line wraps."""
+    return " ".join(text.split()).lower()
+
+
+def iter_hits(pages: Iterable[Tuple[int, str]], needle: str) -> Iterator[SearchHit]:
+    """Yield a hit for every (page, normalized text) pair containing the normalized `needle`."""
+    for number, text in pages:
+        count = text.count(needle)
+        if count:
+            yield SearchHit(page=number, count=count)
+
+
+def index_root() -> Path:
+    return cache_root() / AUXILIARY_CACHES["text"][0]
+
+
+def index_path(source_hash: str, root: Path | None = None) -> Path:
+    return (root or index_root()) / source_hash[:2] / f"{source_hash}.json.gz"
+
+
+def load_or_build(pdf: Path, root: Path | None = None) -> TextIndex:
+    """Return the stored index for `pdf`'s content, extracting and saving it on a miss."""
+    source_hash = file_sha256(pdf)
+    stored = load_index(source_hash, root)
+    if stored is not None:
+        return stored
+    index = TextIndex(
+        source_hash=source_hash,
+        pages=[normalize_text(text) for text in extract_page_texts(pdf)],
+    )
+    save_index(index, root)
+    return index
+
+
+def load_index(source_hash: str, root: Path | None = None) -> TextIndex | None:
+    path = index_path(source_hash, root)
+    try:
+        with gzip.open(path, "rt", encoding="utf-8") as handle:
+            payload = json.load(handle)
+    except (OSError, ValueError):
+        return None
+    if payload.get("version") != INDEX_VERSION or payload.get("source") != source_hash:
+        return None
+    try:
+        os.utime(path)  # last used, for LRU pruning
+    except OSError:
+        pass
+    return TextIndex(source_hash=source_hash, pages=list(payload.get("pages", [])))
+
+
+def save_index(index: TextIndex, root: Path | None = None) -> Path:
+    path = index_path(index.source_hash, root)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    with os.fdopen(fd, "wb") as raw, gzip.GzipFile(fileobj=raw, mode="wb") as handle:
+        handle.write(json.dumps(index.to_payload()).encode("utf-8"))
+    os.replace(tmp_name, path)
+    _, pattern, cap = AUXILIARY_CACHES["text"]
+    prune_lru(path.parent.parent, pattern, cap)
+    return path
+
+
+def extract_page_texts(pdf: Path) -> List[str]:
+    """Text of every page, from one pdftotext run (or pypdf when Poppler is missing)."""
+    if shutil.which("pdftotext"):
+        result = subprocess.run(
+            ["pdftotext", "-enc", "UTF-8", str(pdf), "-"],
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        if result.returncode != 0:
+            raise TextExtractionError(result.stderr.strip() or f"pdftotext failed on {pdf}")
+        return split_pages(result.stdout)
+    try:
+        import pypdf
+    except ImportError as exc:
+        raise TextExtractionError("pdftotext (Poppler) or pypdf is required for search.") from exc
+    try:
+        return [page.extract_text() or "" for page in pypdf.PdfReader(pdf).pages]
+    except (pypdf.errors.PyPdfError, OSError) as exc:
+        raise TextExtractionError(f"{pdf}: {exc}") from exc
+
+
+def iter_page_texts(
+    pdf: Path,
+    page_count: int,
+    chunk_pages: int = SCAN_CHUNK_PAGES,
+) -> Iterator[Tuple[int, str]]:
+    """Yield (page, normalized text) in order, a chunk of pages per pdftotext run.
+
+    Lets a search report early pages before the whole document is extracted.
+    """
+    if not shutil.which("pdftotext"):
+        for number, text in enumerate(extract_page_texts(pdf), start=1):
+            yield number, normalize_text(text)
+        return
+    for first in range(1, page_count + 1, chunk_pages):
+        last = min(first + chunk_pages - 1, page_count)
+        result = subprocess.run(
+            ["pdftotext", "-enc", "UTF-8", "-f", str(first), "-l", str(last), str(pdf), "-"],
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        if result.returncode != 0:
+            raise TextExtractionError(result.stderr.strip() or f"pdftotext failed on {pdf}")
+        for offset, text in enumerate(split_pages(result.stdout)):
+            yield first + offset, normalize_text(text)
+
+
+def split_pages(output: str) -> List[str]:
+    """Split pdftotext output on the form feed it writes after every page."""
+    pages = output.split("\f")
+    if pages and not pages[-1].strip():
+        pages.pop()
+    return pages
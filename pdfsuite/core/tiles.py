@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from typing import List, Tuple
+
+# Edge length (pixels) of the tiles a zoomed page is rendered in.
+TILE_SIZE = 512
+
+# (left, top, width, height) in pixels of the scaled page.
+Rect = Tuple[int, int, int, int]
+
+
+def visible_tiles(width: int, height: int, visible: Rect, tile: int = TILE_SIZE) -> List[Rect]:
+    """Grid tiles of a `width` x `height` page that intersect the `visible` rectangle.
+
+    Tiles sit on a fixed grid anchored at the page origin, so the same tile
+    keeps the same rectangle (and cache key) while the view scrolls; edge
+    tiles are clipped to the page. Ordered from the centre of `visible`
+    outwards, so the middle of the screen fills in first.
+    """
+    left = max(0, visible[0])
+    top = max(0, visible[1])
+    right = min(width, visible[0] + visible[2])
+    bottom = min(height, visible[1] + visible[3])
+    if tile <= 0 or right <= left or bottom <= top:
+        return []
+    tiles = [
+        (x, y, min(tile, width - x), min(tile, height - y))
+        for y in range(top // tile * tile, bottom, tile)
+        for x in range(left // tile * tile, right, tile)
+    ]
+    centre_x, centre_y = (left + right) / 2, (top + bottom) / 2
+    tiles.sort(
+        key=lambda rect: (rect[0] + rect[2] / 2 - centre_x) ** 2
+        + (rect[1] + rect[3] / 2 - centre_y) ** 2
+    )
+    return tiles
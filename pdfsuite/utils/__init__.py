@@ -1 +1 @@
-__all__ = ["common"]
+__all__ = ["backend", "cache", "common"]
@@ -0,0 +1,377 @@
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import os
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import typer
+from rich import print
+
+from pdfsuite.utils.cache import file_sha256
+from pdfsuite.utils.common import expand_range_token
+
+BACKEND_ENV = "PDFSUITE_BACKEND"
+BACKEND_CHOICES = ("auto", "pikepdf", "pypdf", "cli")
+# Page-tree levels searched for inherited /Resources (guards against /Parent cycles).
+PAGE_TREE_DEPTH = 64
+
+# (source PDF, qpdf-style range tokens) pairs, concatenated in order.
+Segments = Sequence[Tuple[Path, Sequence[str]]]
+# (range tokens, destination PDF) pairs cut from a single source.
+Slices = Sequence[Tuple[Sequence[str], Path]]
+# (clockwise degrees, range tokens over the *output* pages) pairs, like qpdf --rotate.
+Rotations = Sequence[Tuple[int, Sequence[str]]]
+
+
+class BackendError(RuntimeError):
+    """A native backend could not read or write a document."""
+
+
+class PdfBackend:
+    """In-process page operations that would otherwise shell out to qpdf."""
+
+    name = "base"
+    # Library exceptions that mean "this document could not be processed".
+    errors: Tuple[type, ...] = (OSError,)
+
+    def page_count(self, pdf: Path) -> int:
+        with self._translated(pdf), self._open(pdf) as doc:
+            return self._count(doc)
+
+    def assemble(self, segments: Segments, output: Path, rotations: Rotations = ()) -> None:
+        """Write the selected pages of each source, in order, to `output`.
+
+        `rotations` turn output pages relative to their current rotation in the same write.
+        """
+        with contextlib.ExitStack() as stack:
+            opened: Dict[Path, object] = {}
+            pages = []
+            for source, tokens in segments:
+                with self._translated(source):
+                    if source not in opened:
+                        opened[source] = stack.enter_context(self._open(source))
+                    pages.extend(self._pages(opened[source], tokens, source))
+            turns = _resolve_turns(rotations, len(pages), output)
+            with self._translated(output):
+                self._write(pages, output, turns)
+
+    def split(self, source: Path, plan: Callable[[int], Slices]) -> int:
+        """Parse `source` once and write every slice `plan(page_count)` asks for.
+
+        Returns the number of files written.
+        """
+        with self._translated(source), self._open(source) as doc:
+            slices = plan(self._count(doc))
+            for tokens, destination in slices:
+                pages = self._pages(doc, tokens, source)
+                with self._translated(destination):
+                    self._write(pages, destination)
+        return len(slices)
+
+    def page_fingerprints(self, pdf: Path) -> List[str]:
+        """One content hash per page: geometry, content streams, resources, and annotations.
+
+        Resources inherited from the page tree count as the page's own, and
+        annotations are hashed with their appearance streams. Identical pages
+        hash alike wherever they sit in a file (or in another file opened with
+        the same backend), so callers can key caches on them.
+        """
+        with self._translated(pdf), self._open(pdf) as doc:
+            return [
+                _digest(self._fingerprint_parts(self._page(doc, index)))
+                for index in range(self._count(doc))
+            ]
+
+    @contextlib.contextmanager
+    def fingerprinter(self, pdf: Path) -> Iterator[Callable[[int], str]]:
+        """Keep `pdf` open and hash single pages (0-based) on demand, like `page_fingerprints`.
+
+        Only the requested page's streams are read, so callers can fingerprint
+        the pages they are about to show instead of the whole file up front.
+        """
+        with self._translated(pdf), self._open(pdf) as doc:
+            yield lambda index: _digest(self._fingerprint_parts(self._page(doc, index)))
+
+    @contextlib.contextmanager
+    def _translated(self, path: Path) -> Iterator[None]:
+        try:
+            yield
+        except self.errors as exc:
+            raise BackendError(f"{path}: {exc}") from exc
+
+    def _pages(self, doc: object, tokens: Sequence[str], source: Path) -> List[object]:
+        total = self._count(doc)
+        selected = []
+        for token in tokens:
+            try:
+                numbers = expand_range_token(token, total)
+            except typer.BadParameter as exc:
+                raise BackendError(f"{source}: {exc.message}") from exc
+            selected.extend(self._page(doc, number - 1) for number in numbers)
+        return selected
+
+    @contextlib.contextmanager
+    def _open(self, pdf: Path) -> Iterator[object]:
+        raise NotImplementedError
+
+    def _count(self, doc: object) -> int:
+        raise NotImplementedError
+
+    def _page(self, doc: object, index: int) -> object:
+        raise NotImplementedError
+
+    def _write(
+        self,
+        pages: List[object],
+        output: Path,
+        turns: Optional[Dict[int, int]] = None,
+    ) -> None:
+        """Write `pages` to `output`, turning output page indexes (0-based) in `turns`."""
+        raise NotImplementedError
+
+    def _fingerprint_parts(self, page: object) -> Iterable[bytes]:
+        raise NotImplementedError
+
+
+class PikepdfBackend(PdfBackend):
+    name = "pikepdf"
+
+    def __init__(self) -> None:
+        import pikepdf
+
+        self._pikepdf = pikepdf
+        self.errors = (pikepdf.PdfError, OSError)
+
+    @contextlib.contextmanager
+    def _open(self, pdf: Path) -> Iterator[object]:
+        with self._pikepdf.open(pdf) as doc:
+            yield doc
+
+    def _count(self, doc) -> int:
+        return len(doc.pages)
+
+    def _page(self, doc, index: int):
+        return doc.pages[index]
+
+    def _write(self, pages, output: Path, turns=None) -> None:
+        result = self._pikepdf.Pdf.new()
+        for page in pages:
+            result.pages.append(page)
+        for index, angle in (turns or {}).items():
+            result.pages[index].rotate(angle, relative=True)
+        result.save(output)
+
+    def _fingerprint_parts(self, page) -> Iterator[bytes]:
+        pikepdf = self._pikepdf
+        yield repr((list(page.mediabox), list(page.cropbox), page.obj.get("/Rotate"))).encode()
+        contents = page.obj.get("/Contents")
+        streams = contents if isinstance(contents, pikepdf.Array) else [contents]
+        for stream in streams:
+            if isinstance(stream, pikepdf.Stream):
+                yield stream.read_bytes()
+        seen: Dict[object, int] = {}
+        parts = (("/Resources", _page_resources(page.obj)), ("/Annots", page.obj.get("/Annots")))
+        for key, value in parts:
+            if value is not None:
+                yield key.encode()
+                yield from self._object_parts(value, seen)
+
+    def _object_parts(self, obj, seen: Dict[object, int]) -> Iterator[bytes]:
+        """Serialize a resource or annotation tree deterministically, stopping at pages.
+
+        An object met again is written as a back-reference to its first-visit
+        index, so which object a name points at still counts.
+        """
+        pikepdf = self._pikepdf
+        if getattr(obj, "is_indirect", False):  # scalars come back as plain Python values
+            if obj.objgen in seen:
+                yield b"@ref%d" % seen[obj.objgen]
+                return
+            seen[obj.objgen] = len(seen)
+        if isinstance(obj, pikepdf.Dictionary) and obj.get("/Type") == pikepdf.Name.Page:
+            yield b"@page"  # /P back-links and link destinations
+        elif isinstance(obj, pikepdf.Stream):
+            yield from self._object_parts(obj.stream_dict, seen)
+            yield obj.read_raw_bytes()
+        elif isinstance(obj, pikepdf.Dictionary):
+            for key in sorted(obj.keys()):
+                yield key.encode()
+                yield from self._object_parts(obj[key], seen)
+        elif isinstance(obj, pikepdf.Array):
+            yield b"["
+            for item in obj:
+                yield from self._object_parts(item, seen)
+            yield b"]"
+        else:
+            yield repr(obj).encode()
+
+
+class PypdfBackend(PdfBackend):
+    name = "pypdf"
+
+    def __init__(self) -> None:
+        import pypdf
+
+        self._pypdf = pypdf
+        # pypdf lets plain ValueError/KeyError/AssertionError escape on malformed files.
+        self.errors = (pypdf.errors.PyPdfError, OSError, ValueError, KeyError, AssertionError)
+
+    @contextlib.contextmanager
+    def _open(self, pdf: Path) -> Iterator[object]:
+        yield self._pypdf.PdfReader(pdf)
+
+    def _count(self, doc) -> int:
+        return len(doc.pages)
+
+    def _page(self, doc, index: int):
+        return doc.pages[index]
+
+    def _write(self, pages, output: Path, turns=None) -> None:
+        writer = self._pypdf.PdfWriter()
+        added = [writer.add_page(page) for page in pages]
+        for index, angle in (turns or {}).items():
+            added[index].rotate(angle)
+        with output.open("wb") as handle:
+            writer.write(handle)
+
+    def _fingerprint_parts(self, page) -> Iterator[bytes]:
+        yield repr((list(page.mediabox), list(page.cropbox), page.rotation)).encode()
+        contents = page.get_contents()
+        if contents is not None:
+            yield contents.get_data()
+        seen: Dict[object, int] = {}
+        parts = (("/Resources", _page_resources(page)), ("/Annots", page.get("/Annots")))
+        for key, value in parts:
+            if value is not None:
+                yield key.encode()
+                yield from self._object_parts(value, seen)
+
+    def _object_parts(self, obj, seen: Dict[object, int]) -> Iterator[bytes]:
+        """Serialize a resource or annotation tree deterministically, stopping at pages.
+
+        An object met again is written as a back-reference to its first-visit
+        index, so which object a name points at still counts.
+        """
+        generic = self._pypdf.generic
+        if isinstance(obj, generic.IndirectObject):
+            if obj.idnum in seen:
+                yield b"@ref%d" % seen[obj.idnum]
+                return
+            seen[obj.idnum] = len(seen)
+            obj = obj.get_object()
+        if isinstance(obj, generic.DictionaryObject) and obj.get("/Type") == "/Page":
+            yield b"@page"  # /P back-links and link destinations
+        elif isinstance(obj, generic.StreamObject):
+            for key in sorted(obj.keys()):
+                yield key.encode()
+                yield from self._object_parts(obj.get(key), seen)
+            yield obj.get_data()
+        elif isinstance(obj, generic.DictionaryObject):
+            for key in sorted(obj.keys()):
+                yield key.encode()
+                yield from self._object_parts(obj.get(key), seen)
+        elif isinstance(obj, generic.ArrayObject):
+            yield b"["
+            for item in obj:
+                yield from self._object_parts(item, seen)
+            yield b"]"
+        else:
+            yield repr(obj).encode()
+
+
+_BACKENDS: Dict[str, Callable[[], PdfBackend]] = {
+    "pikepdf": PikepdfBackend,
+    "pypdf": PypdfBackend,
+}
+
+
+def native_backend() -> Optional[PdfBackend]:
+    """Return the configured in-process backend, or None to use the CLI tools.
+
+    ``PDFSUITE_BACKEND`` picks one explicitly (``pikepdf``, ``pypdf``, ``cli``);
+    the default ``auto`` prefers pikepdf, then pypdf, whichever is installed.
+    With ``auto``, merge/split/reorder therefore stop running qpdf as soon as
+    either library is importable (pypdf often arrives as a dependency of other
+    packages); their output is equivalent but not byte-identical to qpdf's.
+    Set ``PDFSUITE_BACKEND=cli`` to keep the qpdf behaviour.
+    """
+    choice = os.environ.get(BACKEND_ENV, "auto").strip().lower() or "auto"
+    if choice not in BACKEND_CHOICES:
+        print(f"[yellow]Ignoring unknown {BACKEND_ENV}={choice!r}; using auto.[/yellow]")
+        choice = "auto"
+    if choice == "cli":
+        return None
+    names = list(_BACKENDS) if choice == "auto" else [choice]
+    for name in names:
+        try:
+            return _BACKENDS[name]()
+        except ImportError:
+            continue
+    if choice != "auto":
+        print(f"[yellow]{choice} is not installed; falling back to CLI tools.[/yellow]")
+    return None
+
+
+def page_fingerprints(pdf: Path, page_count: int = 0) -> List[str]:
+    """Per-page content hashes from the native backend.
+
+    Without one, pages are identified by file hash and page number, which
+    still matches across reopenings of unchanged files; that fallback needs
+    `page_count` and returns an empty list without it.
+    """
+    backend = native_backend()
+    if backend is not None:
+        try:
+            return backend.page_fingerprints(pdf)
+        except BackendError:
+            pass
+    if page_count <= 0:
+        return []
+    digest = file_sha256(pdf)
+    return [f"{digest}:{page}" for page in range(1, page_count + 1)]
+
+
+def _resolve_turns(rotations: Rotations, total: int, output: Path) -> Dict[int, int]:
+    turns: Dict[int, int] = {}
+    for angle, tokens in rotations:
+        for token in tokens:
+            try:
+                numbers = expand_range_token(token, total)
+            except typer.BadParameter as exc:
+                raise BackendError(f"{output}: {exc.message}") from exc
+            for number in numbers:
+                turns[number - 1] = (turns.get(number - 1, 0) + angle) % 360
+    return {index: angle for index, angle in turns.items() if angle}
+
+
+def _page_resources(page):
+    """A page's /Resources, or the nearest page-tree node's it inherits them from."""
+    node = page
+    for _ in range(PAGE_TREE_DEPTH):
+        if node is None:
+            break
+        resources = node.get("/Resources")
+        if resources is not None:
+            return resources
+        node = node.get("/Parent")
+    return None
+
+
+def _digest(parts: Iterable[bytes]) -> str:
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(len(part).to_bytes(8, "big"))
+        digest.update(part)
+    return digest.hexdigest()
+
+
+def run_native_or_exit(backend: PdfBackend, description: str, action: Callable[[], None]) -> None:
+    """Run a backend action, echoing it like a shell command and exiting on failure."""
+    print(f"[dim]{backend.name}: {description}[/dim]")
+    try:
+        action()
+    except BackendError as exc:
+        print(f"[red]{backend.name} failed:[/red] {exc}")
+        raise typer.Exit(1) from exc
@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+from contextlib import contextmanager, suppress
+from pathlib import Path
+from typing import Dict, Iterator, List, Tuple
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+    import msvcrt
+
+CACHE_DIR_ENV = "PDFSUITE_CACHE_DIR"
+CACHE_MAX_ENV = "PDFSUITE_CACHE_MAX_MB"
+DEFAULT_MAX_BYTES = 2 * 1024 * 1024 * 1024
+HASH_CHUNK = 1024 * 1024
+# Derived caches other features keep under the cache root:
+# name -> (subdirectory, entry glob, default byte cap).
+AUXILIARY_CACHES: Dict[str, Tuple[str, str, int]] = {
+    "thumbnails": ("thumbnails", "*/*/*.png", 512 * 1024 * 1024),
+    "text": ("text", "*/*.json.gz", 256 * 1024 * 1024),
+}
+# Threads of one process share this; the lock file serializes across processes.
+_STATS_LOCK = threading.Lock()
+
+
+def cache_root() -> Path:
+    override = os.environ.get(CACHE_DIR_ENV)
+    if override:
+        return Path(override)
+    return Path.home() / "pdfsuite" / "cache"
+
+
+def default_max_bytes() -> int:
+    raw = os.environ.get(CACHE_MAX_ENV)
+    try:
+        return int(float(raw) * 1024 * 1024) if raw else DEFAULT_MAX_BYTES
+    except ValueError:
+        return DEFAULT_MAX_BYTES
+
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(HASH_CHUNK), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+@functools.lru_cache(maxsize=None)
+def tool_version(tool: str) -> str:
+    """First line of `<tool> --version`, or "missing" when the tool cannot run."""
+    try:
+        result = subprocess.run(
+            [tool, "--version"],
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+    except OSError:
+        return "missing"
+    lines = (result.stdout or result.stderr).strip().splitlines()
+    return lines[0].strip() if lines else "unknown"
+
+
+class ResultCache:
+    """Content-addressed store of finished outputs with size-bounded LRU eviction.
+
+    Entries live under ``objects/<aa>/<key>.pdf``; an entry's mtime doubles as
+    its last-used timestamp so eviction needs no separate index.
+    """
+
+    def __init__(self, root: Path | None = None, max_bytes: int | None = None) -> None:
+        self.root = root or cache_root()
+        self.max_bytes = max_bytes if max_bytes is not None else default_max_bytes()
+        self.objects = self.root / "objects"
+        self.stats_path = self.root / "stats.json"
+        self.lock_path = self.root / "stats.lock"
+
+    def key(self, source: Path, **params: object) -> str:
+        payload = json.dumps(
+            {"source": file_sha256(source), "params": params},
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def path_for(self, key: str) -> Path:
+        return self.objects / key[:2] / f"{key}.pdf"
+
+    def lookup(self, key: str) -> Path | None:
+        entry = self.path_for(key)
+        try:
+            os.utime(entry)
+        except FileNotFoundError:
+            self._record("misses")
+            return None
+        self._record("hits")
+        return entry
+
+    def store(self, key: str, produced: Path) -> Path | None:
+        if not produced.is_file():
+            return None
+        entry = self.path_for(key)
+        entry.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=entry.parent, suffix=".tmp")
+        os.close(fd)
+        try:
+            shutil.copyfile(produced, tmp_name)
+            os.replace(tmp_name, entry)
+        finally:
+            # Only left behind when the copy or rename failed.
+            with suppress(FileNotFoundError):
+                os.unlink(tmp_name)
+        self.prune()
+        return entry
+
+    def entries(self) -> List[Path]:
+        if not self.objects.is_dir():
+            return []
+        return list(self.objects.glob("*/*.pdf"))
+
+    def prune(self, max_bytes: int | None = None) -> Tuple[int, int]:
+        """Evict least recently used entries until the cache fits; return (count, bytes)."""
+        limit = self.max_bytes if max_bytes is None else max_bytes
+        return prune_lru(self.objects, "*/*.pdf", limit)
+
+    def prune_auxiliary(self, max_bytes: int | None = None) -> Dict[str, Tuple[int, int]]:
+        """Trim the thumbnail and text index caches to their caps (or to `max_bytes`)."""
+        return {
+            name: prune_lru(self.root / subdir, pattern, cap if max_bytes is None else max_bytes)
+            for name, (subdir, pattern, cap) in AUXILIARY_CACHES.items()
+        }
+
+    def stats(self) -> Dict[str, object]:
+        counters = self.counters()
+        entries = self.entries()
+        return {
+            "root": str(self.root),
+            "entries": len(entries),
+            "bytes": sum(entry.stat().st_size for entry in entries),
+            "max_bytes": self.max_bytes,
+            "hits": counters.get("hits", 0),
+            "misses": counters.get("misses", 0),
+            "auxiliary": {
+                name: dict(
+                    zip(("entries", "bytes"), cache_usage(self.root / subdir, pattern)),
+                    max_bytes=cap,
+                )
+                for name, (subdir, pattern, cap) in AUXILIARY_CACHES.items()
+            },
+        }
+
+    def counters(self) -> Dict[str, int]:
+        try:
+            payload = json.loads(self.stats_path.read_text(encoding="utf-8"))
+            return {name: int(payload.get(name, 0)) for name in ("hits", "misses")}
+        except (OSError, ValueError, TypeError, AttributeError):
+            return {}  # missing or corrupt: start counting afresh
+
+    def _record(self, counter: str) -> None:
+        with locked(self.lock_path):
+            counters = self.counters()
+            counters[counter] = counters.get(counter, 0) + 1
+            fd, tmp_name = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(counters, handle)
+            os.replace(tmp_name, self.stats_path)
+
+
+def _sized_entries(root: Path, pattern: str) -> List[Tuple[float, int, Path]]:
+    sized = []
+    if not root.is_dir():
+        return sized
+    for entry in root.glob(pattern):
+        try:
+            info = entry.stat()
+        except FileNotFoundError:
+            continue
+        sized.append((info.st_mtime, info.st_size, entry))
+    return sized
+
+
+def cache_usage(root: Path, pattern: str) -> Tuple[int, int]:
+    """(entry count, total bytes) of files matching `pattern` under `root`."""
+    sized = _sized_entries(root, pattern)
+    return len(sized), sum(size for _, size, _ in sized)
+
+
+def prune_lru(root: Path, pattern: str, limit: int) -> Tuple[int, int]:
+    """Delete the oldest-mtime `pattern` files under `root` until `limit` bytes remain.
+
+    Returns (count, bytes) removed; directories emptied along the way go too.
+    """
+    sized = _sized_entries(root, pattern)
+    total = sum(size for _, size, _ in sized)
+    removed = freed = 0
+    for _, size, entry in sorted(sized):
+        if total <= limit:
+            break
+        entry.unlink(missing_ok=True)
+        total -= size
+        removed += 1
+        freed += size
+        for parent in entry.parents:
+            if parent == root:
+                break
+            try:
+                parent.rmdir()
+            except OSError:
+                break
+    return removed, freed
+
+
+@contextmanager
+def locked(path: Path) -> Iterator[None]:
+    """Hold an exclusive lock on `path` (created if needed) across threads and processes."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with _STATS_LOCK, path.open("a+b") as handle:
+        if fcntl is not None:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+        else:  # pragma: no cover - Windows
+            handle.seek(0)
+            msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+            else:  # pragma: no cover - Windows
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
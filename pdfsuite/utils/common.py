@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import contextlib
+import os
 import shutil
 import shlex
 import subprocess
@@ -23,6 +24,12 @@ def run(cmd: str) -> int:
     return result.returncode
 
 
+def spawn(cmd: str) -> subprocess.Popen:
+    """Start a command without a shell so callers can wait on or terminate it."""
+    print(f"[dim]$ {cmd}[/dim]")
+    return subprocess.Popen(shlex.split(cmd))
+
+
 def run_or_exit(cmd: str) -> None:
     """Run a command and exit the CLI if it fails."""
     code = run(cmd)
@@ -37,6 +44,34 @@ def require_tools(*tools: str) -> None:
         raise typer.Exit(1)
 
 
+def default_jobs() -> int:
+    """Worker count for commands that fan out over processes or threads."""
+    return os.cpu_count() or 1
+
+
+def get_page_count(pdf: Path) -> int:
+    """Page count via the native backend, else `qpdf --show-npages`; 0 when unreadable."""
+    from pdfsuite.utils.backend import BackendError, native_backend  # backend imports this module
+
+    backend = native_backend()
+    if backend is not None:
+        try:
+            return backend.page_count(pdf)
+        except BackendError:
+            return 0
+    result = subprocess.run(
+        ["qpdf", "--show-npages", str(pdf)],
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        return 0
+    try:
+        return int(result.stdout.strip())
+    except ValueError:
+        return 0
+
+
 def ensure_output_dir(path: Path) -> Path:
     path.mkdir(parents=True, exist_ok=True)
     return path
@@ -91,3 +126,38 @@ def safe_range_name(token: str) -> str:
     while "--" in sanitized:
         sanitized = sanitized.replace("--", "-")
     return sanitized.strip("-") or "range"
+
+
+def expand_range_token(token: str, total: int) -> List[int]:
+    """Resolve one qpdf-style range token to 1-based page numbers.
+
+    Supports ``N``, ``z``, ``rN`` (Nth from the end), ascending or descending
+    ``a-b`` spans, and the ``:odd``/``:even`` modifiers.
+    """
+    spec = normalize_range_token(token)
+    spec, _, modifier = spec.partition(":")
+    if modifier not in ("", "odd", "even"):
+        raise typer.BadParameter(f"Unsupported range modifier in '{token}'.")
+    first, sep, last = spec.partition("-")
+    start = _resolve_page(first, total, token)
+    end = _resolve_page(last, total, token) if sep else start
+    step = 1 if end >= start else -1
+    pages = list(range(start, end + step, step))
+    if modifier:
+        pages = pages[0 if modifier == "odd" else 1 :: 2]
+    return pages
+
+
+def _resolve_page(value: str, total: int, token: str) -> int:
+    value = value.strip()
+    if value == "z":
+        page = total
+    elif value.startswith("r") and value[1:].isdigit():
+        page = total - int(value[1:]) + 1
+    elif value.isdigit():
+        page = int(value)
+    else:
+        raise typer.BadParameter(f"Invalid page range '{token}'.")
+    if not 1 <= page <= total:
+        raise typer.BadParameter(f"Page range '{token}' is outside 1-{total}.")
+    return page
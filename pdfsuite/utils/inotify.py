@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+from pathlib import Path
+from typing import List
+
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_Q_OVERFLOW = 0x00004000
+IN_CLOEXEC = 0o2000000
+_EVENT_HEADER = struct.Struct("iIII")
+_READ_SIZE = 64 * 1024
+
+
+def _load_libc():
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+    except OSError:
+        return None
+    if not hasattr(libc, "inotify_init1"):
+        return None
+    return libc
+
+
+_LIBC = _load_libc()
+
+
+class InotifyWatcher:
+    """Minimal ctypes inotify wrapper reporting files finished or moved into a directory."""
+
+    def __init__(self, directory: Path, mask: int = IN_CLOSE_WRITE | IN_MOVED_TO) -> None:
+        if _LIBC is None:
+            raise OSError("inotify is not available on this platform.")
+        self.directory = directory
+        self.fd = _LIBC.inotify_init1(IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        wd = _LIBC.inotify_add_watch(self.fd, os.fsencode(directory), mask)
+        if wd < 0:
+            errno = ctypes.get_errno()
+            os.close(self.fd)
+            raise OSError(errno, f"inotify_add_watch failed for {directory}")
+
+    @staticmethod
+    def available() -> bool:
+        return _LIBC is not None
+
+    def wait(self, timeout: float | None = None) -> List[str]:
+        """Block until events arrive (or `timeout` elapses); return affected file names.
+
+        A queue overflow is reported as an empty-string name so callers rescan.
+        """
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return []
+        return self._parse(os.read(self.fd, _READ_SIZE))
+
+    def drain(self) -> List[str]:
+        names: List[str] = []
+        while True:
+            batch = self.wait(0)
+            if not batch:
+                return names
+            names.extend(batch)
+
+    def close(self) -> None:
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+    def __enter__(self) -> "InotifyWatcher":
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        self.close()
+
+    @staticmethod
+    def _parse(buffer: bytes) -> List[str]:
+        names: List[str] = []
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(buffer):
+            _wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(buffer, offset)
+            offset += _EVENT_HEADER.size
+            raw = buffer[offset : offset + length].rstrip(b"\0")
+            offset += length
+            if mask & IN_Q_OVERFLOW:
+                names.append("")
+            elif raw:
+                names.append(os.fsdecode(raw))
+        return names
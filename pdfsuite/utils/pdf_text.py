@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import BinaryIO, Callable, Iterable, List, Optional, Sequence, Tuple
+
+# US Letter, in points.
+SUMMARY_PAGE_SIZE = (612.0, 792.0)
+SUMMARY_MARGIN = 72.0
+
+# Helvetica advance widths (1/1000 em) for printable ASCII, used to size each
+# label page tightly around its text the way pdfcpu sizes text stamps.
+# fmt: off
+_HELVETICA_WIDTHS = (
+    278, 278, 355, 556, 556, 889, 667, 191, 333, 333, 389, 584, 278, 333, 278, 278,
+    556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 278, 278, 584, 584, 584, 556,
+    1015, 667, 667, 722, 722, 667, 611, 778, 722, 278, 500, 667, 556, 833, 722, 778,
+    667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 278, 278, 278, 469, 556,
+    333, 556, 556, 500, 556, 556, 278, 556, 556, 222, 222, 500, 222, 833, 556, 556,
+    556, 556, 333, 500, 278, 556, 500, 722, 500, 500, 500, 334, 260, 334, 584,
+)
+# fmt: on
+
+# (width, height, content stream) of one page.
+Page = Tuple[float, float, bytes]
+
+
+def write_label_pages(
+    destination: Path,
+    labels: Sequence[str],
+    *,
+    font_size: int,
+    on_page: Optional[Callable[[int], None]] = None,
+) -> None:
+    """Write one page per label, each cropped tightly around its Helvetica text.
+
+    Labels must be Latin-1 (the standard font has no other glyphs); `on_page`
+    is called with the 1-based number of every page as it is written.
+    """
+    if not labels:
+        raise ValueError("At least one label is required.")
+    pages = (
+        (
+            max(1.0, text_width(label, font_size)),
+            font_size * 1.2,
+            (
+                f"BT /F1 {font_size} Tf 0 {font_size * 0.25:.2f} Td "
+                f"({_escape_pdf_text(label)}) Tj ET"
+            ).encode("latin-1"),
+        )
+        for label in labels
+    )
+    _write_pdf(destination, pages, len(labels), on_page=on_page)
+
+
+def write_summary_page(
+    destination: Path, title: str, lines: Sequence[str], *, font_size: int = 12
+) -> None:
+    """Write a single Letter page with a `title` and one line of text per entry.
+
+    Characters outside Latin-1 (e.g. in file names) are shown as ``?``.
+    """
+    width, height = SUMMARY_PAGE_SIZE
+    leading = font_size * 1.5
+    parts = [
+        f"BT /F1 {font_size * 1.5:.1f} Tf {leading:.1f} TL "
+        f"{SUMMARY_MARGIN:.1f} {height - SUMMARY_MARGIN:.1f} Td ({_escape_pdf_text(title)}) Tj",
+        f"/F1 {font_size} Tf T*",
+    ]
+    parts.extend(f"T* ({_escape_pdf_text(line)}) Tj" for line in lines)
+    parts.append("ET")
+    content = " ".join(parts).encode("latin-1", errors="replace")
+    _write_pdf(destination, [(width, height, content)], 1)
+
+
+def text_width(text: str, font_size: float) -> float:
+    units = 0
+    for char in text:
+        code = ord(char)
+        units += _HELVETICA_WIDTHS[code - 32] if 32 <= code <= 126 else 556
+    return units * font_size / 1000
+
+
+def _write_pdf(
+    destination: Path,
+    pages: Iterable[Page],
+    total: int,
+    *,
+    on_page: Optional[Callable[[int], None]] = None,
+) -> None:
+    # Object layout: 1 catalog, 2 page tree, 3 font, then a page/content pair per page.
+    page_ids = [4 + idx * 2 for idx in range(total)]
+    offsets: List[int] = []
+    with destination.open("wb") as handle:
+        handle.write(b"%PDF-1.4\n")
+        _write_object(handle, offsets, b"<< /Type /Catalog /Pages 2 0 R >>")
+        kids = " ".join(f"{page_id} 0 R" for page_id in page_ids)
+        _write_object(
+            handle,
+            offsets,
+            f"<< /Type /Pages /Kids [{kids}] /Count {total} >>".encode("ascii"),
+        )
+        _write_object(
+            handle,
+            offsets,
+            b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica "
+            b"/Encoding /WinAnsiEncoding >>",
+        )
+        for idx, (page_id, (width, height, content)) in enumerate(zip(page_ids, pages), start=1):
+            _write_object(
+                handle,
+                offsets,
+                (
+                    f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {width:.2f} {height:.2f}] "
+                    f"/Resources << /Font << /F1 3 0 R >> >> /Contents {page_id + 1} 0 R >>"
+                ).encode("ascii"),
+            )
+            _write_object(
+                handle,
+                offsets,
+                f"<< /Length {len(content)} >>\nstream\n".encode("ascii")
+                + content
+                + b"\nendstream",
+            )
+            if on_page is not None:
+                on_page(idx)
+        xref_offset = handle.tell()
+        handle.write(f"xref\n0 {len(offsets) + 1}\n".encode("ascii"))
+        handle.write(b"0000000000 65535 f \n")
+        for offset in offsets:
+            handle.write(f"{offset:010d} 00000 n \n".encode("ascii"))
+        handle.write(
+            (
+                f"trailer\n<< /Size {len(offsets) + 1} /Root 1 0 R >>\n"
+                f"startxref\n{xref_offset}\n%%EOF\n"
+            ).encode("ascii")
+        )
+
+
+def _write_object(handle: BinaryIO, offsets: List[int], body: bytes) -> None:
+    offsets.append(handle.tell())
+    handle.write(f"{len(offsets)} 0 obj\n".encode("ascii"))
+    handle.write(body)
+    handle.write(b"\nendobj\n")
+
+
+def _escape_pdf_text(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""Time merge/split/reorder/page-count on each available backend.
+
+Usage: python scripts/bench_backends.py [input.pdf] [--repeat N]
+
+The CLI column shells out to qpdf exactly like the commands do; the native
+columns use pdfsuite.utils.backend in-process. Speedups are relative to CLI.
+"""
+
+import argparse
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from pdfsuite.utils.backend import PikepdfBackend, PypdfBackend  # noqa: E402
+from pdfsuite.utils.common import shell_quote  # noqa: E402
+
+DEFAULT_INPUT = Path(__file__).resolve().parents[1] / "tests" / "fixtures" / "sample_multi.pdf"
+
+
+def cli_operations(source, workdir):
+    src = shell_quote(source)
+
+    def sh(cmd):
+        subprocess.run(cmd, shell=True, check=True, capture_output=True)
+
+    return {
+        "page_count": lambda: sh(f"qpdf --show-npages {src}"),
+        "merge": lambda: sh(
+            f"qpdf --empty --pages {src} 1-z {src} 1-z -- {shell_quote(workdir / 'm.pdf')}"
+        ),
+        "reorder": lambda: sh(
+            f"qpdf {src} --pages {src} z,1-z -- {shell_quote(workdir / 'r.pdf')}"
+        ),
+        "split": lambda: sh(f"qpdf {src} --pages {src} 1 -- {shell_quote(workdir / 's.pdf')}"),
+    }
+
+
+def native_operations(backend, source, workdir):
+    return {
+        "page_count": lambda: backend.page_count(source),
+        "merge": lambda: backend.assemble(
+            [(source, ["1-z"]), (source, ["1-z"])], workdir / "m.pdf"
+        ),
+        "reorder": lambda: backend.assemble([(source, ["z", "1-z"])], workdir / "r.pdf"),
+        "split": lambda: backend.assemble([(source, ["1"])], workdir / "s.pdf"),
+    }
+
+
+def timed(action, repeat):
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        action()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("input", nargs="?", type=Path, default=DEFAULT_INPUT)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="pdfsuite-bench-") as tmp:
+        workdir = Path(tmp)
+        suites = {}
+        if shutil.which("qpdf"):
+            suites["cli"] = cli_operations(args.input, workdir)
+        for factory in (PikepdfBackend, PypdfBackend):
+            try:
+                backend = factory()
+            except ImportError:
+                continue
+            suites[backend.name] = native_operations(backend, args.input, workdir)
+        if not suites:
+            print("No backends available (install qpdf, pikepdf, or pypdf).")
+            return 1
+
+        results = {
+            name: {op: timed(action, args.repeat) for op, action in operations.items()}
+            for name, operations in suites.items()
+        }
+
+    names = list(results)
+    print(f"{args.input} (median of {args.repeat} runs, ms)")
+    print(f"{'operation':<12}" + "".join(f"{name:>18}" for name in names))
+    for op in ("page_count", "merge", "reorder", "split"):
+        row = f"{op:<12}"
+        for name in names:
+            cell = f"{results[name][op] * 1000:.2f}"
+            if "cli" in results and name != "cli":
+                cell += f" ({results['cli'][op] / results[name][op]:.1f}x)"
+            row += f"{cell:>18}"
+        print(row)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
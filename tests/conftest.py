@@ -15,3 +15,15 @@ def command_recorder(monkeypatch: pytest.MonkeyPatch) -> Callable[[str], List[st
         return recorded
 
     return _stub
+
+
+@pytest.fixture(autouse=True)
+def isolated_home(tmp_path_factory: pytest.TempPathFactory, monkeypatch: pytest.MonkeyPatch):
+    """Keep ~/pdfsuite build/cache/state writes out of the real home directory."""
+    home = tmp_path_factory.mktemp("home")
+    monkeypatch.setenv("HOME", str(home))
+    monkeypatch.setenv("USERPROFILE", str(home))
+    monkeypatch.delenv("PDFSUITE_CACHE_DIR", raising=False)
+    # Command tests assert on the qpdf invocations; backend tests opt back in.
+    monkeypatch.setenv("PDFSUITE_BACKEND", "cli")
+    return home
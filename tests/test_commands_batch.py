@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+import typer
+from typer.testing import CliRunner
+
+from pdfsuite.__main__ import app
+from pdfsuite.commands import batch
+
+runner = CliRunner()
+
+
+def test_load_manifest_reads_jsonl_and_csv(tmp_path) -> None:
+    jsonl = tmp_path / "jobs.jsonl"
+    jsonl.write_text(
+        "\n".join(
+            [
+                json.dumps(
+                    {
+                        "operation": "optimize",
+                        "input": "a.pdf",
+                        "output": "a-small.pdf",
+                        "options": {"preset": "email"},
+                    }
+                ),
+                "",
+                json.dumps({"operation": "Redact", "input": "b.pdf", "output": "b-red.pdf"}),
+            ]
+        )
+    )
+    csv_manifest = tmp_path / "jobs.csv"
+    csv_manifest.write_text(
+        "operation,input,output,bates,start\n"
+        "stamp,c.pdf,c-stamped.pdf,BN,1001\n"
+        "ocr,d.pdf,d-ocr.pdf,,\n"
+    )
+
+    json_jobs = batch.load_manifest(jsonl)
+    csv_jobs = batch.load_manifest(csv_manifest)
+
+    assert [(job.operation, job.options) for job in json_jobs] == [
+        ("optimize", {"preset": "email"}),
+        ("redact_safe", {}),
+    ]
+    assert [(job.operation, job.options) for job in csv_jobs] == [
+        ("stamp", {"bates": "BN", "start": "1001"}),
+        ("ocr", {}),
+    ]
+
+
+def test_load_manifest_rejects_unknown_operation(tmp_path) -> None:
+    manifest = tmp_path / "jobs.jsonl"
+    manifest.write_text(json.dumps({"operation": "fold", "input": "a.pdf", "output": "b.pdf"}))
+
+    with pytest.raises(typer.BadParameter):
+        batch.load_manifest(manifest)
+
+
+def test_batch_streams_results_and_summary(tmp_path, monkeypatch) -> None:
+    source = tmp_path / "a.pdf"
+    source.write_bytes(b"x" * 1024)
+    calls: list[tuple[str, str, dict]] = []
+
+    def fake_optimize(src, dest, options) -> None:
+        calls.append((str(src), str(dest), options))
+        dest.write_bytes(b"y" * 512)
+
+    def failing_ocr(src, dest, options) -> None:
+        raise typer.Exit(2)
+
+    monkeypatch.setitem(batch.OPERATIONS, "optimize", fake_optimize)
+    monkeypatch.setitem(batch.OPERATIONS, "ocr", failing_ocr)
+    manifest = tmp_path / "jobs.jsonl"
+    manifest.write_text(
+        "\n".join(
+            json.dumps(row)
+            for row in (
+                {"operation": "optimize", "input": str(source), "output": str(tmp_path / "o.pdf")},
+                {"operation": "ocr", "input": str(source), "output": str(tmp_path / "r.pdf")},
+            )
+        )
+    )
+
+    result = runner.invoke(app, ["batch", str(manifest), "--jobs", "1"])
+
+    assert result.exit_code == 1
+    lines = [json.loads(line) for line in result.stdout.splitlines() if line.startswith("{")]
+    assert [line.get("status") for line in lines[:2]] == ["ok", "failed"]
+    assert lines[0]["output_bytes"] == 512
+    assert lines[1]["exit_code"] == 2
+    summary = lines[-1]["summary"]
+    assert summary["jobs"] == 2
+    assert summary["ok"] == 1
+    assert summary["failed"] == 1
+    assert calls == [(str(source), str(tmp_path / "o.pdf"), {})]
+
+
+def test_in_process_batch_keeps_child_tool_output_off_stdout(tmp_path, monkeypatch, capfd):
+    source = tmp_path / "a.pdf"
+    source.write_bytes(b"pdf")
+
+    def noisy_tool(src, dest, options) -> None:
+        print("python chatter")
+        subprocess.run([sys.executable, "-c", "print('tool chatter')"], check=True)
+        dest.write_bytes(b"out")
+
+    monkeypatch.setitem(batch.OPERATIONS, "optimize", noisy_tool)
+    manifest = tmp_path / "jobs.jsonl"
+    manifest.write_text(
+        json.dumps(
+            {"operation": "optimize", "input": str(source), "output": str(tmp_path / "o.pdf")}
+        )
+    )
+
+    app(["batch", str(manifest), "--jobs", "1"], standalone_mode=False)
+
+    captured = capfd.readouterr()
+    lines = captured.out.splitlines()
+    assert len(lines) == 2
+    assert [json.loads(line).get("status") for line in lines] == ["ok", None]
+    assert "tool chatter" in captured.err and "python chatter" in captured.err
+
+
+def test_csv_row_with_bad_options_fails_only_that_job(tmp_path, monkeypatch) -> None:
+    source = tmp_path / "a.pdf"
+    source.write_bytes(b"pdf")
+    monkeypatch.setitem(
+        batch.OPERATIONS, "optimize", lambda src, dest, options: dest.write_bytes(b"out")
+    )
+    manifest = tmp_path / "jobs.csv"
+    manifest.write_text(
+        "operation,input,output,options\n"
+        f'optimize,{source},{tmp_path / "o.pdf"},"{{""preset"": ""email""}}"\n'
+        f"optimize,{source},{tmp_path / 'bad.pdf'},{{not json\n"
+    )
+
+    result = runner.invoke(app, ["batch", str(manifest), "--jobs", "1"])
+
+    assert result.exit_code == 1
+    lines = [json.loads(line) for line in result.stdout.splitlines()]
+    assert [line.get("status") for line in lines[:2]] == ["ok", "failed"]
+    assert "options column is not valid JSON" in lines[1]["error"]
+    assert lines[-1]["summary"]["failed"] == 1
+
+
+def test_run_batch_uses_process_pool_for_parallel_jobs(tmp_path) -> None:
+    entries = [
+        batch.BatchJob(
+            index=idx,
+            operation="optimize",
+            input=tmp_path / f"in-{idx}.pdf",
+            output=tmp_path / f"out-{idx}.pdf",
+            options={"preset": "bogus"},
+        )
+        for idx in (1, 2)
+    ]
+
+    results = sorted(batch.run_batch(entries, 2), key=lambda item: item["index"])
+
+    assert [result["status"] for result in results] == ["failed", "failed"]
+    assert all("Unknown preset" in result["error"] for result in results)
+
+
+def test_optimize_job_rejects_unknown_strategy(tmp_path) -> None:
+    entry = batch.BatchJob(
+        index=1,
+        operation="optimize",
+        input=tmp_path / "in.pdf",
+        output=tmp_path / "out.pdf",
+        options={"strategy": "fastest"},
+    )
+
+    result = batch.run_job(entry)
+
+    assert result["status"] == "failed"
+    assert "Unknown strategy 'fastest'" in result["error"]
+
+
+def test_run_batch_fails_remaining_jobs_when_the_pool_breaks(tmp_path, monkeypatch) -> None:
+    class BrokenPool:
+        def __init__(self, max_workers, initializer) -> None:
+            pass
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc_info) -> None:
+            pass
+
+        def submit(self, fn, entry) -> Future:
+            future: Future = Future()
+            if entry.index == 1:
+                future.set_result(fn(entry))
+            else:
+                future.set_exception(BrokenProcessPool("a child process terminated"))
+            return future
+
+    monkeypatch.setattr(batch, "ProcessPoolExecutor", BrokenPool)
+    monkeypatch.setitem(
+        batch.OPERATIONS, "optimize", lambda src, dest, options: dest.write_bytes(b"out")
+    )
+    entries = [
+        batch.BatchJob(
+            index=idx,
+            operation="optimize",
+            input=tmp_path / f"in-{idx}.pdf",
+            output=tmp_path / f"out-{idx}.pdf",
+        )
+        for idx in (1, 2, 3)
+    ]
+
+    results = sorted(batch.run_batch(entries, 2), key=lambda item: item["index"])
+
+    assert [result["status"] for result in results] == ["ok", "failed", "failed"]
+    assert all("terminated abruptly" in result["error"] for result in results[1:])
+    assert batch.summarize(results, 1.0)["failed"] == 2
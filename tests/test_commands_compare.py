@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import json
+from pathlib import Path
+
+import pytest
 from typer.testing import CliRunner
 
 from pdfsuite.__main__ import app
 from pdfsuite.utils.common import shell_quote
 
-
 runner = CliRunner()
 
 
@@ -24,9 +27,7 @@ def test_compare_prefers_diff_pdf(tmp_path, monkeypatch, command_recorder) -> No
 
     monkeypatch.setattr("pdfsuite.commands.compare.shutil.which", fake_which)
 
-    result = runner.invoke(
-        app, ["compare", str(first), str(second), "-o", str(output)]
-    )
+    result = runner.invoke(app, ["compare", str(first), str(second), "-o", str(output)])
 
     assert result.exit_code == 0
     expected = (
@@ -51,11 +52,264 @@ def test_compare_falls_back_to_diffpdf_gui(tmp_path, monkeypatch, command_record
 
     monkeypatch.setattr("pdfsuite.commands.compare.shutil.which", fake_which)
 
+    result = runner.invoke(app, ["compare", str(first), str(second), "-o", str(output)])
+
+    assert result.exit_code == 0
+    assert recorded == [f"diffpdf {shell_quote(first)} {shell_quote(second)}"]
+
+
+def test_headless_compare_diffs_in_process_and_writes_report(
+    tmp_path, monkeypatch, command_recorder
+):
+    np = pytest.importorskip("numpy")
+    Image = pytest.importorskip("PIL.Image")
+    first = tmp_path / "a.pdf"
+    second = tmp_path / "b.pdf"
+    first.write_text("pdf v1")
+    second.write_text("pdf v2")
+    recorded = command_recorder("pdfsuite.commands.compare")
+
+    rendered: list[Path] = []
+
+    def fake_render(pdf: Path, directory: Path, first_page: int, last_page: int):
+        directory.mkdir(parents=True, exist_ok=True)
+        rasters = {}
+        for number in range(first_page, last_page + 1):
+            raster = np.full((32, 32, 3), 255, dtype=np.uint8)
+            if pdf == second and number == 2:
+                raster[4:8, 4:8] = 0
+            rasters[number] = directory / f"page-{number}.png"
+            Image.fromarray(raster).save(rasters[number])
+        rendered.extend(rasters.values())
+        return rasters
+
+    monkeypatch.setattr("pdfsuite.commands.compare.count_pages", lambda pdf: 3)
+    monkeypatch.setattr("pdfsuite.commands.compare.RASTER_CHUNK_PAGES", 2)
+    monkeypatch.setattr("pdfsuite.commands.compare.render_chunk", fake_render)
+    report = tmp_path / "report.json"
+
     result = runner.invoke(
-        app, ["compare", str(first), str(second), "-o", str(output)]
+        app,
+        [
+            "compare",
+            str(first),
+            str(second),
+            "--headless",
+            "--report",
+            str(report),
+            "--jobs",
+            "2",
+            "-o",
+            str(tmp_path / "diff.pdf"),
+        ],
     )
 
     assert result.exit_code == 0
-    assert recorded == [
-        f"diffpdf {shell_quote(first)} {shell_quote(second)}"
-    ]
+    assert "page 2: 1.56% changed, 1 region(s)" in result.stdout
+    assert recorded[0].startswith("img2pdf ")
+    assert recorded[0].index("diff-1.png") < recorded[0].index("diff-3.png")
+    assert len(rendered) == 6 and not any(path.exists() for path in rendered)
+    pages = json.loads(report.read_text())["pages"]
+    assert [page["changed_pixels"] for page in pages] == [0, 16, 0]
+    assert pages[1]["boxes"] == [[4, 4, 8, 8]]
+
+
+def test_headless_compare_skips_pages_with_matching_fingerprints(
+    tmp_path, monkeypatch, command_recorder
+):
+    first = tmp_path / "a.pdf"
+    second = tmp_path / "b.pdf"
+    first.write_text("pdf v1")
+    second.write_text("pdf v2")
+    recorded = command_recorder("pdfsuite.commands.compare")
+    prints = {first: ["p1", "p2", "p3", "p4"], second: ["p1", "x2", "p3", "x4"]}
+    chunks = []
+
+    def fake_render(pdf: Path, directory: Path, first_page: int, last_page: int):
+        chunks.append((pdf.name, first_page, last_page))
+        directory.mkdir(parents=True, exist_ok=True)
+        rasters = {}
+        for number in range(first_page, last_page + 1):
+            rasters[number] = directory / f"page-{number}.png"
+            rasters[number].write_text("png")
+        return rasters
+
+    monkeypatch.setattr("pdfsuite.commands.compare.pixel_diff.available", lambda: False)
+    monkeypatch.setattr("pdfsuite.commands.compare.magick_diff", lambda a, b, out: out.touch())
+    monkeypatch.setattr("pdfsuite.commands.compare.count_pages", lambda pdf: 4)
+    monkeypatch.setattr(
+        "pdfsuite.commands.compare.page_fingerprints", lambda pdf, total: prints[pdf]
+    )
+    monkeypatch.setattr("pdfsuite.commands.compare.render_chunk", fake_render)
+    report = tmp_path / "report.json"
+
+    result = runner.invoke(
+        app,
+        [
+            "compare",
+            str(first),
+            str(second),
+            "--report",
+            str(report),
+            "-o",
+            str(tmp_path / "d.pdf"),
+        ],
+    )
+
+    assert result.exit_code == 0
+    assert "2 of 4 page(s) unchanged" in result.stdout
+    assert sorted(chunks) == [("a.pdf", 2, 2), ("a.pdf", 4, 4), ("b.pdf", 2, 2), ("b.pdf", 4, 4)]
+    assert "diff-2.png" in recorded[0] and "diff-1.png" not in recorded[0]
+    payload = json.loads(report.read_text())
+    assert payload["unchanged"] == [1, 3]
+    assert [page["page"] for page in payload["pages"]] == [2, 4]
+
+
+def test_headless_compare_writes_summary_page_when_nothing_changed(
+    tmp_path, monkeypatch, command_recorder
+):
+    pypdf = pytest.importorskip("pypdf")
+    first = tmp_path / "a.pdf"
+    second = tmp_path / "b.pdf"
+    first.write_text("pdf v1")
+    second.write_text("pdf v2")
+    output = tmp_path / "out" / "d.pdf"
+    recorded = command_recorder("pdfsuite.commands.compare")
+    monkeypatch.setattr("pdfsuite.commands.compare.count_pages", lambda pdf: 3)
+    monkeypatch.setattr(
+        "pdfsuite.commands.compare.page_fingerprints", lambda pdf, total: ["p1", "p2", "p3"]
+    )
+    monkeypatch.setattr("pdfsuite.commands.compare.render_chunk", pytest.fail)
+
+    result = runner.invoke(
+        app, ["compare", str(first), str(second), "--headless", "-o", str(output)]
+    )
+
+    assert result.exit_code == 0, result.stdout
+    assert "No differences in 3 matched page(s)" in result.stdout
+    assert recorded == []
+    pages = pypdf.PdfReader(output).pages
+    assert len(pages) == 1
+    text = pages[0].extract_text()
+    assert "No differences in 3 matched page(s)" in text
+    assert "A: a.pdf (3 pages)" in text and "B: b.pdf (3 pages)" in text
+
+
+def test_headless_compare_aligns_documents_with_different_page_counts(
+    tmp_path, monkeypatch, command_recorder
+):
+    from pdfsuite.core.page_align import PageSignature
+
+    first = tmp_path / "a.pdf"
+    second = tmp_path / "b.pdf"
+    first.write_text("pdf v1")
+    second.write_text("pdf v2")
+    recorded = command_recorder("pdfsuite.commands.compare")
+    signatures = {
+        first: [PageSignature(key) for key in ("t1", "t2", "t3", "t4")],
+        second: [PageSignature(key) for key in ("t1", "new", "t2", "t3", "t4x")],
+    }
+    prints = {first: ["p1", "p2", "p3", "p4"], second: ["p1", "n", "p2", "x3", "x4"]}
+    chunks = []
+
+    def fake_render(pdf: Path, directory: Path, first_page: int, last_page: int):
+        chunks.append((pdf.name, first_page, last_page))
+        directory.mkdir(parents=True, exist_ok=True)
+        rasters = {}
+        for number in range(first_page, last_page + 1):
+            rasters[number] = directory / f"page-{number}.png"
+            rasters[number].write_text("png")
+        return rasters
+
+    monkeypatch.setattr("pdfsuite.commands.compare.pixel_diff.available", lambda: False)
+    monkeypatch.setattr("pdfsuite.commands.compare.magick_diff", lambda a, b, out: out.touch())
+    monkeypatch.setattr("pdfsuite.commands.compare.count_pages", lambda pdf: len(signatures[pdf]))
+    monkeypatch.setattr(
+        "pdfsuite.commands.compare.page_signatures",
+        lambda pdf, total, directory: signatures[pdf],
+    )
+    monkeypatch.setattr(
+        "pdfsuite.commands.compare.page_fingerprints", lambda pdf, total: prints[pdf]
+    )
+    monkeypatch.setattr("pdfsuite.commands.compare.render_chunk", fake_render)
+    report = tmp_path / "report.json"
+
+    result = runner.invoke(
+        app,
+        [
+            "compare",
+            str(first),
+            str(second),
+            "--report",
+            str(report),
+            "-o",
+            str(tmp_path / "d.pdf"),
+        ],
+    )
+
+    assert result.exit_code == 0, result.stdout
+    assert "0 deleted from a.pdf, 1 inserted in b.pdf" in result.stdout
+    assert "Inserted in b.pdf: page(s) 2" in result.stdout
+    assert "Deleted from" not in result.stdout
+    assert sorted(chunks) == [("a.pdf", 3, 4), ("b.pdf", 4, 5)]
+    assert "diff-3.png" in recorded[0] and "diff-4.png" in recorded[0]
+    payload = json.loads(report.read_text())
+    assert payload["inserted"] == [2] and payload["deleted"] == []
+    assert payload["unchanged"] == [1, 2]
+    assert [(page["page"], page["second_page"]) for page in payload["pages"]] == [(3, 4), (4, 5)]
+
+
+@pytest.mark.parametrize("suffix", [".html", ".json"])
+def test_compare_text_writes_change_report_without_rasterizing(
+    tmp_path, monkeypatch, command_recorder, suffix
+):
+    first = tmp_path / "a.pdf"
+    second = tmp_path / "b.pdf"
+    first.write_text("pdf v1")
+    second.write_text("pdf v2")
+    recorded = command_recorder("pdfsuite.commands.compare")
+    texts = {first: ["Same page", "Price: 10"], second: ["Same page", "Price: 12", "Größe"]}
+    monkeypatch.setattr("pdfsuite.commands.compare.extract_page_texts", lambda pdf: texts[pdf])
+
+    def no_render(*args):
+        raise AssertionError("--text must not rasterize")
+
+    monkeypatch.setattr("pdfsuite.commands.compare.render_chunk", no_render)
+    output = tmp_path / f"changes{suffix}"
+
+    result = runner.invoke(app, ["compare", str(first), str(second), "--text", "-o", str(output)])
+
+    assert result.exit_code == 0, result.stdout
+    assert "Page 2: +1/-1 word(s)" in result.stdout
+    assert "1 changed, 1 inserted, 0 deleted, 1 unchanged page(s)." in result.stdout
+    assert recorded == []
+    if suffix == ".json":
+        payload = json.loads(output.read_text(encoding="utf-8"))
+        assert payload["inserted"] == [3] and payload["unchanged"] == [1]
+        assert payload["pages"][0]["changes"] == [
+            {"op": "delete", "text": "10"},
+            {"op": "insert", "text": "12"},
+        ]
+        assert payload["pages"][1]["changes"] == [{"op": "insert", "text": "Größe"}]
+    else:
+        page = output.read_text(encoding="utf-8")
+        assert 'href="#page-2"' in page and 'id="inserted-3"' in page
+
+
+@pytest.mark.parametrize(
+    "extra",
+    [["--headless"], ["--report", "r.json"], ["--align"], ["--all-pages"], ["--jobs", "2"]],
+)
+def test_compare_text_rejects_pixel_diff_options(tmp_path, monkeypatch, extra):
+    first = tmp_path / "a.pdf"
+    second = tmp_path / "b.pdf"
+    first.write_text("pdf v1")
+    second.write_text("pdf v2")
+    monkeypatch.setattr("pdfsuite.commands.compare.text_report", pytest.fail)
+
+    result = runner.invoke(
+        app, ["compare", str(first), str(second), "--text", *extra, "-o", str(tmp_path / "d.html")]
+    )
+
+    assert result.exit_code == 2
+    assert f"--text cannot be combined with {extra[0]}" in result.output
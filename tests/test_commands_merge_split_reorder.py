@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import shlex
 from pathlib import Path
 
 from typer.testing import CliRunner
@@ -43,6 +44,8 @@ def test_split_emits_slice_per_range(tmp_path, command_recorder) -> None:
             "1 , 3-4 , 7-",
             "-o",
             str(output_dir),
+            "--jobs",
+            "1",
         ],
     )
 
@@ -62,6 +65,62 @@ def test_split_emits_slice_per_range(tmp_path, command_recorder) -> None:
     assert recorded == expected_cmds
 
 
+def test_split_runs_ranges_on_parallel_qpdf_processes(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr("pdfsuite.commands.split.require_tools", lambda *args: None)
+    started: list[str] = []
+
+    class FakeProcess:
+        def __init__(self, cmd: str) -> None:
+            started.append(cmd)
+
+        def wait(self) -> int:
+            return 0
+
+    monkeypatch.setattr("pdfsuite.commands.split.spawn", FakeProcess)
+    source = tmp_path / "source.pdf"
+    source.write_text("pdf")
+
+    result = runner.invoke(
+        app,
+        ["split", str(source), "--pages", "1,2,3", "-o", str(tmp_path), "--jobs", "3"],
+    )
+
+    assert result.exit_code == 0
+    assert sorted(started) == [
+        (
+            f"qpdf {shell_quote(source)} --pages {shell_quote(source)} {page} -- "
+            f"{shell_quote(tmp_path / f'source_{page}.pdf')}"
+        )
+        for page in ("1", "2", "3")
+    ]
+
+
+def test_split_chunks_in_one_qpdf_pass(tmp_path, command_recorder) -> None:
+    recorded = command_recorder("pdfsuite.commands.split")
+    source = tmp_path / "source.pdf"
+    source.write_text("pdf")
+
+    burst = runner.invoke(app, ["split", str(source), "--burst", "-o", str(tmp_path)])
+    chunked = runner.invoke(app, ["split", str(source), "--chunk-size", "50", "-o", str(tmp_path)])
+
+    assert (burst.exit_code, chunked.exit_code) == (0, 0)
+    pattern = shell_quote(tmp_path / "source_%d.pdf")
+    assert recorded == [
+        f"qpdf --split-pages=1 {shell_quote(source)} {pattern}",
+        f"qpdf --split-pages=50 {shell_quote(source)} {pattern}",
+    ]
+
+
+def test_split_requires_exactly_one_mode(tmp_path) -> None:
+    source = tmp_path / "source.pdf"
+    source.write_text("pdf")
+
+    result = runner.invoke(app, ["split", str(source), "--pages", "1", "--burst"])
+
+    assert result.exit_code == 2
+    assert "exactly one of" in result.output
+
+
 def test_reorder_respects_requested_sequence(tmp_path, command_recorder) -> None:
     recorded = command_recorder("pdfsuite.commands.reorder")
     source = tmp_path / "input.pdf"
@@ -87,3 +146,76 @@ def test_reorder_respects_requested_sequence(tmp_path, command_recorder) -> None
         f"{shell_quote(expected_spec)} -- {shell_quote(output)}"
     )
     assert recorded == [expected]
+
+
+def test_reorder_reads_order_file_and_uses_qpdf_argfile_for_long_specs(
+    tmp_path, monkeypatch
+) -> None:
+    source = tmp_path / "input.pdf"
+    source.write_text("pdf")
+    order_file = tmp_path / "order.txt"
+    order_file.write_text("3-1\n5\n4 6-z\n")
+    output = tmp_path / "reordered.pdf"
+    argfiles: list[list[str]] = []
+
+    def record(cmd: str) -> None:
+        argfile = shlex.split(cmd)[1]
+        argfiles.append(Path(argfile[1:]).read_text().splitlines())
+
+    monkeypatch.setattr("pdfsuite.commands.reorder.require_tools", lambda *args: None)
+    monkeypatch.setattr("pdfsuite.commands.reorder.run_or_exit", record)
+    monkeypatch.setattr("pdfsuite.commands.reorder.ARGV_SPEC_LIMIT", 4)
+
+    result = runner.invoke(
+        app, ["reorder", str(source), "--order-file", str(order_file), "-o", str(output)]
+    )
+
+    assert result.exit_code == 0
+    assert argfiles == [[str(source), "--pages", str(source), "3-1,5,4,6-z", "--", str(output)]]
+
+
+def test_reorder_requires_exactly_one_order_source(tmp_path) -> None:
+    source = tmp_path / "input.pdf"
+    source.write_text("pdf")
+    result = runner.invoke(app, ["reorder", str(source), "-o", str(tmp_path / "out.pdf")])
+    assert result.exit_code != 0
+
+
+def test_reorder_rotates_output_pages_in_the_same_qpdf_pass(tmp_path, command_recorder) -> None:
+    recorded = command_recorder("pdfsuite.commands.reorder")
+    source = tmp_path / "input.pdf"
+    source.write_text("pdf")
+    output = tmp_path / "reordered.pdf"
+
+    result = runner.invoke(
+        app,
+        [
+            "reorder",
+            str(source),
+            "--order",
+            "3,1-2",
+            "--rotate",
+            "90:1",
+            "--rotate",
+            "-90:2-z",
+            "-o",
+            str(output),
+        ],
+    )
+
+    assert result.exit_code == 0
+    assert recorded == [
+        f"qpdf {shell_quote(source)} --rotate=+90:1 --rotate=+270:2-z "
+        f"--pages {shell_quote(source)} 3,1-2 -- {shell_quote(output)}"
+    ]
+
+
+def test_reorder_rejects_bad_rotation(tmp_path, command_recorder) -> None:
+    command_recorder("pdfsuite.commands.reorder")
+    source = tmp_path / "input.pdf"
+    source.write_text("pdf")
+    result = runner.invoke(
+        app,
+        ["reorder", str(source), "--order", "1", "--rotate", "45:1", "-o", str(tmp_path / "o.pdf")],
+    )
+    assert result.exit_code != 0
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import shutil
 from contextlib import contextmanager
+from pathlib import Path
 
+import pytest
 from typer.testing import CliRunner
 
 from pdfsuite.__main__ import app
@@ -99,3 +102,277 @@ def test_optimize_retries_until_target_met(tmp_path, monkeypatch, command_record
         ),
         f"qpdf --linearize {shell_quote(intermediate)} {shell_quote(output)}",
     ]
+
+
+class FakeProcess:
+    def __init__(self, code: int = 0) -> None:
+        self.code = code
+        self.terminated = False
+
+    def wait(self) -> int:
+        return self.code
+
+    def poll(self) -> int | None:
+        return None
+
+    def terminate(self) -> None:
+        self.terminated = True
+
+
+def test_optimize_parallel_keeps_best_fitting_attempt(
+    tmp_path, monkeypatch, command_recorder
+) -> None:
+    recorded = command_recorder("pdfsuite.commands.optimize")
+    source = tmp_path / "input.pdf"
+    source.write_text("pdf")
+    output = tmp_path / "out.pdf"
+    temp_dir = tmp_path / "tmp"
+    temp_dir.mkdir()
+    spawned: list[str] = []
+
+    def fake_spawn(cmd: str) -> FakeProcess:
+        spawned.append(cmd)
+        return FakeProcess()
+
+    sizes = {
+        "optimized-1.pdf": 5 * 1024 * 1024,
+        "optimized-2.pdf": 900_000,
+        "optimized-3.pdf": 400_000,
+    }
+    monkeypatch.setattr(
+        "pdfsuite.commands.optimize.temporary_directory",
+        lambda prefix="pdfsuite-": fake_tmp(temp_dir),
+    )
+    monkeypatch.setattr("pdfsuite.commands.optimize.spawn", fake_spawn)
+    monkeypatch.setattr(
+        "pdfsuite.commands.optimize.file_size",
+        lambda path: sizes.get(path.name, 0),
+    )
+
+    result = runner.invoke(
+        app,
+        [
+            "optimize",
+            str(source),
+            "-o",
+            str(output),
+            "--preset",
+            "email",
+            "--target-size",
+            "1",
+            "--strategy",
+            "parallel",
+            "--jobs",
+            "1",
+        ],
+    )
+
+    assert result.exit_code == 0
+    assert len(spawned) == 2  # the 96 dpi attempt is cancelled once 120 dpi fits
+    assert "ColorImageResolution=150" in spawned[0]
+    assert "ColorImageResolution=120" in spawned[1]
+    chosen = temp_dir / "optimized-2.pdf"
+    assert recorded == [f"qpdf --linearize {shell_quote(chosen)} {shell_quote(output)}"]
+
+
+def test_optimize_rejects_unknown_strategy(tmp_path) -> None:
+    source = tmp_path / "input.pdf"
+    source.write_text("pdf")
+
+    result = runner.invoke(
+        app,
+        ["optimize", str(source), "-o", str(tmp_path / "out.pdf"), "--strategy", "bogus"],
+    )
+
+    assert result.exit_code != 0
+
+
+def test_optimize_predict_runs_single_full_pass(tmp_path, monkeypatch, command_recorder) -> None:
+    recorded = command_recorder("pdfsuite.commands.optimize")
+    source = tmp_path / "input.pdf"
+    source.write_text("pdf")
+    output = tmp_path / "out.pdf"
+    temp_dir = tmp_path / "tmp"
+    temp_dir.mkdir()
+    sizes = {
+        "sample-150.pdf": 600_000,
+        "sample-96.pdf": 300_000,
+        "optimized-1.pdf": 3_900_000,
+    }
+    monkeypatch.setattr(
+        "pdfsuite.commands.optimize.temporary_directory",
+        lambda prefix="pdfsuite-": fake_tmp(temp_dir),
+    )
+    monkeypatch.setattr("pdfsuite.commands.optimize.get_page_count", lambda path: 30)
+    monkeypatch.setattr(
+        "pdfsuite.commands.optimize.file_size",
+        lambda path: sizes.get(path.name, 0),
+    )
+
+    result = runner.invoke(
+        app,
+        [
+            "optimize",
+            str(source),
+            "-o",
+            str(output),
+            "--preset",
+            "email",
+            "--target-size",
+            "4",
+            "--strategy",
+            "predict",
+        ],
+    )
+
+    assert result.exit_code == 0
+    sample = temp_dir / "sample.pdf"
+    chosen = temp_dir / "optimized-1.pdf"
+    assert recorded[0] == (
+        f"qpdf {shell_quote(source)} --pages {shell_quote(source)} 1,15,30 "
+        f"-- {shell_quote(sample)}"
+    )
+    assert "-dColorImageResolution=150 " in recorded[1]
+    assert "-dColorImageResolution=96 " in recorded[2]
+    assert "-dColorImageResolution=116 " in recorded[3]
+    assert recorded[4] == f"qpdf --linearize {shell_quote(chosen)} {shell_quote(output)}"
+    assert len(recorded) == 5
+
+
+def test_predict_resolution_clamps_to_preset_bounds() -> None:
+    from pdfsuite.commands import optimize
+
+    fixed, per_dpi2 = optimize.fit_size_curve((300, 9_000_000), (200, 4_000_000))
+    assert per_dpi2 == 100
+    assert optimize.predict_resolution(fixed, per_dpi2, 100_000_000, 300) == 300
+    assert optimize.predict_resolution(fixed, per_dpi2, 10, 300) == optimize.PREDICT_MIN_RESOLUTION
+    assert optimize.fit_size_curve((300, 500), (200, 500)) == (500, 0.0)
+
+
+def chunked_run(tmp_path, monkeypatch, recorded, *, subset_size=100, folded_size=200):
+    """Fake the chunked pipeline's tools; each writes an output of a known size."""
+    temp_dir = tmp_path / "tmp"
+    temp_dir.mkdir()
+    spawned: list[str] = []
+    sizes = {"merged.pdf": 300, "folded.pdf": folded_size, "subset.pdf": subset_size}
+
+    def fake_run_or_exit(cmd: str) -> None:
+        recorded.append(cmd)
+        if "--split-pages" in cmd:
+            for name in ("chunk-001-100.pdf", "chunk-101-200.pdf", "chunk-201-250.pdf"):
+                (temp_dir / "chunks" / name).write_text("pdf")
+            return
+        words = cmd.split()
+        target = words[words.index("-o") + 1] if "-o" in words else words[-1]
+        for name, size in sizes.items():
+            if target.endswith(name):
+                (temp_dir / "chunks-optimized" / name).write_bytes(b"x" * size)
+
+    def fake_spawn(cmd: str) -> FakeProcess:
+        spawned.append(cmd)
+        return FakeProcess()
+
+    monkeypatch.setattr("pdfsuite.commands.optimize.run_or_exit", fake_run_or_exit)
+    monkeypatch.setattr("pdfsuite.commands.optimize.spawn", fake_spawn)
+    monkeypatch.setattr("pdfsuite.commands.optimize.get_page_count", lambda path: 250)
+    monkeypatch.setattr(
+        "pdfsuite.commands.optimize.linearize",
+        lambda intermediate, output: shutil.copyfile(intermediate, output),
+    )
+    monkeypatch.setattr(
+        "pdfsuite.commands.optimize.temporary_directory",
+        lambda prefix="pdfsuite-": fake_tmp(temp_dir),
+    )
+    return temp_dir, spawned
+
+
+def test_optimize_chunked_compresses_and_reassembles(
+    tmp_path, monkeypatch, command_recorder
+) -> None:
+    recorded = command_recorder("pdfsuite.commands.optimize")
+    source = tmp_path / "input.pdf"
+    source.write_text("pdf")
+    output = tmp_path / "out.pdf"
+    temp_dir, spawned = chunked_run(tmp_path, monkeypatch, recorded)
+
+    result = runner.invoke(
+        app,
+        ["optimize", str(source), "-o", str(output), "--chunk-pages", "100", "--jobs", "3"],
+    )
+
+    assert result.exit_code == 0
+    assert len(spawned) == 3
+    assert all("-dColorImageResolution=300" in cmd for cmd in spawned)
+    # Chunks embed whole fonts so pdfcpu can fold them; subsetting happens once at the end.
+    assert all("-dSubsetFonts=false" in cmd for cmd in spawned)
+    attempt_dir = temp_dir / "chunks-optimized"
+    merged, folded = attempt_dir / "merged.pdf", attempt_dir / "folded.pdf"
+    segments = " ".join(
+        f"{shell_quote(attempt_dir / name)} 1-z"
+        for name in ("gs-chunk-001-100.pdf", "gs-chunk-101-200.pdf", "gs-chunk-201-250.pdf")
+    )
+    chunks = temp_dir / "chunks"
+    assert recorded[:3] == [
+        f"qpdf --split-pages=100 {shell_quote(source)} {shell_quote(chunks / 'chunk-%d.pdf')}",
+        f"qpdf --empty --pages {segments} -- {shell_quote(merged)}",
+        f"pdfcpu optimize {shell_quote(merged)} {shell_quote(folded)}",
+    ]
+    assert recorded[3].startswith("gs -sDEVICE=pdfwrite")
+    assert "-dSubsetFonts=true" in recorded[3]
+    assert recorded[3].endswith(
+        f"-o {shell_quote(attempt_dir / 'subset.pdf')} {shell_quote(folded)}"
+    )
+
+
+@pytest.mark.parametrize(("subset_size", "folded_size"), [(100, 200), (250, 200)])
+def test_optimize_chunked_keeps_the_smaller_reassembled_file(
+    tmp_path, monkeypatch, command_recorder, subset_size, folded_size
+) -> None:
+    recorded = command_recorder("pdfsuite.commands.optimize")
+    source = tmp_path / "input.pdf"
+    source.write_text("pdf")
+    output = tmp_path / "out.pdf"
+    chunked_run(tmp_path, monkeypatch, recorded, subset_size=subset_size, folded_size=folded_size)
+
+    result = runner.invoke(
+        app,
+        ["optimize", str(source), "-o", str(output), "--chunk-pages", "100", "--no-cache"],
+    )
+
+    assert result.exit_code == 0
+    assert output.stat().st_size == min(subset_size, folded_size)
+
+
+def test_optimize_chunked_ladder_splits_once(tmp_path, monkeypatch, command_recorder) -> None:
+    recorded = command_recorder("pdfsuite.commands.optimize")
+    source = tmp_path / "input.pdf"
+    source.write_text("pdf")
+    output = tmp_path / "out.pdf"
+    counted: list[Path] = []
+    too_big = 2 * 1024 * 1024
+    _, spawned = chunked_run(
+        tmp_path, monkeypatch, recorded, subset_size=too_big, folded_size=too_big
+    )
+    monkeypatch.setattr(
+        "pdfsuite.commands.optimize.get_page_count", lambda path: counted.append(path) or 250
+    )
+
+    result = runner.invoke(
+        app,
+        [
+            "optimize",
+            str(source),
+            "-o",
+            str(output),
+            "--chunk-pages",
+            "100",
+            "--target-size",
+            "0.1",
+            "--no-cache",
+        ],
+    )
+
+    assert result.exit_code == 0
+    assert counted == [source]
+    assert sum("--split-pages" in cmd for cmd in recorded) == 1
+    assert len(spawned) == 9
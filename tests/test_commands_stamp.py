@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+
+from typer.testing import CliRunner
+
+from pdfsuite.__main__ import app
+from pdfsuite.commands import stamp
+from pdfsuite.utils.common import shell_quote
+
+runner = CliRunner()
+
+
+def test_bates_labels_are_zero_padded() -> None:
+    assert stamp.bates_labels("BN", 998, 3) == ["BN:0998", "BN:0999", "BN:1000"]
+
+
+def test_label_overlay_has_one_page_per_label(tmp_path) -> None:
+    overlay = tmp_path / "overlay.pdf"
+
+    stamp.write_label_overlay(overlay, ["BN:0001", "BN:(2)"])
+
+    data = overlay.read_bytes()
+    assert data.startswith(b"%PDF-1.4")
+    assert b"/Count 2" in data
+    assert b"(BN:0001) Tj" in data
+    assert b"(BN:\\(2\\)) Tj" in data
+    assert data.rstrip().endswith(b"%%EOF")
+
+
+def test_bates_stamps_all_pages_in_one_pass(tmp_path, monkeypatch, command_recorder) -> None:
+    recorded = command_recorder("pdfsuite.commands.stamp")
+    source = tmp_path / "input.pdf"
+    source.write_text("pdf")
+    output = tmp_path / "stamped.pdf"
+    temp_dir = tmp_path / "tmp"
+    temp_dir.mkdir()
+
+    @contextmanager
+    def fake_tmp(prefix="pdfsuite-"):
+        yield temp_dir
+
+    monkeypatch.setattr("pdfsuite.commands.stamp.temporary_directory", fake_tmp)
+    monkeypatch.setattr("pdfsuite.commands.stamp.get_page_count", lambda path: 2500)
+
+    result = runner.invoke(
+        app,
+        ["stamp", str(source), "--bates", "BN", "--start", "1001", "-o", str(output)],
+    )
+
+    assert result.exit_code == 0
+    overlay = temp_dir / "bates-overlay.pdf"
+    assert recorded == [
+        (
+            f"pdfcpu stamp add -mode pdf -- {shell_quote(overlay)} {shell_quote('')} "
+            f"{shell_quote(source)} {shell_quote(output)}"
+        )
+    ]
+    data = overlay.read_bytes()
+    assert b"/Count 2500" in data
+    assert b"(BN:1001) Tj" in data
+    assert b"(BN:3500) Tj" in data
+    assert "Prepared Bates labels 1000/2500" in result.stdout
+    assert "Prepared Bates labels 2500/2500" in result.stdout
+
+
+def test_bates_rejects_prefix_outside_latin1(tmp_path, command_recorder) -> None:
+    recorded = command_recorder("pdfsuite.commands.stamp")
+    source = tmp_path / "input.pdf"
+    source.write_text("pdf")
+
+    result = runner.invoke(
+        app,
+        ["stamp", str(source), "--bates", "案件", "-o", str(tmp_path / "stamped.pdf")],
+    )
+
+    assert result.exit_code == 2
+    assert "Latin-1" in result.output
+    assert recorded == []
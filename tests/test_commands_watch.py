@@ -1,10 +1,17 @@
 from __future__ import annotations
 
+import os
+import threading
+import time
 from pathlib import Path
 
+import pytest
+import typer
 from typer.testing import CliRunner
 
 from pdfsuite.__main__ import app
+from pdfsuite.commands.watch import WatchPool, process_directory
+from pdfsuite.utils.inotify import InotifyWatcher
 
 runner = CliRunner()
 
@@ -45,3 +52,206 @@ def test_watch_processes_new_files_once(tmp_path, monkeypatch):
     assert preset == "email"
     assert target == 2.0
     assert dest.endswith(".pdf")
+
+
+def test_watch_state_skips_files_after_restart(tmp_path, monkeypatch):
+    source_dir = tmp_path / "watch"
+    source_dir.mkdir()
+    (source_dir / "doc.pdf").write_text("pdf")
+    state_file = tmp_path / "state.sqlite3"
+    recorded: list[str] = []
+
+    monkeypatch.setattr(
+        "pdfsuite.commands.watch.run_optimize_pipeline",
+        lambda src, dest, preset, target_size_mb=None: recorded.append(str(src)),
+    )
+    args = [
+        "watch",
+        "--path",
+        str(source_dir),
+        "--once",
+        "--settle",
+        "0",
+        "--state",
+        str(state_file),
+    ]
+
+    first = runner.invoke(app, args)
+    second = runner.invoke(app, args)
+    (source_dir / "doc.pdf").write_text("pdf, reprinted")
+    third = runner.invoke(app, args)
+
+    assert first.exit_code == second.exit_code == third.exit_code == 0
+    assert recorded == [str(source_dir / "doc.pdf")] * 2
+
+
+def test_process_directory_defers_unsettled_files(tmp_path, monkeypatch):
+    (tmp_path / "fresh.pdf").write_text("pdf")
+    monkeypatch.setattr(
+        "pdfsuite.commands.watch.run_optimize_pipeline",
+        lambda *args, **kwargs: None,
+    )
+    deferred: set[str] = set()
+
+    done = process_directory(tmp_path, set(), "report", None, 60, deferred=deferred)
+
+    assert done == set()
+    assert deferred == {str((tmp_path / "fresh.pdf").resolve())}
+
+
+def test_inotify_watcher_reports_closed_files(tmp_path):
+    if not InotifyWatcher.available():
+        pytest.skip("inotify is Linux-only")
+    with InotifyWatcher(tmp_path) as watcher:
+        (tmp_path / "scan.pdf").write_text("pdf")
+        assert watcher.wait(2) == ["scan.pdf"]
+        assert watcher.drain() == []
+
+
+def test_watch_pool_retries_and_skips_in_flight(tmp_path, monkeypatch):
+    pdf = tmp_path / "scan.pdf"
+    pdf.write_text("pdf")
+    calls: list[str] = []
+    release = threading.Event()
+
+    def flaky_optimize(src, dest, preset, target_size_mb=None):
+        calls.append(str(src))
+        release.wait(2)
+        if len(calls) == 1:
+            raise typer.Exit(1)
+
+    monkeypatch.setattr("pdfsuite.commands.watch.run_optimize_pipeline", flaky_optimize)
+    pool = WatchPool(2, "report", None, retries=1, retry_delay=0)
+    key = str(pdf.resolve())
+    info = os.stat(pdf)
+    try:
+        assert pool.submit(pdf, key, info) is True
+        assert pool.submit(pdf, key, info) is False  # already queued or running
+        release.set()
+        pool.join()
+    finally:
+        pool.shutdown()
+
+    assert calls == [str(pdf), str(pdf)]
+    assert not pool.is_in_flight(key)
+
+
+def test_watch_pool_survives_unexpected_errors(tmp_path, monkeypatch):
+    files = [tmp_path / f"scan{idx}.pdf" for idx in range(3)]
+    for pdf in files:
+        pdf.write_text("pdf")
+    calls: list[str] = []
+
+    def broken_optimize(src, dest, preset, target_size_mb=None):
+        calls.append(src.name)
+        if src.name == "scan0.pdf":
+            raise ValueError("truncated xref")
+
+    monkeypatch.setattr("pdfsuite.commands.watch.run_optimize_pipeline", broken_optimize)
+    monkeypatch.setattr("pdfsuite.commands.watch.build_watch_output", lambda src: src)
+    pool = WatchPool(1, "report", None, retries=0, retry_delay=0)
+    try:
+        for pdf in files:
+            pool.submit(pdf, str(pdf), os.stat(pdf))
+        pool.join()
+    finally:
+        pool.shutdown()
+
+    assert calls == ["scan0.pdf", "scan1.pdf", "scan2.pdf"]
+
+
+def test_watch_pool_shutdown_drops_queued_jobs(tmp_path, monkeypatch):
+    files = [tmp_path / f"scan{idx}.pdf" for idx in range(4)]
+    for pdf in files:
+        pdf.write_text("pdf")
+    started = threading.Event()
+    release = threading.Event()
+    calls: list[str] = []
+
+    def slow_optimize(src, dest, preset, target_size_mb=None):
+        calls.append(src.name)
+        started.set()
+        release.wait(2)
+
+    monkeypatch.setattr("pdfsuite.commands.watch.run_optimize_pipeline", slow_optimize)
+    monkeypatch.setattr("pdfsuite.commands.watch.build_watch_output", lambda src: src)
+    pool = WatchPool(1, "report", None, retries=0, retry_delay=0)
+    for pdf in files:
+        pool.submit(pdf, str(pdf), os.stat(pdf))
+    started.wait(2)
+    stopper = threading.Thread(target=pool.shutdown)
+    stopper.start()  # drains the queue while scan0 is still running
+    deadline = time.monotonic() + 2
+    while any(pool.is_in_flight(str(pdf)) for pdf in files[1:]) and time.monotonic() < deadline:
+        time.sleep(0.01)
+    release.set()
+    stopper.join(2)
+
+    assert calls == ["scan0.pdf"]
+    assert not any(pool.is_in_flight(str(pdf)) for pdf in files)
+
+
+def test_process_directory_reprocesses_files_rewritten_in_place(tmp_path, monkeypatch):
+    pdf = tmp_path / "scan.pdf"
+    pdf.write_text("pdf")
+    os.utime(pdf, (1_000_000, 1_000_000))
+    recorded: list[str] = []
+    monkeypatch.setattr(
+        "pdfsuite.commands.watch.run_optimize_pipeline",
+        lambda src, dest, preset, target_size_mb=None: recorded.append(src.name),
+    )
+
+    processed = process_directory(tmp_path, set(), "report", None, 0)
+    processed |= process_directory(tmp_path, processed, "report", None, 0)
+    pdf.write_text("pdf, rescanned")
+    os.utime(pdf, (2_000_000, 2_000_000))
+    process_directory(tmp_path, processed, "report", None, 0)
+
+    assert recorded == ["scan.pdf", "scan.pdf"]
+
+
+class _FakeWatcher:
+    fail = False
+    timeouts: list = []
+
+    def __init__(self, directory):
+        if _FakeWatcher.fail:
+            raise OSError(28, "inotify_add_watch failed")
+
+    @staticmethod
+    def available():
+        return True
+
+    def wait(self, timeout=None):
+        _FakeWatcher.timeouts.append(timeout)
+        raise KeyboardInterrupt
+
+    def close(self):
+        pass
+
+
+@pytest.mark.parametrize("fail", [False, True])
+def test_watch_wakes_on_poll_interval_and_survives_inotify_errors(tmp_path, monkeypatch, fail):
+    monkeypatch.setattr("pdfsuite.commands.watch.InotifyWatcher", _FakeWatcher)
+    monkeypatch.setattr(_FakeWatcher, "fail", fail)
+    monkeypatch.setattr(_FakeWatcher, "timeouts", [])
+    sleeps: list[float] = []
+
+    def fake_sleep(seconds):
+        sleeps.append(seconds)
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr("pdfsuite.commands.watch.time.sleep", fake_sleep)
+    state_file = tmp_path / "state.sqlite3"
+
+    result = runner.invoke(
+        app, ["watch", "--path", str(tmp_path), "--poll-interval", "7", "--state", str(state_file)]
+    )
+
+    assert result.exit_code == 0, result.stdout
+    assert "Stopping watch." in result.stdout
+    if fail:
+        assert "polling instead" in result.stdout
+        assert sleeps == [7.0] and _FakeWatcher.timeouts == []
+    else:
+        assert _FakeWatcher.timeouts == [7.0] and sleeps == []
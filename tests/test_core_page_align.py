@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from pdfsuite.core.page_align import (
+    PageSignature,
+    align_pages,
+    average_hash,
+    text_signature,
+)
+
+
+def _doc(*texts: str) -> list[PageSignature]:
+    return [PageSignature(text_signature(text)) for text in texts]
+
+
+def test_inserted_and_deleted_pages_are_reported():
+    first = _doc("cover", "intro", "terms", "annex", "signatures")
+    second = _doc("cover", "intro", "new clause", "terms", "signatures")
+
+    assert align_pages(first, second) == [
+        (1, 1),
+        (2, 2),
+        (None, 3),
+        (3, 4),
+        (4, None),
+        (5, 5),
+    ]
+
+
+def test_edited_page_pairs_in_order_when_pages_are_appended():
+    first = _doc("cover", "price 10")
+    second = _doc("cover", "price 12", "annex")
+
+    assert align_pages(first, second) == [(1, 1), (2, 2), (None, 3)]
+
+
+def test_edited_pages_stay_paired_and_visual_hash_matches_scans():
+    scan = average_hash([10] * 32 + [200] * 32)
+    rescan = scan ^ 0b111  # a few bits of scanner noise
+    first = [PageSignature("", scan), *_doc("one", "two")]
+    second = [PageSignature("", rescan), *_doc("one (edited)", "two")]
+
+    assert align_pages(first, second) == [(1, 1), (2, 2), (3, 3)]
+
+
+def test_large_documents_align_with_a_single_insert():
+    first = _doc(*(f"page {n}" for n in range(1, 1001)))
+    second = first[:500] + _doc("inserted") + first[500:]
+
+    pairs = align_pages(first, second)
+
+    assert len(pairs) == 1001
+    assert pairs[500] == (None, 501)
+    assert pairs[-1] == (1000, 1001)
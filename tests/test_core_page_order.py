@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import pytest
+
+from pdfsuite.core.page_order import PageOrder
+
+
+def test_range_is_a_single_run_and_behaves_like_a_list():
+    order = PageOrder.range(50_000)
+    assert order.runs() == [(1, 50_000)]
+    assert len(order) == 50_000
+    assert order[0] == 1 and order[-1] == 50_000
+    assert order[10:13] == [11, 12, 13]
+    assert order.index(42_000) == 41_999
+    assert 50_001 not in order
+    assert PageOrder.range(3) == [1, 2, 3]
+
+
+def test_pages_coalesce_into_ascending_and_descending_runs():
+    order = PageOrder([1, 2, 3, 9, 8, 7, 5])
+    assert order.runs() == [(1, 3), (9, 7), (5, 5)]
+    assert list(order) == [1, 2, 3, 9, 8, 7, 5]
+    assert order == PageOrder.from_runs([(1, 2), (3, 3), (9, 8), (7, 7), (5, 5)])
+    assert order.index(8) == 4
+    with pytest.raises(ValueError):
+        order.index(4)
+    with pytest.raises(IndexError):
+        order[7]
+
+
+def test_take_and_insert_move_a_selection_without_expanding_runs():
+    order = PageOrder.range(100_000)
+    selected, remaining = order.take([10, 11, 50_000])
+    assert list(selected) == [11, 12, 50_001]
+    assert len(remaining) == 99_997
+    moved = remaining.inserted(0, selected)
+    assert moved[:4] == [11, 12, 50_001, 1]
+    assert moved.runs() == [(11, 12), (50_001, 50_001), (1, 10), (13, 50_000), (50_002, 100_000)]
+    assert remaining.inserted(10, selected).runs()[:1] == [(1, 12)]
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import pytest
+
+np = pytest.importorskip("numpy")
+Image = pytest.importorskip("PIL.Image")
+
+from pdfsuite.core import pixel_diff  # noqa: E402
+
+
+def _page(height: int = 64, width: int = 48):
+    return np.full((height, width, 3), 255, dtype=np.uint8)
+
+
+def test_identical_rasters_score_zero():
+    result, mask = pixel_diff.diff_arrays(_page(), _page(), page=3)
+    assert (result.page, result.score, result.changed_pixels, result.boxes) == (3, 0.0, 0, [])
+    assert not mask.any()
+
+
+def test_changed_regions_get_separate_tight_boxes():
+    first, second = _page(), _page()
+    second[2:5, 3:7] = 0
+    second[50:60, 40:44] = 0
+    second[30, 20] = 250  # below threshold: anti-aliasing noise
+
+    result, _ = pixel_diff.diff_arrays(first, second)
+
+    assert result.changed_pixels == 3 * 4 + 10 * 4
+    assert result.score == pytest.approx(52 / (64 * 48))
+    assert sorted(result.boxes) == [(3, 2, 7, 5), (40, 50, 44, 60)]
+
+
+def test_diff_images_pads_mismatched_sizes_and_writes_highlight(tmp_path):
+    first, second = tmp_path / "a.png", tmp_path / "b.png"
+    Image.fromarray(_page(64, 48)).save(first)
+    Image.fromarray(_page(70, 48)).save(second)
+    output = tmp_path / "diff.png"
+
+    result = pixel_diff.diff_images(first, second, output, page=1)
+
+    assert result.changed_pixels == 0
+    with Image.open(output) as image:
+        assert image.size == (48, 70)
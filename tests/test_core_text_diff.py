@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from pdfsuite.core.text_diff import diff_texts, diff_words, render_html
+
+
+def test_diff_words_splits_replacements_into_delete_and_insert() -> None:
+    chunks = diff_words("the quick brown fox".split(), "the slow brown fox jumps".split())
+
+    assert chunks == [
+        ("equal", ["the"]),
+        ("delete", ["quick"]),
+        ("insert", ["slow"]),
+        ("equal", ["brown", "fox"]),
+        ("insert", ["jumps"]),
+    ]
+
+
+def test_diff_texts_aligns_pages_and_ignores_rewrapping() -> None:
+    first = ["Intro page", "Terms apply\nto all users", "Fees are 5 EUR", "Appendix"]
+    second = ["Intro page", "New notice", "Terms apply to all users", "Fees are 7 EUR", "Appendix"]
+
+    report = diff_texts(first, second)
+
+    assert report.unchanged == [1, 2, 4]
+    assert report.inserted == [2]
+    assert report.deleted == []
+    (changed,) = report.changed
+    assert (changed.page, changed.second_page, changed.anchor) == (3, 4, "page-3")
+    assert (changed.added, changed.removed) == (1, 1)
+    assert changed.to_dict()["changes"] == [
+        {"op": "delete", "text": "5"},
+        {"op": "insert", "text": "7"},
+    ]
+
+
+def test_render_html_links_page_anchors_and_escapes_text() -> None:
+    report = diff_texts(["a <b> c"], ["a <b> d"])
+
+    page = render_html(report, "v1.pdf", "v2.pdf")
+
+    assert '<a href="#page-1">Page 1</a>' in page
+    assert '<section id="page-1">' in page
+    assert "a &lt;b&gt; <del>c</del> <ins>d</ins>" in page
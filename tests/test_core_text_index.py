@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from pdfsuite.core import text_index
+from pdfsuite.core.text_index import SearchHit, TextIndex
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def test_split_pages_drops_trailing_form_feed() -> None:
+    assert text_index.split_pages("one\fTwo\n\f\f") == ["one", "Two\n", ""]
+
+
+def test_search_counts_matches_across_line_wraps() -> None:
+    raw_pages = ("Alpha beta", "", "alpha\nBETA alpha beta")
+    index = TextIndex(
+        source_hash="abc",
+        pages=[text_index.normalize_text(text) for text in raw_pages],
+    )
+
+    assert index.search("ALPHA  beta") == [SearchHit(page=1, count=1), SearchHit(page=3, count=2)]
+    assert index.ranked("alpha beta")[0] == SearchHit(page=3, count=2)
+    assert index.search("   ") == []
+
+
+def test_load_or_build_extracts_once_per_file_content(tmp_path, monkeypatch) -> None:
+    source = tmp_path / "doc.pdf"
+    source.write_bytes(b"%PDF-1.4 same bytes")
+    calls: list[Path] = []
+
+    def fake_extract(pdf: Path) -> list[str]:
+        calls.append(pdf)
+        return ["First page", "Second PAGE"]
+
+    monkeypatch.setattr(text_index, "extract_page_texts", fake_extract)
+
+    built = text_index.load_or_build(source, root=tmp_path / "index")
+    copy = tmp_path / "copy.pdf"
+    copy.write_bytes(source.read_bytes())
+    reloaded = text_index.load_or_build(copy, root=tmp_path / "index")
+
+    assert calls == [source]
+    assert reloaded.pages == built.pages == ["first page", "second page"]
+    assert [hit.page for hit in reloaded.search("page")] == [1, 2]
+
+
+def test_save_index_prunes_least_recently_used_indexes(tmp_path, monkeypatch) -> None:
+    root = tmp_path / "index"
+    first = text_index.save_index(TextIndex(source_hash="aa" * 32, pages=["one"]), root)
+    os.utime(first, (1000, 1000))
+    cap = first.stat().st_size * 3 // 2  # room for one index, not two
+    monkeypatch.setitem(text_index.AUXILIARY_CACHES, "text", ("text", "*/*.json.gz", cap))
+
+    second = text_index.save_index(TextIndex(source_hash="bb" * 32, pages=["two"]), root)
+
+    assert not first.exists()
+    assert second.exists()
+
+
+def test_extract_page_texts_uses_pypdf_without_poppler(monkeypatch) -> None:
+    pytest.importorskip("pypdf")
+    monkeypatch.setattr(text_index.shutil, "which", lambda _name: None)
+
+    pages = text_index.extract_page_texts(FIXTURES / "sample_multi.pdf")
+
+    assert [page.strip() for page in pages] == ["Sample A", "Sample B"]
+
+
+def test_iter_page_texts_streams_pdftotext_chunks(monkeypatch) -> None:
+    monkeypatch.setattr(text_index.shutil, "which", lambda name: f"/usr/bin/{name}")
+    calls: list[list[str]] = []
+
+    class Result:
+        returncode = 0
+        stderr = ""
+
+        def __init__(self, stdout: str) -> None:
+            self.stdout = stdout
+
+    def fake_run(cmd, **_kwargs):
+        calls.append(cmd)
+        first, last = int(cmd[cmd.index("-f") + 1]), int(cmd[cmd.index("-l") + 1])
+        return Result("".join(f"Page  {page}\f" for page in range(first, last + 1)))
+
+    monkeypatch.setattr(text_index.subprocess, "run", fake_run)
+
+    pages = text_index.iter_page_texts(Path("doc.pdf"), page_count=5, chunk_pages=2)
+
+    assert next(pages) == (1, "page 1")
+    assert len(calls) == 1
+    assert list(pages) == [(2, "page 2"), (3, "page 3"), (4, "page 4"), (5, "page 5")]
+    assert len(calls) == 3
+    hits = text_index.iter_hits([(1, "page 1"), (2, "x"), (3, "page 3 page")], "page")
+    assert [(hit.page, hit.count) for hit in hits] == [(1, 1), (3, 2)]
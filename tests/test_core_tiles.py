@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from pdfsuite.core.tiles import visible_tiles
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def test_tiles_sit_on_a_fixed_grid_and_clip_to_the_page():
+    tiles = visible_tiles(1200, 700, (300, 100, 500, 500), tile=512)
+
+    assert sorted(tiles) == [
+        (0, 0, 512, 512),
+        (0, 512, 512, 188),
+        (512, 0, 512, 512),
+        (512, 512, 512, 188),
+    ]
+    assert visible_tiles(1200, 700, (1100, 0, 400, 100), tile=512) == [(1024, 0, 176, 512)]
+
+
+def test_tiles_outside_the_page_are_skipped():
+    assert visible_tiles(1000, 1000, (1200, 0, 300, 300)) == []
+    assert visible_tiles(1000, 1000, (-400, -400, 300, 300)) == []
+    assert visible_tiles(0, 0, (0, 0, 300, 300)) == []
+
+
+def test_tiles_fill_in_from_the_centre_of_the_view():
+    tiles = visible_tiles(3000, 3000, (0, 0, 1500, 1500), tile=500)
+
+    assert len(tiles) == 9
+    assert tiles[0] == (500, 500, 500, 500)
+    corners = {(0, 0), (1000, 0), (0, 1000), (1000, 1000)}
+    assert {(x, y) for x, y, _, _ in tiles[-4:]} == corners
+
+
+def test_render_tiles_rasterizes_only_the_visible_region():
+    pytest.importorskip("PySide6.QtPdf")
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PySide6.QtCore import QRect, QSize
+    from PySide6.QtPdf import QPdfDocument
+    from PySide6.QtWidgets import QApplication
+
+    from gui.services.pdf_preview import PdfPreviewProvider
+
+    app = QApplication.instance() or QApplication([])
+    document = QPdfDocument(app)
+    preview = PdfPreviewProvider()
+    assert preview.load(document, FIXTURES / "sample_multi.pdf")
+
+    size = QSize(2000, 2600)
+    tiles = preview.render_tiles(document, 0, size, QRect(600, 600, 400, 400))
+
+    assert [rect for rect, _ in tiles] == [QRect(512, 512, 512, 512)]
+    assert all(image.size() == rect.size() for rect, image in tiles)
+
+
+def test_tile_renderer_delivers_tiles_from_its_thread():
+    pytest.importorskip("PySide6.QtPdf")
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PySide6.QtCore import QEventLoop, QTimer
+    from PySide6.QtWidgets import QApplication
+
+    from gui.services.pdf_preview import PdfPreviewProvider
+    from gui.services.tile_renderer import TileRenderer
+
+    app = QApplication.instance() or QApplication([])
+    renderer = TileRenderer(PdfPreviewProvider())
+    delivered = []
+    loop = QEventLoop()
+    renderer.tile_ready.connect(lambda key, image: (delivered.append((key, image)), loop.quit()))
+    QTimer.singleShot(5000, loop.quit)
+
+    renderer.set_source(FIXTURES / "sample_multi.pdf")
+    renderer.request((0, 2000, 2600, (512, 512, 512, 256)), 0)
+    loop.exec()
+    renderer.shutdown()
+
+    assert app is not None
+    assert [key for key, _ in delivered] == [(0, 2000, 2600, (512, 512, 512, 256))]
+    assert delivered[0][1].width() == 512 and delivered[0][1].height() == 256
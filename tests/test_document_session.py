@@ -1,9 +1,9 @@
 from __future__ import annotations
 
+import sys
 from pathlib import Path
 
 import pytest
-import sys
 
 from pdfsuite.core.document_session import DocumentSession
 
@@ -29,7 +29,7 @@ def test_reorder_updates_order_and_builds_cli(tmp_path, monkeypatch):
     assert command[-2:] == ["-o", str(tmp_path / "out.pdf")]
     assert "--order" in command
     order_index = command.index("--order") + 1
-    assert command[order_index] == "2,3,1,4"
+    assert command[order_index] == "2-3,1,4"
 
 
 def test_undo_redo_tracks_history():
@@ -48,3 +48,74 @@ def test_set_order_replaces_sequence():
     assert session.page_order == [4, 3, 2, 1]
     with pytest.raises(ValueError):
         session.set_order([1, 2, 3])  # missing page
+
+
+def test_delete_and_undo_on_large_document_keep_orders_compact():
+    session = DocumentSession(path=Path("archive.pdf"), page_order=range(1, 50_001))
+    session.delete([0, 25_000])
+    assert len(session.page_order) == 49_998
+    assert session.page_order.runs() == [(2, 25_000), (25_002, 50_000)]
+    session.undo()
+    assert session.page_order.runs() == [(1, 50_000)]
+
+
+def test_operation_log_undoes_delete_and_rotate_and_respects_budget():
+    session = DocumentSession(path=Path("sample.pdf"), page_order=[1, 2, 3, 4, 5])
+    session.rotate([0, 4], 90)
+    session.delete([1, 3])
+    session.reorder([2], 0)
+    assert session.page_order == [5, 1, 3]
+    assert session.rotations == {1: 90, 5: 90}
+    session.undo()
+    session.undo()
+    assert session.page_order == [1, 2, 3, 4, 5]
+    session.undo()
+    assert session.rotations == {}
+    assert not session.can_undo
+    session.redo()
+    session.redo()
+    assert session.page_order == [1, 3, 5]
+    assert session.rotations == {1: 90, 5: 90}
+
+    small = DocumentSession(path=Path("sample.pdf"), page_order=range(1, 101), max_history_bytes=1)
+    small.delete([0])
+    small.delete([0])
+    assert len(small._undo) == 1
+    small.undo()
+    assert not small.can_undo
+    assert small.page_order[0] == 2
+
+
+def test_commit_compresses_runs_and_spills_huge_specs_to_a_file(tmp_path, monkeypatch):
+    session = DocumentSession(path=Path("big.pdf"), page_order=range(1, 20_001))
+    session.reorder([19_999], 0)
+    session.reorder(list(range(100, 5_000)), 10_000)
+    command = session._build_cli_command(tmp_path / "out.pdf")
+    assert command[command.index("--order") + 1] == "20000,1-99,5000-14899,100-4999,14900-19999"
+
+    monkeypatch.setattr("pdfsuite.core.document_session.INLINE_SPEC_LIMIT", 10)
+    runner = FakeRunner()
+    session.commit(runner, output_path=tmp_path / "out.pdf")
+    command = runner.commands[0]
+    assert "--order" not in command
+    order_file = Path(command[command.index("--order-file") + 1])
+    assert order_file.read_text().split() == [
+        "20000",
+        "1-99",
+        "5000-14899",
+        "100-4999",
+        "14900-19999",
+    ]
+    order_file.unlink()
+
+
+def test_commit_rotates_output_positions_in_the_same_reorder_pass(tmp_path):
+    session = DocumentSession(path=Path("sample.pdf"), page_order=[1, 2, 3, 4, 5])
+    session.rotate([1, 2, 4], 90)
+    session.rotate([4], 90)
+    session.delete([1])
+    session.reorder([3], 0)  # page 5 to the front
+    command = session._build_cli_command(tmp_path / "out.pdf")
+    assert command[command.index("--order") + 1] == "5,1,3-4"
+    rotate_values = [command[i + 1] for i, arg in enumerate(command) if arg == "--rotate"]
+    assert rotate_values == ["90:3", "180:1"]
@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from pdfsuite.__main__ import app
+from pdfsuite.utils import backend
+from pdfsuite.utils.common import get_page_count
+
+runner = CliRunner()
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+@pytest.fixture(params=["pikepdf", "pypdf"])
+def native(request, monkeypatch):
+    pytest.importorskip(request.param)
+    monkeypatch.setenv("PDFSUITE_BACKEND", request.param)
+    selected = backend.native_backend()
+    assert selected is not None and selected.name == request.param
+    return selected
+
+
+def test_cli_choice_disables_native_backend(monkeypatch) -> None:
+    monkeypatch.setenv("PDFSUITE_BACKEND", "cli")
+
+    assert backend.native_backend() is None
+
+
+@pytest.mark.parametrize("error", [ValueError, KeyError, AssertionError])
+def test_pypdf_library_errors_become_backend_errors(monkeypatch, error) -> None:
+    pytest.importorskip("pypdf")
+    pypdf_backend = backend.PypdfBackend()
+
+    def broken(doc):
+        raise error("malformed")
+
+    monkeypatch.setattr(pypdf_backend, "_count", broken)
+
+    with pytest.raises(backend.BackendError):
+        pypdf_backend.page_count(FIXTURES / "sample_multi.pdf")
+
+
+def test_native_page_count_needs_no_qpdf(native, monkeypatch) -> None:
+    monkeypatch.setattr("pdfsuite.utils.common.subprocess.run", pytest.fail)
+
+    assert get_page_count(FIXTURES / "sample_multi.pdf") == 2
+    assert get_page_count(FIXTURES / "missing.pdf") == 0
+
+
+def test_native_merge_reorder_and_split(native, tmp_path) -> None:
+    merged = tmp_path / "merged.pdf"
+    reordered = tmp_path / "reordered.pdf"
+    split_dir = tmp_path / "splits"
+
+    inputs = [str(FIXTURES / "sample_multi.pdf"), str(FIXTURES / "sampleA.pdf")]
+
+    merge = runner.invoke(app, ["merge", *inputs, "-o", str(merged)])
+    reorder = runner.invoke(
+        app, ["reorder", str(merged), "--order", "z,1-2,1", "-o", str(reordered)]
+    )
+    split = runner.invoke(app, ["split", str(merged), "--pages", "1,2-", "-o", str(split_dir)])
+
+    assert (merge.exit_code, reorder.exit_code, split.exit_code) == (0, 0, 0)
+    total = native.page_count(FIXTURES / "sampleA.pdf") + 2
+    assert native.page_count(merged) == total
+    assert native.page_count(reordered) == 4
+    assert native.page_count(split_dir / "merged_1.pdf") == 1
+    assert native.page_count(split_dir / "merged_2-z.pdf") == total - 1
+
+
+def test_native_reorder_reports_out_of_range_pages(native, tmp_path) -> None:
+    source = FIXTURES / "sample_multi.pdf"
+
+    result = runner.invoke(
+        app, ["reorder", str(source), "--order", "1,9", "-o", str(tmp_path / "out.pdf")]
+    )
+
+    assert result.exit_code == 1
+    assert "outside 1-2" in result.stdout
+
+
+def test_native_reorder_rotates_output_pages(native, tmp_path) -> None:
+    import pypdf
+
+    output = tmp_path / "rotated.pdf"
+    result = runner.invoke(
+        app,
+        [
+            "reorder",
+            str(FIXTURES / "sample_multi.pdf"),
+            "--order",
+            "2,1,2",
+            "--rotate",
+            "90:1,3",
+            "--rotate",
+            "-90:3",
+            "-o",
+            str(output),
+        ],
+    )
+
+    assert result.exit_code == 0
+    assert [page.rotation for page in pypdf.PdfReader(output).pages] == [90, 0, 0]
+
+
+def test_native_split_names_chunks_like_qpdf(native, tmp_path) -> None:
+    merged = tmp_path / "doc.pdf"
+    native.assemble([(FIXTURES / "sample_multi.pdf", ["1-z", "1-z", "1"])], merged)
+
+    result = runner.invoke(app, ["split", str(merged), "--chunk-size", "2", "-o", str(tmp_path)])
+
+    assert result.exit_code == 0
+    assert [native.page_count(tmp_path / name) for name in ("doc_1-2.pdf", "doc_3-4.pdf")] == [2, 2]
+    assert native.page_count(tmp_path / "doc_5.pdf") == 1
+
+
+def test_page_fingerprints_follow_page_content(native, tmp_path) -> None:
+    source = FIXTURES / "sample_multi.pdf"
+    reordered = tmp_path / "reordered.pdf"
+    native.assemble([(source, ["2", "1"])], reordered)
+
+    original = native.page_fingerprints(source)
+
+    assert len(set(original)) == 2
+    assert native.page_fingerprints(reordered) == original[::-1]
+
+
+def _annotated_pdf(path: Path, appearance: bytes, font: str) -> Path:
+    """One page whose resources live on the page tree and that carries a square annotation."""
+    pikepdf = pytest.importorskip("pikepdf")
+    pdf = pikepdf.new()
+    pdf.add_blank_page()
+    page = pdf.pages[0]
+    del page.obj["/Resources"]
+    pdf.Root.Pages.Resources = pikepdf.Dictionary(
+        Font=pikepdf.Dictionary(
+            F1=pikepdf.Dictionary(Type=pikepdf.Name.Font, Subtype=pikepdf.Name.Type1, BaseFont=font)
+        )
+    )
+    stream = pikepdf.Stream(pdf, appearance)
+    stream.BBox = [0, 0, 50, 50]
+    annot = pikepdf.Dictionary(
+        Type=pikepdf.Name.Annot,
+        Subtype=pikepdf.Name.Square,
+        Rect=[10, 10, 60, 60],
+        P=page.obj,
+        AP=pikepdf.Dictionary(N=stream),
+    )
+    page.obj.Annots = pdf.make_indirect(pikepdf.Array([pdf.make_indirect(annot)]))
+    pdf.save(path)
+    return path
+
+
+def test_page_fingerprints_cover_annotations_and_inherited_resources(native, tmp_path) -> None:
+    base = _annotated_pdf(tmp_path / "base.pdf", b"0 0 1 rg 0 0 50 50 re f", "/Helvetica")
+    same = _annotated_pdf(tmp_path / "same.pdf", b"0 0 1 rg 0 0 50 50 re f", "/Helvetica")
+    recoloured = _annotated_pdf(tmp_path / "annot.pdf", b"1 0 0 rg 0 0 50 50 re f", "/Helvetica")
+    refont = _annotated_pdf(tmp_path / "font.pdf", b"0 0 1 rg 0 0 50 50 re f", "/Courier")
+
+    expected = native.page_fingerprints(base)
+
+    assert native.page_fingerprints(same) == expected
+    assert native.page_fingerprints(recoloured) != expected
+    assert native.page_fingerprints(refont) != expected
+
+
+def test_page_fingerprints_tell_shared_resources_apart(native, tmp_path) -> None:
+    pikepdf = pytest.importorskip("pikepdf")
+    pdf = pikepdf.new()
+    red, blue = (
+        pdf.make_indirect(
+            pikepdf.Stream(
+                pdf,
+                colour,
+                Type=pikepdf.Name.XObject,
+                Subtype=pikepdf.Name.Image,
+                Width=1,
+                Height=1,
+                ColorSpace=pikepdf.Name.DeviceRGB,
+                BitsPerComponent=8,
+            )
+        )
+        for colour in (b"\xff\x00\x00", b"\x00\x00\xff")
+    )
+    for last in (red, blue):
+        pdf.add_blank_page()
+        page = pdf.pages[-1]
+        page.obj.Resources = pikepdf.Dictionary(
+            XObject=pikepdf.Dictionary(Im1=red, Im2=blue, Im3=last)
+        )
+        page.obj.Contents = pdf.make_stream(b"q 100 0 0 100 0 0 cm /Im3 Do Q")
+    source = tmp_path / "shared.pdf"
+    pdf.save(source)
+
+    first, second = native.page_fingerprints(source)
+
+    assert first != second
+
+
+def test_fingerprinter_hashes_single_pages_like_page_fingerprints(native) -> None:
+    source = FIXTURES / "sample_multi.pdf"
+
+    with native.fingerprinter(source) as fingerprint:
+        second = fingerprint(1)
+        first = fingerprint(0)
+
+    assert [first, second] == native.page_fingerprints(source)
+
+
+def test_page_fingerprints_fall_back_to_file_hash() -> None:
+    source = FIXTURES / "sample_multi.pdf"
+
+    fingerprints = backend.page_fingerprints(source, page_count=2)
+
+    digest = backend.file_sha256(source)
+    assert fingerprints == [f"{digest}:1", f"{digest}:2"]
+    assert backend.page_fingerprints(source) == []
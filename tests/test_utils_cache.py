@@ -0,0 +1,181 @@
+import os
+import threading
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from pdfsuite.__main__ import app
+from pdfsuite.utils.cache import ResultCache
+
+runner = CliRunner()
+
+
+def test_cache_key_tracks_content_and_params(tmp_path) -> None:
+    cache = ResultCache(root=tmp_path / "cache")
+    first = tmp_path / "a.pdf"
+    second = tmp_path / "b.pdf"
+    first.write_bytes(b"same")
+    second.write_bytes(b"same")
+
+    assert cache.key(first, preset="email") == cache.key(second, preset="email")
+    assert cache.key(first, preset="email") != cache.key(first, preset="report")
+    second.write_bytes(b"different")
+    assert cache.key(first, preset="email") != cache.key(second, preset="email")
+
+
+def test_cache_lookup_counts_hits_and_misses(tmp_path) -> None:
+    cache = ResultCache(root=tmp_path / "cache")
+    produced = tmp_path / "out.pdf"
+    produced.write_bytes(b"optimized")
+
+    assert cache.lookup("ab" * 32) is None
+    entry = cache.store("ab" * 32, produced)
+    assert cache.lookup("ab" * 32) == entry
+    assert entry.read_bytes() == b"optimized"
+    assert cache.counters() == {"hits": 1, "misses": 1}
+
+
+def test_cache_counters_survive_concurrent_writers_and_corrupt_stats(tmp_path) -> None:
+    cache = ResultCache(root=tmp_path / "cache")
+    cache.root.mkdir()
+    cache.stats_path.write_text('{"hits": 4')  # torn write from an older version
+
+    assert cache.counters() == {}
+
+    def lookups() -> None:
+        for _ in range(50):
+            cache.lookup("ab" * 32)
+
+    workers = [threading.Thread(target=lookups) for _ in range(4)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    assert cache.counters() == {"hits": 0, "misses": 200}
+    assert not list(cache.root.glob("*.tmp"))
+
+
+def test_cache_prune_evicts_least_recently_used(tmp_path) -> None:
+    cache = ResultCache(root=tmp_path / "cache", max_bytes=100_000)
+    produced = tmp_path / "out.pdf"
+    produced.write_bytes(b"x" * 4000)
+    keys = ["aa" * 32, "bb" * 32, "cc" * 32]
+    for age, key in enumerate(keys):
+        entry = cache.store(key, produced)
+        os.utime(entry, (1000 + age, 1000 + age))
+    os.utime(cache.path_for(keys[0]), (5000, 5000))  # recently used
+
+    removed, freed = cache.prune(8000)
+
+    assert (removed, freed) == (1, 4000)
+    assert not cache.path_for(keys[1]).exists()
+    assert cache.path_for(keys[0]).exists()
+    assert cache.path_for(keys[2]).exists()
+
+
+def test_optimize_returns_cached_output(tmp_path, monkeypatch, command_recorder) -> None:
+    recorded = command_recorder("pdfsuite.commands.optimize")
+    monkeypatch.setenv("PDFSUITE_CACHE_DIR", str(tmp_path / "cache"))
+    source = tmp_path / "input.pdf"
+    source.write_text("pdf")
+    output = tmp_path / "out.pdf"
+
+    def fake_linearize(intermediate, destination) -> None:
+        destination.write_bytes(b"linearized")
+
+    monkeypatch.setattr("pdfsuite.commands.optimize.linearize", fake_linearize)
+
+    first = runner.invoke(app, ["optimize", str(source), "-o", str(output)])
+    output.unlink()
+    second = runner.invoke(app, ["optimize", str(source), "-o", str(output)])
+
+    assert first.exit_code == 0
+    assert second.exit_code == 0
+    assert len(recorded) == 1  # Ghostscript ran only for the first invocation
+    assert output.read_bytes() == b"linearized"
+    assert "cache[/dim] hit" in second.stdout
+    assert "hits 1, misses 1" in second.stdout
+
+
+def test_optimize_rebuilds_when_the_cached_entry_is_evicted(
+    tmp_path, monkeypatch, command_recorder
+) -> None:
+    recorded = command_recorder("pdfsuite.commands.optimize")
+    monkeypatch.setenv("PDFSUITE_CACHE_DIR", str(tmp_path / "cache"))
+    source = tmp_path / "input.pdf"
+    source.write_text("pdf")
+    output = tmp_path / "out.pdf"
+    evicted = tmp_path / "cache" / "objects" / "gone.pdf"
+    monkeypatch.setattr(ResultCache, "lookup", lambda self, key: evicted)
+    monkeypatch.setattr(
+        "pdfsuite.commands.optimize.linearize",
+        lambda intermediate, destination: destination.write_bytes(b"linearized"),
+    )
+
+    result = runner.invoke(app, ["optimize", str(source), "-o", str(output)])
+
+    assert result.exit_code == 0
+    assert "was evicted; rebuilding" in result.stdout
+    assert len(recorded) == 1
+    assert output.read_bytes() == b"linearized"
+
+
+def test_cache_store_removes_its_temp_file_when_the_copy_fails(tmp_path, monkeypatch) -> None:
+    cache = ResultCache(root=tmp_path / "cache")
+    produced = tmp_path / "out.pdf"
+    produced.write_bytes(b"optimized")
+
+    def failing_copy(source, destination) -> None:
+        Path(destination).write_bytes(b"partial")
+        raise OSError("disk full")
+
+    monkeypatch.setattr("pdfsuite.utils.cache.shutil.copyfile", failing_copy)
+
+    with pytest.raises(OSError):
+        cache.store("ab" * 32, produced)
+    assert not list(cache.objects.rglob("*.tmp"))
+
+
+def test_cache_commands_report_and_prune(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("PDFSUITE_CACHE_DIR", str(tmp_path / "cache"))
+    produced = tmp_path / "out.pdf"
+    produced.write_bytes(b"x" * 2048)
+    ResultCache().store("ab" * 32, produced)
+
+    stats = runner.invoke(app, ["cache", "stats"])
+    pruned = runner.invoke(app, ["cache", "prune", "--all"])
+
+    assert stats.exit_code == 0
+    assert '"entries": 1' in stats.stdout
+    assert pruned.exit_code == 0
+    assert "Removed 1 entries" in pruned.stdout
+    assert ResultCache().entries() == []
+
+
+def test_thumbnail_and_text_caches_are_reported_and_pruned(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("PDFSUITE_CACHE_DIR", str(tmp_path / "cache"))
+    cache = ResultCache()
+    old = cache.root / "thumbnails" / "old" / "96x128" / "1.png"
+    new = cache.root / "thumbnails" / "new" / "96x128" / "1.png"
+    for age, path in enumerate((old, new)):
+        path.parent.mkdir(parents=True)
+        path.write_bytes(b"p" * 1000)
+        os.utime(path, (1000 + age, 1000 + age))
+    index = cache.root / "text" / "cd" / ("cd" * 32 + ".json.gz")
+    index.parent.mkdir(parents=True)
+    index.write_bytes(b"t" * 500)
+
+    stats = cache.stats()["auxiliary"]
+    assert stats["thumbnails"]["entries"] == 2 and stats["thumbnails"]["bytes"] == 2000
+    assert stats["text"]["entries"] == 1
+
+    assert cache.prune_auxiliary(1500) == {"thumbnails": (1, 1000), "text": (0, 0)}
+    assert not old.parent.parent.exists() and new.exists()
+    assert (cache.root / "thumbnails").is_dir()
+
+    pruned = runner.invoke(app, ["cache", "prune", "--all"])
+    assert "Removed 1 thumbnails entries" in pruned.stdout
+    assert "Removed 1 text entries" in pruned.stdout
+    assert not new.exists() and not index.exists()
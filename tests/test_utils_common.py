@@ -39,3 +39,16 @@ def test_normalize_range_token_handles_suffixes() -> None:
 def test_safe_range_name_sanitizes_and_defaults() -> None:
     assert common.safe_range_name("Page 1/2") == "Page-1-2"
     assert common.safe_range_name("!!!") == "range"
+
+
+def test_expand_range_token_handles_qpdf_syntax() -> None:
+    assert common.expand_range_token("3-5", 10) == [3, 4, 5]
+    assert common.expand_range_token("7-", 9) == [7, 8, 9]
+    assert common.expand_range_token("4-2", 10) == [4, 3, 2]
+    assert common.expand_range_token("r1", 10) == [10]
+    assert common.expand_range_token("1-z:even", 6) == [2, 4, 6]
+
+
+def test_expand_range_token_rejects_pages_outside_document() -> None:
+    with pytest.raises(typer.BadParameter):
+        common.expand_range_token("3-12", 10)
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import pytest
+
+from pdfsuite.utils import pdf_text
+
+
+def test_label_pages_fit_their_text(tmp_path) -> None:
+    pypdf = pytest.importorskip("pypdf")
+    output = tmp_path / "labels.pdf"
+    written: list[int] = []
+
+    pdf_text.write_label_pages(output, ["A", "WWWW"], font_size=10, on_page=written.append)
+
+    pages = pypdf.PdfReader(output).pages
+    assert written == [1, 2]
+    assert [float(page.mediabox.width) for page in pages] == [6.67, 37.76]
+    assert pages[1].extract_text() == "WWWW"
+
+
+def test_label_pages_reject_text_the_font_cannot_show(tmp_path) -> None:
+    with pytest.raises(UnicodeEncodeError):
+        pdf_text.write_label_pages(tmp_path / "labels.pdf", ["案件"], font_size=10)
+
+
+def test_summary_page_lists_one_line_per_entry(tmp_path) -> None:
+    pypdf = pytest.importorskip("pypdf")
+    output = tmp_path / "summary.pdf"
+
+    pdf_text.write_summary_page(output, "Report (draft)", ["first", "résumé.pdf", "案件.pdf"])
+
+    (page,) = pypdf.PdfReader(output).pages
+    assert (float(page.mediabox.width), float(page.mediabox.height)) == pdf_text.SUMMARY_PAGE_SIZE
+    lines = page.extract_text().splitlines()
+    assert lines[0] == "Report (draft)"
+    assert [line for line in lines[1:] if line.strip()] == ["first", "résumé.pdf", "??.pdf"]